@@ -0,0 +1,155 @@
+"""Batched delivery for the Discord ops log channel."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Awaitable, Callable, Dict, List
+
+log = logging.getLogger("c1c.runtime.log_channel")
+
+DISCORD_MESSAGE_LIMIT = 2000
+
+_WINDOW_SEC = max(0.0, float(os.getenv("LOG_CHANNEL_BATCH_MS", "1500")) / 1000.0)
+_MAX_PENDING = max(1, int(os.getenv("LOG_CHANNEL_MAX_PENDING", "200")))
+
+
+def pack_messages(messages: List[str], *, limit: int = DISCORD_MESSAGE_LIMIT) -> List[str]:
+    """Join ``messages`` with newlines into as few chunks of at most ``limit`` chars.
+
+    Messages are never split; one longer than ``limit`` is cut to fit.
+    """
+
+    chunks: List[str] = []
+    current = ""
+    for message in messages:
+        if len(message) > limit:
+            message = f"{message[: limit - 1]}…"
+        if not current:
+            current = message
+        elif len(current) + 1 + len(message) <= limit:
+            current = f"{current}\n{message}"
+        else:
+            chunks.append(current)
+            current = message
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class LogChannelSink:
+    """Buffer log-channel lines for a short window and send them packed.
+
+    ``submit`` never waits on Discord. Once ``max_pending`` lines are waiting,
+    new lines are counted as overflow and dropped; the next batch starts with
+    a note saying how many were lost.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[None]],
+        *,
+        window: float = _WINDOW_SEC,
+        max_pending: int = _MAX_PENDING,
+        limit: int = DISCORD_MESSAGE_LIMIT,
+    ) -> None:
+        self._send = send
+        self._window = window
+        self._max_pending = max_pending
+        self._limit = limit
+        self._pending: List[str] = []
+        self._task: asyncio.Task | None = None
+        self._flush_now = asyncio.Event()
+        self._overflow_unreported = 0
+        self._stats: Dict[str, int] = {
+            "lines": 0,
+            "messages": 0,
+            "overflow": 0,
+            "failures": 0,
+            "dropped": 0,
+        }
+
+    def submit(self, message: str) -> bool:
+        """Queue ``message``; returns ``False`` when it was dropped as overflow."""
+
+        if len(self._pending) >= self._max_pending:
+            self._overflow_unreported += 1
+            self._stats["overflow"] += 1
+            return False
+        self._pending.append(message)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain(), name="log_channel_flush")
+        return True
+
+    async def flush(self, *, timeout: float | None = None) -> bool:
+        """Send everything queued so far, skipping the batching window.
+
+        Returns ``False`` when ``timeout`` expired first; whatever was still
+        queued is then dropped.
+        """
+
+        self._flush_now.set()
+        try:
+            await asyncio.wait_for(self._send_all(), timeout)
+        except asyncio.TimeoutError:
+            dropped = self.discard()
+            log.warning("log channel flush timed out; dropped %d line(s)", dropped)
+            return False
+        finally:
+            self._flush_now.clear()
+        return True
+
+    def discard(self) -> int:
+        """Drop every queued line and stop the drain task; returns the dropped count."""
+
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+        dropped = len(self._pending) + self._overflow_unreported
+        self._pending = []
+        self._overflow_unreported = 0
+        self._stats["dropped"] += dropped
+        return dropped
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "pending": len(self._pending)}
+
+    async def _send_all(self) -> None:
+        task = self._task
+        if task is not None and not task.done():
+            await task
+        await self._send_pending()
+
+    async def _drain(self) -> None:
+        while self._pending:
+            if self._window > 0 and not self._flush_now.is_set():
+                try:
+                    await asyncio.wait_for(self._flush_now.wait(), timeout=self._window)
+                except asyncio.TimeoutError:
+                    pass
+            await self._send_pending()
+
+    async def _send_pending(self) -> None:
+        lines, self._pending = self._pending, []
+        if self._overflow_unreported:
+            lines.insert(
+                0,
+                f"⚠️ {self._overflow_unreported} log message(s) dropped (log channel backlog)",
+            )
+            self._overflow_unreported = 0
+        if not lines:
+            return
+        chunks = pack_messages(lines, limit=self._limit)
+        self._stats["lines"] += len(lines)
+        for chunk in chunks:
+            try:
+                await self._send(chunk)
+            except Exception:
+                self._stats["failures"] += 1
+                log.exception("failed to send log message batch")
+            else:
+                self._stats["messages"] += 1
+
+
+__all__ = ["DISCORD_MESSAGE_LIMIT", "LogChannelSink", "pack_messages"]
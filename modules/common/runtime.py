@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import importlib
 import logging
 import math
 import os
 import random
 import time
+from abc import ABC, abstractmethod
 from datetime import datetime, time as dt_time, timedelta, timezone
 from dataclasses import dataclass
 from types import SimpleNamespace
@@ -45,8 +47,10 @@ from shared.obs.events import (
     refresh_deduper,
 )
 from c1c_coreops.helpers import audit_tiers, rehydrate_tiers
+from shared.sheets import write_behind
 from shared.web_routes import mount_emoji_pad
 from . import keepalive
+from .log_channel import LogChannelSink
 
 import modules.onboarding as onboarding_pkg
 from modules.community import COMMUNITY_EXTENSIONS
@@ -55,7 +59,9 @@ log = logging.getLogger("c1c.runtime")
 
 _ACTIVE_RUNTIME: "Runtime | None" = None
 _PRELOAD_TASK: asyncio.Task[None] | None = None
+_PRELOAD_STATUS: dict[str, Any] = {"state": "pending", "total_ms": None, "bucket_ms": {}}
 _web_app: web.Application | None = None
+_LOG_FLUSH_TIMEOUT_SEC = 5.0
 
 
 async def create_app(*, runtime: "Runtime | None" = None) -> web.Application:
@@ -117,7 +123,9 @@ async def create_app(*, runtime: "Runtime | None" = None) -> web.Application:
     async def ready(_: web.Request) -> web.Response:
         components = healthmod.components_snapshot()
         ok = healthmod.overall_ready()
-        return web.json_response({"ok": ok, "components": components})
+        return web.json_response(
+            {"ok": ok, "components": components, "cache_preload": preload_status()}
+        )
 
     async def _health_payload() -> tuple[dict[str, Any], bool]:
         if runtime is None:
@@ -166,46 +174,92 @@ async def create_app(*, runtime: "Runtime | None" = None) -> web.Application:
     return app
 
 
+def preload_status() -> dict[str, Any]:
+    """Return the startup cache preload state with per-bucket durations.
+
+    Reported on ``/ready`` only; it does not gate readiness or health.
+    """
+
+    return {
+        **_PRELOAD_STATUS,
+        "ready": _PRELOAD_STATUS["state"] == "done",
+        "bucket_ms": dict(_PRELOAD_STATUS["bucket_ms"]),
+    }
+
+
+def _set_preload_status(state: str, **fields: Any) -> None:
+    _PRELOAD_STATUS.update(fields, state=state)
+
+
 async def _startup_preload(bot: commands.Bot | None = None) -> None:
-    await asyncio.sleep(15)
+    try:
+        await _preload_caches(bot)
+    except asyncio.CancelledError:
+        _set_preload_status("cancelled")
+        raise
+    finally:
+        # Early exits and errors must not leave /ready reporting "pending"/"running".
+        if _PRELOAD_STATUS["state"] in {"pending", "running"}:
+            _set_preload_status("failed")
+
 
+async def _preload_caches(bot: commands.Bot | None) -> None:
     runtime = get_active_runtime()
     if bot is None and runtime is not None:
         bot = runtime.bot
 
-    if bot is None:  # pragma: no cover - defensive guard
+    if bot is None:
         log.warning("Cache preloader aborted: bot unavailable")
         return
 
+    await bot.wait_until_ready()
+
     from shared.cache import telemetry as cache_telemetry
+    from shared.sheets import async_adapter
     from c1c_coreops.render import RefreshEmbedRow
 
     bucket_names = cache_telemetry.list_buckets()
     if not bucket_names:
         log.info("Cache preloader skipped: no cache buckets registered")
+        _set_preload_status("done", total_ms=0, bucket_ms={})
         return
 
+    _set_preload_status("running", total_ms=None, bucket_ms={})
+    gate = asyncio.Semaphore(max(1, async_adapter.executor_capacity()))
+
+    async def _refresh(name: str) -> cache_telemetry.RefreshResult:
+        async with gate:
+            # ``preload_on_startup`` has usually just loaded (or is still
+            # loading) the startup buckets; don't fetch them again.
+            return await cache_telemetry.refresh_now(name=name, actor="startup", stale_only=True)
+
+    started = time.monotonic()
+    outcomes = await asyncio.gather(
+        *(_refresh(name) for name in bucket_names), return_exceptions=True
+    )
+    total_ms = int((time.monotonic() - started) * 1000)
+
     rows: list[RefreshEmbedRow] = []
-    total_ms = 0
+    bucket_ms: dict[str, int] = {}
     fallback_lines: list[str] = []
     refresh_results: list[cache_telemetry.RefreshResult] = []
-
-    for name in bucket_names:
-        try:
-            result = await cache_telemetry.refresh_now(
-                name=name,
-                actor="startup",
+    result_names: list[str] = []
+
+    for name, result in zip(bucket_names, outcomes):
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+        if isinstance(result, BaseException):
+            log.error(
+                "startup preload refresh failed",
+                exc_info=result,
+                extra={"bucket": name},
             )
-        except asyncio.CancelledError:
-            raise
-        except Exception as exc:  # pragma: no cover - defensive guard
-            log.exception("startup preload refresh failed", extra={"bucket": name})
-            await send_log_message(f"❌ Startup refresh failed for {name}: {exc}")
+            await send_log_message(f"❌ Startup refresh failed for {name}: {result}")
             continue
 
         snapshot = result.snapshot
         duration_ms = result.duration_ms or 0
-        total_ms += duration_ms
+        bucket_ms[name] = duration_ms
 
         raw_result = snapshot.last_result or ("ok" if result.ok else "fail")
         display_result = raw_result.replace("_", " ").strip() or "-"
@@ -229,6 +283,7 @@ async def _startup_preload(bot: commands.Bot | None = None) -> None:
             count_display = str(snapshot.item_count)
 
         refresh_results.append(result)
+        result_names.append(name)
 
         rows.append(
             RefreshEmbedRow(
@@ -246,12 +301,14 @@ async def _startup_preload(bot: commands.Bot | None = None) -> None:
             f"{label}: {display_result} · {duration_ms} ms · error={cleaned_error or '-'}"
         )
 
+    _set_preload_status("done", total_ms=total_ms, bucket_ms=bucket_ms)
+
     if not rows:
         log.info("Cache preloader completed with no rows")
         return
 
     deduper = refresh_deduper()
-    bucket_names_for_key = [res.name or name for res, name in zip(refresh_results, bucket_names)]
+    bucket_names_for_key = [res.name or name for res, name in zip(refresh_results, result_names)]
     key = refresh_dedupe_key("startup", None, bucket_names_for_key)
     if refresh_results and deduper.should_emit(key):
         buckets_for_message = refresh_bucket_results(refresh_results)
@@ -259,7 +316,10 @@ async def _startup_preload(bot: commands.Bot | None = None) -> None:
             format_refresh_message("startup", buckets_for_message, total_s=total_ms / 1000.0)
         )
 
-    log.info("Cache preloader completed")
+    log.info(
+        "Cache preloader completed",
+        extra={"total_ms": total_ms, "bucket_ms": bucket_ms},
+    )
 
 
 def set_active_runtime(runtime: "Runtime | None") -> None:
@@ -581,24 +641,179 @@ def _next_cron_run(
     raise ValueError("unable to compute next cron run within 1 year")
 
 
-class _RecurringJob:
+OVERLAP_POLICIES = ("skip", "queue", "cancel")
+
+
+@dataclass
+class JobStats:
+    """Run counters and timings for one scheduled job (milliseconds)."""
+
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0
+    cancelled: int = 0
+    last_outcome: str = "pending"
+    last_duration_ms: int = 0
+    last_lag_ms: int = 0
+    max_lag_ms: int = 0
+    total_duration_ms: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "cancelled": self.cancelled,
+            "last_outcome": self.last_outcome,
+            "last_duration_ms": self.last_duration_ms,
+            "last_lag_ms": self.last_lag_ms,
+            "max_lag_ms": self.max_lag_ms,
+            "avg_duration_ms": self.total_duration_ms // self.runs if self.runs else 0,
+        }
+
+
+class _ScheduledJob(ABC):
+    """A job fired by the scheduler's timer loop.
+
+    ``overlap`` decides what happens when a tick arrives while the previous
+    run is still going: ``skip`` drops the tick, ``queue`` runs once more
+    right after the current run, ``cancel`` cancels the old run and starts a
+    new one.
+    """
+
+    _error_message = "scheduled job error"
+
     def __init__(
         self,
         scheduler: "Scheduler",
         *,
-        interval: timedelta,
-        jitter: str | float | None = None,
         tag: str | None = None,
         name: str | None = None,
         component: str | None = None,
+        overlap: str = "skip",
     ) -> None:
+        if overlap not in OVERLAP_POLICIES:
+            raise ValueError(f"overlap must be one of {', '.join(OVERLAP_POLICIES)}")
         self._scheduler = scheduler
-        self._interval = interval
-        self._jitter = jitter
         self.tag = tag
         self.name = name
         self.component = component or "default"
+        self.overlap = overlap
         self.next_run: datetime | None = None
+        self.stats = JobStats()
+        self._job: Callable[[], Awaitable[None]] | None = None
+        self._handle: asyncio.Future | None = None
+        self._running: asyncio.Task | None = None
+        self._queued: datetime | None = None
+
+    @abstractmethod
+    def _compute_next_run(self, reference: datetime | None = None) -> datetime:
+        """Return the next fire time after ``reference`` (defaults to now)."""
+
+    @property
+    def label(self) -> str:
+        return self.name or getattr(self._job, "__name__", "job")
+
+    def do(self, job: Callable[[], Awaitable[None]]) -> asyncio.Future:
+        """Schedule ``job``; the returned future is done once the job is retired.
+
+        Cancel the future to unschedule the job (a run in flight is cancelled too).
+        """
+
+        self._job = job
+        self.next_run = self._compute_next_run()
+        self._handle = asyncio.get_running_loop().create_future()
+        self._handle.add_done_callback(lambda _fut: self._retire())
+        self._scheduler._schedule(self)
+        return self._handle
+
+    @property
+    def active(self) -> bool:
+        return self._handle is not None and not self._handle.done()
+
+    def _retire(self) -> None:
+        running = self._running
+        if running is not None and not running.done():
+            running.cancel()
+        self._queued = None
+
+    def _fire(self, scheduled: datetime) -> None:
+        running = self._running
+        if running is not None and not running.done():
+            if self.overlap == "skip":
+                self._record_skip(scheduled)
+                return
+            if self.overlap == "queue":
+                if self._queued is None:
+                    self._queued = scheduled
+                else:
+                    self._record_skip(scheduled)
+                return
+            running.cancel()
+        self._start(scheduled)
+
+    def _start(self, scheduled: datetime) -> None:
+        name = self.label
+        self._running = asyncio.create_task(self._run(scheduled), name=f"job:{name}")
+
+    def _record_skip(self, scheduled: datetime) -> None:
+        self.stats.skipped += 1
+        self.stats.last_outcome = "skipped"
+        log.info(
+            "scheduled job tick skipped (previous run still active)",
+            extra={"job_name": self.label, "tag": self.tag, "scheduled": scheduled.isoformat()},
+        )
+
+    async def _run(self, scheduled: datetime) -> None:
+        assert self._job is not None
+        started = datetime.now(timezone.utc)
+        lag_ms = max(0, int((started - scheduled).total_seconds() * 1000))
+        clock = time.perf_counter()
+        outcome = "ok"
+        try:
+            await self._job()
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except Exception:
+            outcome = "error"
+            log.exception(
+                self._error_message,
+                extra={"job_name": self.label, "tag": self.tag},
+            )
+        finally:
+            duration_ms = int((time.perf_counter() - clock) * 1000)
+            stats = self.stats
+            stats.runs += 1
+            stats.failures += int(outcome == "error")
+            stats.cancelled += int(outcome == "cancelled")
+            stats.last_outcome = outcome
+            stats.last_duration_ms = duration_ms
+            stats.last_lag_ms = lag_ms
+            stats.max_lag_ms = max(stats.max_lag_ms, lag_ms)
+            stats.total_duration_ms += duration_ms
+            queued, self._queued = self._queued, None
+            if queued is not None and outcome != "cancelled" and self.active:
+                self._start(queued)
+
+
+class _RecurringJob(_ScheduledJob):
+    _error_message = "recurring job error"
+
+    def __init__(
+        self,
+        scheduler: "Scheduler",
+        *,
+        interval: timedelta,
+        jitter: str | float | None = None,
+        tag: str | None = None,
+        name: str | None = None,
+        component: str | None = None,
+        overlap: str = "skip",
+    ) -> None:
+        super().__init__(scheduler, tag=tag, name=name, component=component, overlap=overlap)
+        self._interval = interval
+        self._jitter = jitter
 
     @property
     def interval(self) -> timedelta:
@@ -631,43 +846,10 @@ class _RecurringJob:
             candidate = now + timedelta(seconds=1)
         return candidate
 
-    async def _sleep_until_due(self) -> None:
-        if self.next_run is None:
-            self.next_run = self._compute_next_run()
-        while True:
-            assert self.next_run is not None
-            now = datetime.now(timezone.utc)
-            delay = (self.next_run - now).total_seconds()
-            if delay <= 0:
-                break
-            await asyncio.sleep(min(delay, 60.0))
 
-    def do(self, job: Callable[[], Awaitable[None]]) -> asyncio.Task:
-        self.next_run = self._compute_next_run()
+class _CronJob(_ScheduledJob):
+    _error_message = "cron job error"
 
-        async def runner() -> None:
-            while True:
-                await self._sleep_until_due()
-                try:
-                    await job()
-                except asyncio.CancelledError:
-                    raise
-                except Exception:
-                    log.exception(
-                        "recurring job error",
-                        extra={
-                            "job_name": self.name or getattr(job, "__name__", "job"),
-                            "tag": self.tag,
-                        },
-                    )
-                finally:
-                    self.next_run = self._compute_next_run()
-
-        task_name = self.name or getattr(job, "__name__", "recurring_job")
-        return self._scheduler.spawn(runner(), name=task_name)
-
-
-class _CronJob:
     def __init__(
         self,
         scheduler: "Scheduler",
@@ -675,58 +857,29 @@ class _CronJob:
         expression: str,
         tag: str | None = None,
         name: str | None = None,
+        overlap: str = "skip",
     ) -> None:
-        self._scheduler = scheduler
+        super().__init__(scheduler, tag=tag, name=name, overlap=overlap)
         self._fields = _parse_cron_expression(expression)
-        self.tag = tag
-        self.name = name
-        self.next_run: datetime | None = None
 
     def _compute_next_run(self, reference: datetime | None = None) -> datetime:
         return _next_cron_run(self._fields, reference)
 
-    async def _sleep_until_due(self) -> None:
-        if self.next_run is None:
-            self.next_run = self._compute_next_run()
-        while True:
-            assert self.next_run is not None
-            now = datetime.now(timezone.utc)
-            delay = (self.next_run - now).total_seconds()
-            if delay <= 0:
-                break
-            await asyncio.sleep(min(delay, 60.0))
-
-    def do(self, job: Callable[[], Awaitable[None]]) -> asyncio.Task:
-        self.next_run = self._compute_next_run()
-
-        async def runner() -> None:
-            while True:
-                await self._sleep_until_due()
-                try:
-                    await job()
-                except asyncio.CancelledError:
-                    raise
-                except Exception:
-                    log.exception(
-                        "cron job error",
-                        extra={
-                            "job_name": self.name or getattr(job, "__name__", "job"),
-                            "tag": self.tag,
-                        },
-                    )
-                finally:
-                    self.next_run = self._compute_next_run(datetime.now(timezone.utc))
-
-        task_name = self.name or getattr(job, "__name__", "cron_job")
-        return self._scheduler.spawn(runner(), name=task_name)
-
 
 class Scheduler:
-    """Very small asyncio task supervisor for background jobs."""
+    """Asyncio supervisor for background tasks and scheduled jobs.
+
+    Scheduled jobs share one timer task driven by a min-heap of next-fire
+    times, so idle jobs cost nothing until they are due.
+    """
 
     def __init__(self) -> None:
         self._tasks: list[asyncio.Task] = []
-        self._jobs: list[_RecurringJob] = []
+        self._jobs: list[_ScheduledJob] = []
+        self._heap: list[tuple[datetime, int, _ScheduledJob]] = []
+        self._sequence = 0
+        self._timer: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
 
     def spawn(self, coro: Awaitable, *, name: Optional[str] = None) -> asyncio.Task:
         if name is not None:
@@ -737,9 +890,16 @@ class Scheduler:
         return task
 
     def cron(
-        self, expression: str, *, tag: str | None = None, name: str | None = None
+        self,
+        expression: str,
+        *,
+        tag: str | None = None,
+        name: str | None = None,
+        overlap: str = "skip",
     ) -> _CronJob:
-        return _CronJob(self, expression=expression, tag=tag, name=name)
+        job = _CronJob(self, expression=expression, tag=tag, name=name, overlap=overlap)
+        self._jobs.append(job)
+        return job
 
     def every(
         self,
@@ -751,6 +911,7 @@ class Scheduler:
         tag: str | None = None,
         name: str | None = None,
         component: str | None = None,
+        overlap: str = "skip",
     ) -> _RecurringJob:
         total_seconds = float(hours) * 3600.0 + float(minutes) * 60.0 + float(seconds)
         if total_seconds <= 0:
@@ -763,20 +924,89 @@ class Scheduler:
             tag=tag,
             name=name,
             component=component,
+            overlap=overlap,
         )
         self._jobs.append(job)
         return job
 
     @property
-    def jobs(self) -> list[_RecurringJob]:
+    def jobs(self) -> list[_ScheduledJob]:
         return list(self._jobs)
 
+    def job_stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-job run metrics keyed by job name."""
+
+        return {job.label: job.stats.as_dict() for job in self._jobs if job._job is not None}
+
+    def _schedule(self, job: _ScheduledJob) -> None:
+        if job.next_run is None or not job.active:
+            return
+        self._sequence += 1
+        heapq.heappush(self._heap, (job.next_run, self._sequence, job))
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._timer_loop(), name="scheduler_timer")
+        self._wakeup.set()
+
+    def _pop_due(self, now: datetime) -> list[tuple[datetime, _ScheduledJob]]:
+        due: list[tuple[datetime, _ScheduledJob]] = []
+        while self._heap:
+            when, _seq, job = self._heap[0]
+            if not job.active or when != job.next_run:
+                heapq.heappop(self._heap)
+                continue
+            if when > now:
+                break
+            heapq.heappop(self._heap)
+            due.append((when, job))
+        return due
+
+    async def _timer_loop(self) -> None:
+        assert self._wakeup is not None
+        wakeup = self._wakeup
+        while True:
+            wakeup.clear()
+            now = datetime.now(timezone.utc)
+            for scheduled, job in self._pop_due(now):
+                try:
+                    job._fire(scheduled)
+                except Exception:
+                    log.exception("scheduler failed to start job", extra={"job_name": job.label})
+                try:
+                    job.next_run = job._compute_next_run(datetime.now(timezone.utc))
+                except Exception:
+                    log.exception("scheduler failed to compute next run", extra={"job_name": job.label})
+                    job.next_run = None
+                    continue
+                self._schedule(job)
+            timeout: float | None = None
+            if self._heap:
+                timeout = max(0.0, (self._heap[0][0] - datetime.now(timezone.utc)).total_seconds())
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
     async def shutdown(self) -> None:
+        pending: list[asyncio.Task] = []
+        for job in self._jobs:
+            handle = job._handle
+            if handle is not None and not handle.done():
+                handle.cancel()
+            running = job._running
+            if running is not None and not running.done():
+                running.cancel()
+                pending.append(running)
+        if self._timer is not None and not self._timer.done():
+            self._timer.cancel()
+            pending.append(self._timer)
         for task in self._tasks:
             if task.done():
                 continue
             task.cancel()
-        for task in self._tasks:
+        pending.extend(task for task in self._tasks if not task.done())
+        for task in pending:
             if task.done():
                 continue
             try:
@@ -798,6 +1028,7 @@ class Runtime:
         self._web_site: Optional[web.TCPSite] = None
         self._watchdog_task: Optional[asyncio.Task] = None
         self._watchdog_params: Optional[tuple[int, int, int]] = None
+        self._log_sink = LogChannelSink(self._deliver_log_batch)
         set_active_runtime(self)
 
     async def start_webserver(self, *, port: Optional[int] = None) -> None:
@@ -872,12 +1103,20 @@ class Runtime:
         await self.shutdown_webserver()
 
     async def send_log_message(self, message: str) -> None:
+        """Queue ``message`` for the log channel; lines are batched by ``LogChannelSink``."""
+
         channel_id = get_log_channel_id()
         if not channel_id:
             return
         content = _trim_message(str(message))
         if not content:
             return
+        self._log_sink.submit(content)
+
+    async def _deliver_log_batch(self, content: str) -> None:
+        channel_id = get_log_channel_id()
+        if not channel_id:
+            return
         await self.bot.wait_until_ready()
         channel = self.bot.get_channel(channel_id)
         if channel is None:
@@ -1214,17 +1453,16 @@ class Runtime:
         # (Refresh commands now live directly in the CoreOps cog.)
 
     async def start(self, token: str) -> None:
+        # Config tabs load alongside the webserver and extensions; the cache
+        # preload below needs them (e.g. ONBOARDING_TAB), so wait there.
+        shared_config.start_sheet_config_load()
         await self.start_webserver()
         await self.load_extensions()
         rehydrate_tiers(self.bot)
         audit_tiers(self.bot, log)
         toggles = shared_config.features
-        try:
-            merged = shared_config.merge_onboarding_config_early()
-        except Exception as exc:  # pragma: no cover - defensive logging
-            human_log.human("warn", "Config preload failed", error=repr(exc))
-        else:
-            log.debug("runtime: onboarding config preload merged %d keys", merged)
+        if not await shared_config.await_sheet_config():
+            human_log.human("warn", "Config preload incomplete; using environment defaults")
         from shared.sheets.cache_scheduler import (
             emit_schedule_log,
             ensure_cache_registration,
@@ -1372,4 +1610,18 @@ class Runtime:
     async def close(self) -> None:
         await self.shutdown_webserver()
         await self.scheduler.shutdown()
+        try:
+            if self.bot.is_closed() or not self.bot.is_ready():
+                # Delivery waits on readiness, which will never come now.
+                dropped = self._log_sink.discard()
+                if dropped:
+                    log.warning("dropped %d log channel line(s) on shutdown", dropped)
+            else:
+                await self._log_sink.flush(timeout=_LOG_FLUSH_TIMEOUT_SEC)
+        except Exception:  # pragma: no cover - best-effort shutdown flush
+            log.exception("log channel flush on shutdown failed")
+        try:
+            await write_behind.flush_all()
+        except Exception:  # pragma: no cover - best-effort shutdown flush
+            log.exception("write-behind flush on shutdown failed")
         set_active_runtime(None)
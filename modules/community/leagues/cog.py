@@ -17,7 +17,12 @@ from modules.community.leagues.config import (
     load_league_bundles,
 )
 from shared.logfmt import channel_label, user_label
-from shared.sheets.export_utils import export_pdf_as_png, get_tab_gid
+from shared.sheets.export_utils import (
+    afetch_range_fingerprints,
+    aget_fingerprint_store,
+    export_pdf_as_png,
+    get_tab_gid,
+)
 
 if TYPE_CHECKING:
     from modules.community.reaction_roles import ReactionRolesCog
@@ -438,12 +443,16 @@ class LeaguesCog(commands.Cog):
         if bundle.header is None:
             return f"{bundle.display_name}: header missing in Leagues Config tab"
 
+        (fingerprint,) = await afetch_range_fingerprints(
+            sheet_id, [(bundle.header.sheet_name, bundle.header.cell_range)]
+        )
         return await self._export_spec(
             loop,
             sheet_id,
             bundle.slug,
             bundle.header,
             filename=f"{bundle.slug}_header.png",
+            fingerprint=fingerprint,
         )
 
     async def _export_board_images(
@@ -453,7 +462,10 @@ class LeaguesCog(commands.Cog):
         bundle: LeagueBundle,
     ) -> list[discord.File] | str:
         files: list[discord.File] = []
-        for spec in bundle.boards:
+        fingerprints = await afetch_range_fingerprints(
+            sheet_id, [(spec.sheet_name, spec.cell_range) for spec in bundle.boards]
+        )
+        for spec, fingerprint in zip(bundle.boards, fingerprints):
             index = spec.index if spec.index is not None else len(files) + 1
             file = await self._export_spec(
                 loop,
@@ -461,6 +473,7 @@ class LeaguesCog(commands.Cog):
                 bundle.slug,
                 spec,
                 filename=f"{bundle.slug}_{index}.png",
+                fingerprint=fingerprint,
             )
             if isinstance(file, str):
                 return file
@@ -475,7 +488,21 @@ class LeaguesCog(commands.Cog):
         spec: LeagueSpec,
         *,
         filename: str,
+        fingerprint: str | None = None,
     ) -> discord.File | str:
+        # Every run posts fresh messages, so unchanged ranges still upload; they
+        # only skip the PDF export and rasterisation by reusing the last PNG.
+        store = await aget_fingerprint_store()
+        export_key = f"leagues:{slug}:{spec.key}"
+        if store.source_unchanged(export_key, fingerprint):
+            cached = await store.aload_png(export_key)
+            if cached:
+                log.info(
+                    "league range unchanged; reusing last export",
+                    extra={"key": spec.key, "tab": spec.sheet_name},
+                )
+                return discord.File(fp=io.BytesIO(cached), filename=filename)
+
         try:
             gid = await loop.run_in_executor(None, get_tab_gid, sheet_id, spec.sheet_name)
         except Exception:
@@ -503,6 +530,7 @@ class LeaguesCog(commands.Cog):
         if not png_bytes:
             return f"{slug.title()}: export returned no data for {spec.key}"
 
+        await store.aremember(export_key, fingerprint, png_bytes)
         return discord.File(fp=io.BytesIO(png_bytes), filename=filename)
 
     def _build_announcement(
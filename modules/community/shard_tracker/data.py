@@ -6,12 +6,15 @@ import asyncio
 import logging
 import os
 import time
-from dataclasses import dataclass, field
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Sequence
+from typing import Any, AsyncIterator, Dict, List, Sequence
 
 from shared.config import cfg as runtime_config, get_milestones_sheet_id
-from shared.sheets import async_core
+from shared.sheets import async_core, write_behind
+from shared.sheets.core import appended_row_number
 
 log = logging.getLogger("c1c.shards.data")
 _CONFIG_LOG_EMITTED = False
@@ -107,6 +110,21 @@ class ShardRecord:
         return [str(mapping.get(name, "")) for name in self.header]
 
 
+@dataclass(slots=True)
+class _ShardIndex:
+    """discord_id → cached record for one worksheet, built from a single read."""
+
+    sheet_id: str
+    tab_name: str
+    header: List[str]
+    records: Dict[int, ShardRecord]
+    next_row: int
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    def matches(self, config: ShardTrackerConfig) -> bool:
+        return self.sheet_id == config.sheet_id and self.tab_name == config.tab_name
+
+
 class ShardTrackerConfigError(RuntimeError):
     """Raised when the shard tracker configuration is incomplete."""
 
@@ -119,12 +137,21 @@ class ShardSheetStore:
     """Async facade for the shard tracker worksheet."""
 
     _CONFIG_TTL = 300
+    _INDEX_TTL = 300
 
     def __init__(self) -> None:
         self._config_cache: ShardTrackerConfig | None = None
         self._config_ts = 0.0
         self._config_lock = asyncio.Lock()
+        # Only appends share a lock (to allocate row numbers); saves lock their row.
         self._sheet_lock = asyncio.Lock()
+        # Row locks live only while a save holds or waits on them.
+        self._row_locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock_stats: Dict[str, Dict[str, int]] = {}
+        self._index: _ShardIndex | None = None
+        self._index_lock = asyncio.Lock()
 
     async def get_config(self) -> ShardTrackerConfig:
         async with self._config_lock:
@@ -175,6 +202,82 @@ class ShardSheetStore:
 
     async def load_record(self, discord_id: int, username: str) -> ShardRecord:
         config = await self.get_config()
+        index = await self._get_index(config)
+        cached = index.records.get(int(discord_id))
+        if cached is None:
+            record = self._new_record(index.header, discord_id, username)
+            await self._append_row(config, index, record)
+            return replace(record)
+        # Hand out a copy so unsaved edits never leak into the index.
+        record = replace(cached)
+        record.snapshot_name(username)
+        return record
+
+    async def save_record(self, config: ShardTrackerConfig, record: ShardRecord) -> None:
+        record.last_updated_iso = _now_iso()
+        range_label = f"A{record.row_number}:V{record.row_number}"
+        row = record.to_row()
+        async with self._timed_lock("row", self._row_lock(record.row_number)):
+            try:
+                # Concurrent saves for different members share one batched flush.
+                await write_behind.awrite_range(
+                    config.sheet_id, config.tab_name, range_label, [row]
+                )
+            except Exception:
+                self.invalidate_index()
+                raise
+            index = self._index
+            if index is not None and index.matches(config):
+                index.records[int(record.discord_id)] = replace(record)
+
+    def lock_stats(self) -> Dict[str, Dict[str, int]]:
+        """Return acquisitions, contended waits and wait times (ms) per lock kind."""
+
+        return {kind: dict(values) for kind, values in self._lock_stats.items()}
+
+    def _row_lock(self, row_number: int) -> asyncio.Lock:
+        lock = self._row_locks.get(row_number)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._row_locks[row_number] = lock
+        return lock
+
+    @asynccontextmanager
+    async def _timed_lock(self, kind: str, lock: asyncio.Lock) -> AsyncIterator[None]:
+        contended = lock.locked()
+        started = time.perf_counter()
+        async with lock:
+            waited_ms = int((time.perf_counter() - started) * 1000)
+            stats = self._lock_stats.setdefault(
+                kind, {"acquired": 0, "contended": 0, "wait_ms": 0, "max_wait_ms": 0}
+            )
+            stats["acquired"] += 1
+            stats["contended"] += int(contended)
+            stats["wait_ms"] += waited_ms
+            stats["max_wait_ms"] = max(stats["max_wait_ms"], waited_ms)
+            yield
+
+    def invalidate_index(self) -> None:
+        """Drop the cached row index so the next load re-reads the worksheet."""
+
+        self._index = None
+
+    async def _get_index(self, config: ShardTrackerConfig) -> _ShardIndex:
+        index = self._index
+        if index is not None and index.matches(config) and self._index_fresh(index):
+            return index
+        async with self._index_lock:
+            index = self._index
+            if index is not None and index.matches(config) and self._index_fresh(index):
+                return index
+            index = await self._load_index(config)
+            self._index = index
+            return index
+
+    def _index_fresh(self, index: _ShardIndex) -> bool:
+        return (time.monotonic() - index.loaded_at) < self._INDEX_TTL
+
+    async def _load_index(self, config: ShardTrackerConfig) -> _ShardIndex:
         matrix = await async_core.afetch_values(config.sheet_id, config.tab_name)
         if not matrix:
             raise ShardTrackerSheetError("Shard tracker worksheet is empty; headers required")
@@ -182,44 +285,51 @@ class ShardSheetStore:
         if header != EXPECTED_HEADERS:
             raise ShardTrackerSheetError("Shard tracker headers do not match EXPECTED_HEADERS")
         header_map = {name: idx for idx, name in enumerate(header)}
-        row_number = 1
-        target_row: Sequence[str] | None = None
-        for offset, row in enumerate(matrix[1:], start=2):
-            row_number = offset
-            if self._matches_user(row, header_map, discord_id):
-                target_row = row
-                break
-        if target_row is None:
-            record = self._new_record(header, discord_id, username)
-            new_row_number = await self._append_row(config, record)
-            record.row_number = new_row_number
-            return record
-        return self._row_to_record(header, header_map, row_number, target_row, discord_id, username)
-
-    async def save_record(self, config: ShardTrackerConfig, record: ShardRecord) -> None:
-        record.last_updated_iso = _now_iso()
-        range_label = f"A{record.row_number}:V{record.row_number}"
-        row = record.to_row()
-        worksheet = await async_core.aget_worksheet(config.sheet_id, config.tab_name)
-        async with self._sheet_lock:
-            await async_core.acall_with_backoff(
-                worksheet.update,
-                range_label,
-                [row],
-                value_input_option="RAW",
+        records: Dict[int, ShardRecord] = {}
+        for row_number, row in enumerate(matrix[1:], start=2):
+            discord_id = self._row_discord_id(row, header_map)
+            if discord_id is None or discord_id in records:
+                # Keep the first row per member, matching the old linear scan.
+                continue
+            records[discord_id] = self._row_to_record(
+                header, header_map, row_number, row, discord_id, ""
             )
+        return _ShardIndex(
+            sheet_id=config.sheet_id,
+            tab_name=config.tab_name,
+            header=header,
+            records=records,
+            next_row=len(matrix) + 1,
+        )
 
-    async def _append_row(self, config: ShardTrackerConfig, record: ShardRecord) -> int:
+    async def _append_row(
+        self, config: ShardTrackerConfig, index: _ShardIndex, record: ShardRecord
+    ) -> int:
         worksheet = await async_core.aget_worksheet(config.sheet_id, config.tab_name)
-        async with self._sheet_lock:
-            matrix = await async_core.afetch_values(config.sheet_id, config.tab_name)
-            new_row_number = len(matrix) + 1 if matrix else 1
-            await async_core.acall_with_backoff(
-                worksheet.append_row,
-                record.to_row(),
-                value_input_option="RAW",
-            )
-        return new_row_number
+        async with self._timed_lock("append", self._sheet_lock):
+            try:
+                response = await async_core.acall_with_backoff(
+                    worksheet.append_row,
+                    record.to_row(),
+                    value_input_option="RAW",
+                )
+            except Exception:
+                self.invalidate_index()
+                raise
+            new_row_number = appended_row_number(response)
+            if new_row_number is not None:
+                record.row_number = new_row_number
+                index.next_row = max(index.next_row, new_row_number + 1)
+                index.records[int(record.discord_id)] = replace(record)
+                return new_row_number
+            # The response did not say where the row landed; re-read instead of guessing.
+            self.invalidate_index()
+        fresh = await self._get_index(config)
+        stored = fresh.records.get(int(record.discord_id))
+        if stored is None:
+            raise ShardTrackerSheetError("Appended shard tracker row not found on re-read")
+        record.row_number = stored.row_number
+        return stored.row_number
 
     def _row_to_record(
         self,
@@ -274,14 +384,14 @@ class ShardSheetStore:
         record.last_updated_iso = _now_iso()
         return record
 
-    def _matches_user(
-        self, row: Sequence[str], header_map: Dict[str, int], discord_id: int
-    ) -> bool:
+    def _row_discord_id(self, row: Sequence[str], header_map: Dict[str, int]) -> int | None:
         idx = header_map.get("discord_id", -1)
         if idx < 0 or idx >= len(row):
-            return False
+            return None
         cell = str(row[idx] or "").strip()
-        return cell == str(discord_id)
+        if not cell.isdigit():
+            return None
+        return int(cell)
 
     @staticmethod
     def _normalize(value: Any) -> str:
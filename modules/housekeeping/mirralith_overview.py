@@ -15,7 +15,12 @@ from PIL import Image, ImageDraw, ImageFont
 from modules.common import runtime as runtime_helpers
 from shared.sheets import core as sheets_core
 from shared.sheets import recruitment
-from shared.sheets.export_utils import export_pdf_as_png, get_tab_gid
+from shared.sheets.export_utils import (
+    afetch_range_fingerprints,
+    aget_fingerprint_store,
+    export_pdf_as_png,
+    get_tab_gid,
+)
 
 log = logging.getLogger("c1c.housekeeping.mirralith")
 
@@ -181,7 +186,9 @@ def build_mirralith_message_content(label: str, description: str, updated_date:
 
 async def upsert_labeled_message(
     channel: discord.TextChannel, label: str, content: str, file: discord.File
-) -> None:
+) -> bool:
+    """Edit the bot message tagged with ``label`` or post a new one; ``True`` on success."""
+
     bot_member = getattr(getattr(channel, "guild", None), "me", None)
     bot_id = getattr(bot_member, "id", None)
     if bot_id is None:
@@ -207,18 +214,20 @@ async def upsert_labeled_message(
         if existing is not None:
             try:
                 await existing.edit(content=content, attachments=[file])
-                return
+                return True
             except Exception:
                 log.exception(
                     "failed to edit Mirralith message; sending new message instead",
                     extra={"channel_id": getattr(channel, "id", None), "label": label},
                 )
         await channel.send(content=content, file=file)
+        return True
     except Exception:
         log.exception(
             "failed to upsert Mirralith message",
             extra={"channel_id": getattr(channel, "id", None), "label": label},
         )
+        return False
 
 
 async def run_mirralith_overview_job(bot: discord.Client, trigger: str = "scheduled") -> None:
@@ -258,8 +267,14 @@ async def run_mirralith_overview_job(bot: discord.Client, trigger: str = "schedu
     run_timestamp = run_time.strftime("%Y-%m-%d %H:%M UTC")
 
     updated_labels: list[str] = []
+    unchanged_labels: list[str] = []
     failed_labels: list[tuple[str, str]] = []
+    # Manual runs always re-render; scheduled runs skip ranges whose values
+    # (or rendered PNG) match the last successful upload.
+    force = trigger == "manual"
+    fingerprints = await aget_fingerprint_store()
 
+    resolved: list[tuple[ImageSpec, str, str]] = []
     for spec in IMAGE_SPECS:
         def record_failure(reason: str) -> None:
             failed_labels.append((spec.label, reason))
@@ -300,6 +315,25 @@ async def run_mirralith_overview_job(bot: discord.Client, trigger: str = "schedu
             )
             continue
 
+        resolved.append((spec, tab_name, range_value))
+
+    # One batched values read covers every range instead of one call per spec.
+    range_fingerprints = await afetch_range_fingerprints(
+        spreadsheet_id, [(tab_name, range_value) for _, tab_name, range_value in resolved]
+    )
+    for (spec, tab_name, range_value), fingerprint in zip(resolved, range_fingerprints):
+        def record_failure(reason: str) -> None:
+            failed_labels.append((spec.label, reason))
+
+        export_key = f"mirralith:{spec.label}"
+        if not force and fingerprints.source_unchanged(export_key, fingerprint):
+            unchanged_labels.append(spec.label)
+            log.info(
+                "Mirralith range unchanged; skipping export",
+                extra={"label": spec.label, "tab": tab_name, "range": range_value},
+            )
+            continue
+
         try:
             gid = await loop.run_in_executor(None, get_tab_gid, spreadsheet_id, tab_name)
         except Exception as exc:
@@ -357,11 +391,17 @@ async def run_mirralith_overview_job(bot: discord.Client, trigger: str = "schedu
             )
             continue
 
+        if not force and fingerprints.png_unchanged(export_key, png_bytes):
+            await fingerprints.aremember(export_key, fingerprint, png_bytes)
+            unchanged_labels.append(spec.label)
+            continue
+
         file = discord.File(io.BytesIO(png_bytes), filename=spec.filename)
         content = build_mirralith_message_content(spec.label, spec.description, updated_date)
 
         try:
-            await upsert_labeled_message(channel, spec.label, content, file)
+            if await upsert_labeled_message(channel, spec.label, content, file):
+                await fingerprints.aremember(export_key, fingerprint, png_bytes)
             updated_labels.append(spec.label)
         except Exception:
             record_failure("message upsert failed")
@@ -377,6 +417,8 @@ async def run_mirralith_overview_job(bot: discord.Client, trigger: str = "schedu
 
     total_specs = len(IMAGE_SPECS)
     summary_parts.append(f"Specs updated: {len(updated_labels)} / {total_specs}")
+    if unchanged_labels:
+        summary_parts.append(f"Unchanged (skipped): {len(unchanged_labels)}")
 
     if failed_labels:
         failed_items = ", ".join(f"{label} ({reason})" for label, reason in failed_labels)
@@ -244,16 +244,29 @@ class RollingCardSession:
         self._note: str | None = None
         self._recompute_visibility()
 
-    def _recompute_visibility(self) -> None:
+    def _recompute_visibility(
+        self, changed: Iterable[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Refresh visibility and return the entries that changed state."""
+
+        previous = self._visibility
         try:
-            self._visibility = rules.evaluate_visibility(
-                self._all_questions, self._answers
-            )
+            if changed is None or not previous:
+                self._visibility = rules.evaluate_visibility(
+                    self._all_questions, self._answers
+                )
+                diff = rules.visibility_changes(previous, self._visibility)
+            else:
+                self._visibility, diff = rules.update_visibility(
+                    self._all_questions, self._answers, previous, changed
+                )
         except Exception:
             self._visibility = {}
+            diff = rules.visibility_changes(previous, {})
         else:
-            if self.thread_id is not None:
+            if self.thread_id is not None and (diff or changed is None):
                 self.controller._update_thread_visibility(self.thread_id, self._visibility)
+        return diff
 
     def _visible_state(self, qid: str | None) -> str:
         if not qid:
@@ -801,11 +814,11 @@ class RollingCardSession:
             except Exception:
                 pass
         self._log_event("✅", "answer")
-        previous_visibility = dict(self._visibility)
-        self._recompute_visibility()
+        previous_visibility = self._visibility
+        diff = self._recompute_visibility(changed=(question.qid,))
 
         new_state = self._visible_state(question.qid)
-        if self._visibility_flipped(previous_visibility):
+        if self._visibility_flipped(previous_visibility, diff):
             self._note = MAP_CHANGED_NOTE
 
         if advance_if_hidden and new_state == "skip":
@@ -820,8 +833,12 @@ class RollingCardSession:
         self._status_hint = None
         await self._render_step()
 
-    def _visibility_flipped(self, previous: dict[str, dict[str, str]]) -> bool:
-        for qid, entry in self._visibility.items():
+    def _visibility_flipped(
+        self,
+        previous: dict[str, dict[str, str]],
+        diff: dict[str, dict[str, Any]],
+    ) -> bool:
+        for qid, entry in diff.items():
             state = entry.get("state")
             prior_state = (previous.get(qid) or {}).get("state")
             if state == prior_state:
@@ -1184,6 +1201,7 @@ class BaseWelcomeController:
         self._sources: Dict[int, str] = {}
         self._allowed_users: Dict[int, set[int]] = {}
         self._panel_messages: Dict[int, int] = {}
+        self._persist_tasks: Dict[int, asyncio.Task[None]] = {}
         self._prefetched_panels: Dict[int, discord.Message] = {}
         self._initiators: Dict[int, discord.abc.User | discord.Member | None] = {}
         self._target_users: Dict[int, int | None] = {}
@@ -1295,6 +1313,29 @@ class BaseWelcomeController:
             pass
         return 0
 
+    def _spawn_persist(self, thread_id: int, coro: Awaitable[None]) -> asyncio.Task[None]:
+        """Run sheet persistence off the interaction path, in order per thread."""
+
+        previous = self._persist_tasks.get(thread_id)
+
+        async def _runner() -> None:
+            if previous is not None and not previous.done():
+                try:
+                    await previous
+                except Exception:
+                    pass
+            await coro
+
+        task = asyncio.create_task(_runner())
+        self._persist_tasks[thread_id] = task
+
+        def _forget(done: asyncio.Task[None]) -> None:
+            if self._persist_tasks.get(thread_id) is done:
+                self._persist_tasks.pop(thread_id, None)
+
+        task.add_done_callback(_forget)
+        return task
+
     async def _persist_session_start(
         self,
         thread_id: int,
@@ -1324,7 +1365,7 @@ class BaseWelcomeController:
         sheet_session._touch(timestamp=panel_created_at or utc_now())
 
         try:
-            sheet_session.save_to_sheet()
+            await sheet_session.asave_to_sheet()
         except Exception:
             log.warning("welcome:sheet_start_save_failed", exc_info=True)
 
@@ -1354,7 +1395,7 @@ class BaseWelcomeController:
         sheet_session._touch()
 
         try:
-            sheet_session.save_to_sheet()
+            await sheet_session.asave_to_sheet()
         except Exception:
             log.warning("welcome:sheet_complete_save_failed", exc_info=True)
 
@@ -1682,7 +1723,10 @@ class BaseWelcomeController:
                 session.answers[key] = normalized
             try:
                 session.visibility = rules.evaluate_visibility(
-                    self._questions.get(thread_id, []), session.answers
+                    self._questions.get(thread_id, []),
+                    session.answers,
+                    previous=session.visibility,
+                    changed=(key,),
                 )
             except Exception:
                 log.warning("failed to recompute visibility during inline capture", exc_info=True)
@@ -1968,11 +2012,14 @@ class BaseWelcomeController:
                 answers=dict(answers),
             )
 
-            await self._persist_session_completion(
+            self._spawn_persist(
                 thread_id,
-                session_data=session,
-                answers=dict(answers),
-                panel_message_id=self._panel_messages.get(thread_id),
+                self._persist_session_completion(
+                    thread_id,
+                    session_data=session,
+                    answers=dict(answers),
+                    panel_message_id=self._panel_messages.get(thread_id),
+                ),
             )
 
         self.answers_by_thread.pop(thread_id, None)
@@ -2224,11 +2271,14 @@ class BaseWelcomeController:
                 ambiguous_target=target_user_id is None,
             )
 
-        await self._persist_session_start(
+        self._spawn_persist(
             thread_id,
-            panel_message_id=int(getattr(message, "id", 0)) if message else None,
-            session_data=session,
-            panel_created_at=getattr(message, "created_at", None),
+            self._persist_session_start(
+                thread_id,
+                panel_message_id=int(getattr(message, "id", 0)) if message else None,
+                session_data=session,
+                panel_created_at=getattr(message, "created_at", None),
+            ),
         )
 
     async def _start_select_step(self, thread: discord.Thread, session: SessionData) -> None:
@@ -3198,6 +3248,8 @@ class BaseWelcomeController:
         session.visibility = rules.evaluate_visibility(
             questions_for_thread,
             session.answers,
+            previous=session.visibility,
+            changed=[question.qid for question in questions],
         )
 
         modals_after = build_modals(
@@ -3289,12 +3341,28 @@ class BaseWelcomeController:
             return
 
         self._store_select_answer(session, question, values)
-        session.visibility = rules.evaluate_visibility(
+        session.visibility, visibility_diff = rules.update_visibility(
             self._questions[thread_id],
             session.answers,
+            session.visibility,
+            (question.qid,),
         )
         store.set_pending_step(thread_id, session.pending_step)
 
+        if not visibility_diff:
+            # Nothing appeared, disappeared or changed requiredness, so the
+            # live view (which shares ``session.answers``) is still accurate.
+            await interaction.response.defer()
+            await logs.send_welcome_log(
+                "debug",
+                view="select",
+                result="changed",
+                question=question.qid,
+                render="skipped",
+                **self._log_fields(thread_id, actor=interaction.user),
+            )
+            return
+
         async def gate(interaction: discord.Interaction) -> bool:
             allowed, _ = await self.check_interaction(thread_id, interaction)
             return allowed
@@ -3508,11 +3576,14 @@ class BaseWelcomeController:
                 answers=dict(session.answers),
             )
 
-            await self._persist_session_completion(
+            self._spawn_persist(
                 thread_id,
-                session_data=session,
-                answers=dict(session.answers),
-                panel_message_id=self._panel_messages.get(thread_id),
+                self._persist_session_completion(
+                    thread_id,
+                    session_data=session,
+                    answers=dict(session.answers),
+                    panel_message_id=self._panel_messages.get(thread_id),
+                ),
             )
 
         store.set_preview_message(thread_id, message_id=None, channel_id=None)
@@ -48,7 +48,7 @@ class WizardController:
         if not persist_sheet:
             return
         try:
-            session.save_to_sheet()
+            await session.asave_to_sheet()
             if log_event and self.log is not None:
                 try:
                     self.log.info(
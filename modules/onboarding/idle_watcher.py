@@ -3,16 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import Iterable
+from typing import Iterable, Mapping
 
 import discord
 from discord.ext import commands
 
 from modules.common import runtime as rt
 from shared.config import get_recruitment_coordinator_role_ids
-from shared.sheets import onboarding_sessions
+from shared.sheets import async_adapter, onboarding_sessions
 from modules.placement import reservation_jobs
 
 log = logging.getLogger("c1c.onboarding.idle_watcher")
@@ -20,12 +22,17 @@ log = logging.getLogger("c1c.onboarding.idle_watcher")
 FIRST_REMINDER_AFTER = timedelta(hours=3)
 WARNING_AFTER = timedelta(hours=24)
 AUTO_CLOSE_AFTER = timedelta(hours=36)
-WATCHER_INTERVAL_SECONDS = int(FIRST_REMINDER_AFTER.total_seconds())
+# Full re-read of the tab; only catches rows edited outside the bot; due
+# actions are driven by the deadline schedule in between.
+WATCHER_INTERVAL_SECONDS = int(timedelta(hours=12).total_seconds())
 WATCHER_JOB_NAME = "onboarding_idle_watcher"
+WATCHER_DEADLINE_TASK_NAME = "onboarding_idle_deadlines"
 WATCHER_COMPONENT = "recruitment"
 NO_PLACEMENT_TAG = "NONE"
+RETRY_AFTER = timedelta(minutes=15)
 
 _WATCHER_TASK: asyncio.Task | None = None
+_DEADLINE_TASK: asyncio.Task | None = None
 
 
 def _utc_now() -> datetime:
@@ -54,13 +61,124 @@ def _format_interval(delta: timedelta) -> float:
     return delta.total_seconds()
 
 
+def _next_deadline(row: Mapping[str, object]) -> datetime | None:
+    """Return when ``row`` next needs an idle action, or ``None`` if never."""
+
+    if not row.get("user_id") or not row.get("thread_id"):
+        return None
+    if row.get("completed") or row.get("auto_closed_at"):
+        return None
+    updated_at = _parse_iso(row.get("updated_at"))  # type: ignore[arg-type]
+    if updated_at is None:
+        return None
+    if not _parse_iso(row.get("first_reminder_at")):  # type: ignore[arg-type]
+        return updated_at + FIRST_REMINDER_AFTER
+    if not _parse_iso(row.get("warning_sent_at")):  # type: ignore[arg-type]
+        return updated_at + WARNING_AFTER
+    return updated_at + AUTO_CLOSE_AFTER
+
+
+class _DeadlineSchedule:
+    """Min-heap of the next idle deadline per thread.
+
+    Entries are replaced lazily: the heap may hold outdated ``(due, thread)``
+    pairs, and only the one matching ``_due[thread]`` is live. Updates can
+    arrive from the Sheets executor thread (session save listener), so state
+    is guarded by a lock and the waiting loop is woken thread-safely.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[datetime, str]] = []
+        self._due: dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._due)
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> asyncio.Event:
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        return self._wakeup
+
+    def seed(self, rows: Iterable[Mapping[str, object]]) -> None:
+        with self._lock:
+            self._heap.clear()
+            self._due.clear()
+            for row in rows:
+                self._set(str(row.get("thread_id") or ""), _next_deadline(row))
+        self._wake()
+
+    def update(self, row: Mapping[str, object]) -> None:
+        with self._lock:
+            self._set(str(row.get("thread_id") or ""), _next_deadline(row))
+        self._wake()
+
+    def reschedule(self, thread_id: str, when: datetime) -> None:
+        with self._lock:
+            self._set(thread_id, when)
+        self._wake()
+
+    def next_due(self) -> datetime | None:
+        with self._lock:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[str]:
+        due: list[str] = []
+        with self._lock:
+            self._drop_stale()
+            while self._heap and self._heap[0][0] <= now:
+                _when, thread_id = heapq.heappop(self._heap)
+                self._due.pop(thread_id, None)
+                due.append(thread_id)
+                self._drop_stale()
+        return due
+
+    def _set(self, thread_id: str, when: datetime | None) -> None:
+        if not thread_id:
+            return
+        if when is None:
+            self._due.pop(thread_id, None)
+            return
+        if self._due.get(thread_id) == when:
+            return
+        self._due[thread_id] = when
+        heapq.heappush(self._heap, (when, thread_id))
+
+    def _drop_stale(self) -> None:
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _wake(self) -> None:
+        loop, event = self._loop, self._wakeup
+        if loop is None or event is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            pass
+
+
+_SCHEDULE = _DeadlineSchedule()
+
+
 async def ensure_idle_watcher(bot: commands.Bot) -> None:
-    global _WATCHER_TASK
+    global _WATCHER_TASK, _DEADLINE_TASK
 
     runtime = rt.get_active_runtime()
     if runtime is None:
         return
 
+    onboarding_sessions.add_save_listener(_SCHEDULE.update)
+
+    if _DEADLINE_TASK is None or _DEADLINE_TASK.done():
+        _DEADLINE_TASK = runtime.scheduler.spawn(
+            _run_deadline_loop(bot), name=WATCHER_DEADLINE_TASK_NAME
+        )
+
     if _WATCHER_TASK is not None and not _WATCHER_TASK.done():
         return
 
@@ -269,15 +387,70 @@ async def _handle_row(
 
 
 async def run_idle_scan(bot: commands.Bot, *, now: datetime | None = None) -> None:
+    """Re-read every session once and reseed the deadline schedule.
+
+    The scan never acts on rows itself; overdue sessions land at the front of
+    the heap and the deadline loop handles them, so each action runs once.
+    """
+
     await bot.wait_until_ready()
 
+    rows = await async_adapter.arun(onboarding_sessions.load_all)
+    _SCHEDULE.seed(rows)
+
+
+async def run_due_actions(bot: commands.Bot, *, now: datetime | None = None) -> int:
+    """Act on the sessions whose deadline has passed; returns how many were handled.
+
+    Rows come from the in-memory session index, so this does not re-read the
+    tab unless the index has expired.
+    """
+
     clock = now or _utc_now()
-    rows = onboarding_sessions.load_all()
-    for row in rows:
+    handled = 0
+    for thread_id in _SCHEDULE.pop_due(clock):
         try:
+            row = await async_adapter.arun(onboarding_sessions.get_by_thread_id, thread_id)
+            if row is None:
+                continue
+            deadline = _next_deadline(row)
+            if deadline is None or deadline > clock:
+                # Activity since the deadline was queued pushed it out.
+                _SCHEDULE.update(row)
+                continue
             await _handle_row(bot, row, now=clock)
+            handled += 1
+            latest = await async_adapter.arun(onboarding_sessions.get_by_thread_id, thread_id)
+            if latest is not None:
+                _SCHEDULE.update(latest)
+                deadline = _next_deadline(latest)
+                if deadline is not None and deadline <= clock:
+                    # The action did not land (e.g. send failed); try again later.
+                    _SCHEDULE.reschedule(thread_id, clock + RETRY_AFTER)
         except Exception:
-            log.exception("onboarding idle watcher row failed", extra={"thread_id": row.get("thread_id")})
+            log.exception("onboarding idle watcher row failed", extra={"thread_id": thread_id})
+            _SCHEDULE.reschedule(thread_id, clock + RETRY_AFTER)
+    return handled
+
+
+async def _run_deadline_loop(bot: commands.Bot) -> None:
+    wakeup = _SCHEDULE.bind(asyncio.get_running_loop())
+    try:
+        await run_idle_scan(bot)
+    except Exception:
+        log.exception("onboarding idle watcher initial scan failed")
+
+    while True:
+        wakeup.clear()
+        next_due = _SCHEDULE.next_due()
+        timeout = None
+        if next_due is not None:
+            timeout = max(0.0, (next_due - _utc_now()).total_seconds())
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        await run_due_actions(bot)
 
 
-__all__ = ["ensure_idle_watcher", "run_idle_scan"]
+__all__ = ["ensure_idle_watcher", "run_due_actions", "run_idle_scan"]
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping, Sequence
+from typing import Any, Iterable, Mapping, Sequence
 
 from shared.sheets.onboarding_questions import Question
+from .evaluator import compile_rules
 from .evaluator import evaluate_navigation as _evaluate_navigation_v2
 from .evaluator import evaluate_visibility as _evaluate_visibility_v2
+from .evaluator import update_visibility, visibility_changes
 from .parser import (
     BinaryExpression,
     Expression,
@@ -19,14 +21,24 @@ from .parser import (
     parse_visibility_rules,
 )
 
-__all__ = ["evaluate_visibility", "next_index_by_rules", "validate_rules"]
+__all__ = [
+    "compile_rules",
+    "evaluate_visibility",
+    "next_index_by_rules",
+    "update_visibility",
+    "validate_rules",
+    "visibility_changes",
+]
 
 
 def evaluate_visibility(
     questions: Sequence[Question],
     answers: Mapping[str, Any],
+    *,
+    previous: Mapping[str, Mapping[str, Any]] | None = None,
+    changed: Iterable[str] | None = None,
 ) -> dict[str, dict[str, Any]]:
-    return _evaluate_visibility_v2(questions, answers)
+    return _evaluate_visibility_v2(questions, answers, previous=previous, changed=changed)
 
 
 def next_index_by_rules(
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterable as IterableABC
 from dataclasses import dataclass
 import logging
 import math
 import re
-from typing import Any, Mapping, Sequence
+from typing import Any, Callable, Iterable, Mapping, Sequence
 
 from modules.onboarding import diag
 from shared.sheets.onboarding_questions import Question
@@ -19,19 +20,17 @@ from .parser import (
     Identifier,
     ListLiteral,
     Literal,
-    NavDirective,
     RuleParseError,
     UnaryExpression,
-    VisibilityDirective,
     parse_nav_rules,
     parse_visibility_rules,
 )
 
 log = logging.getLogger("c1c.onboarding.rules")
 
-MAX_VISIBILITY_PASSES = 5
 MAX_NAV_HOPS = 10
 _VISIBILITY_PRIORITY = {"skip": 4, "require": 3, "optional": 2, "show": 1}
+_COMPILED_CACHE_SIZE = 8
 
 
 @dataclass
@@ -105,33 +104,178 @@ def _to_float(value: str) -> float:
     return float(value.strip())
 
 
-def _evaluate(expr: Expression, context: _EvalContext) -> Any:
+Compiled = Callable[[_EvalContext], Any]
+
+
+def _raiser(message: str) -> Compiled:
+    def _fail(_context: _EvalContext) -> Any:
+        raise ValueError(message)
+
+    return _fail
+
+
+def _compile(expr: Expression) -> Compiled:
+    """Turn an AST node into a closure; unsupported nodes raise when evaluated."""
+
     if isinstance(expr, Literal):
-        return expr.value
+        value = expr.value
+        return lambda _context: value
     if isinstance(expr, Identifier):
-        return context.tokens(expr.name)
+        name = expr.name
+        return lambda context: context.tokens(name)
     if isinstance(expr, ListLiteral):
-        return [_evaluate(item, context) for item in expr.items]
+        items = tuple(_compile(item) for item in expr.items)
+        return lambda context: [item(context) for item in items]
     if isinstance(expr, UnaryExpression):
-        operand = _evaluate(expr.operand, context)
-        if expr.op == "not":
-            return not _truthy(operand)
-        raise ValueError(f"unsupported unary operator: {expr.op}")
+        if expr.op != "not":
+            return _raiser(f"unsupported unary operator: {expr.op}")
+        operand = _compile(expr.operand)
+        return lambda context: not _truthy(operand(context))
     if isinstance(expr, BinaryExpression):
-        left = _evaluate(expr.left, context)
-        right = _evaluate(expr.right, context)
-        return _evaluate_binary(expr.op, left, right)
+        op = expr.op
+        left = _compile(expr.left)
+        right = _compile(expr.right)
+        return lambda context: _evaluate_binary(op, left(context), right(context))
     if isinstance(expr, FunctionCall):
-        if expr.name.lower() == "int":
-            if len(expr.args) != 1:
-                raise ValueError("int() expects a single argument")
-            value = _evaluate(expr.args[0], context)
-            token = _first_scalar(value)
+        if expr.name.lower() != "int":
+            return _raiser(f"unsupported function: {expr.name}")
+        if len(expr.args) != 1:
+            return _raiser("int() expects a single argument")
+        arg = _compile(expr.args[0])
+
+        def _int(context: _EvalContext) -> int:
+            token = _first_scalar(arg(context))
             if token is None:
                 raise ValueError("int() missing value")
             return int(float(token))
-        raise ValueError(f"unsupported function: {expr.name}")
-    raise ValueError("unsupported expression node")
+
+        return _int
+    return _raiser("unsupported expression node")
+
+
+def _identifiers(expr: Expression) -> set[str]:
+    found: set[str] = set()
+    stack: list[Expression] = [expr]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Identifier):
+            found.add(node.name)
+            found.add(node.name.lower())
+        elif isinstance(node, ListLiteral):
+            stack.extend(node.items)
+        elif isinstance(node, UnaryExpression):
+            stack.append(node.operand)
+        elif isinstance(node, BinaryExpression):
+            stack.extend((node.left, node.right))
+        elif isinstance(node, FunctionCall):
+            stack.extend(node.args)
+    return found
+
+
+@dataclass(frozen=True)
+class _CompiledVisibility:
+    kind: str
+    priority: int
+    evaluate: Compiled
+    raw: str
+
+
+@dataclass(frozen=True)
+class _CompiledNav:
+    target: str
+    evaluate: Compiled
+    raw: str
+
+
+class CompiledRules:
+    """Visibility and navigation rules for one question schema, parsed once.
+
+    ``dependents`` maps each answer key a visibility rule reads to the qids
+    owning those rules, so a changed answer only re-evaluates its dependents.
+    """
+
+    __slots__ = ("visibility", "navigation", "nav_errors", "dependents")
+
+    def __init__(self, questions: Sequence[Question]) -> None:
+        self.visibility: dict[str, tuple[_CompiledVisibility, ...]] = {}
+        self.navigation: dict[str, tuple[_CompiledNav, ...]] = {}
+        self.nav_errors: set[str] = set()
+        self.dependents: dict[str, set[str]] = {}
+        for question in questions:
+            qid = question.qid
+            text = getattr(question, "visibility_rules", None) or ""
+            try:
+                directives = parse_visibility_rules(text, qid=qid)
+            except RuleParseError as exc:
+                _log_rule_error(qid, text, "parse", str(exc))
+                directives = []
+            if directives:
+                self.visibility[qid] = tuple(
+                    _CompiledVisibility(
+                        kind=directive.kind,
+                        priority=_VISIBILITY_PRIORITY.get(directive.kind, 0),
+                        evaluate=_compile(directive.expression),
+                        raw=directive.raw,
+                    )
+                    for directive in directives
+                )
+                for directive in directives:
+                    for name in _identifiers(directive.expression):
+                        self.dependents.setdefault(name, set()).add(qid)
+            nav_text = getattr(question, "nav_rules", None) or ""
+            try:
+                nav_directives = parse_nav_rules(nav_text, qid=qid)
+            except RuleParseError as exc:
+                _log_rule_error(qid, nav_text, "parse", str(exc))
+                self.nav_errors.add(qid)
+                continue
+            if nav_directives:
+                self.navigation[qid] = tuple(
+                    _CompiledNav(
+                        target=directive.target,
+                        evaluate=_compile(directive.expression),
+                        raw=directive.raw,
+                    )
+                    for directive in nav_directives
+                )
+
+    def affected_by(self, changed: Iterable[str]) -> set[str]:
+        """Return qids whose visibility rules read any of the ``changed`` answers."""
+
+        affected: set[str] = set()
+        for key in changed:
+            affected.update(self.dependents.get(key, ()))
+            affected.update(self.dependents.get(str(key).lower(), ()))
+        return affected
+
+
+_COMPILED: "OrderedDict[tuple[tuple[str, str, str], ...], CompiledRules]" = OrderedDict()
+
+
+def compile_rules(questions: Sequence[Question]) -> CompiledRules:
+    """Return the compiled rules for ``questions``, reusing a cached snapshot.
+
+    The cache key is the rule text of every question, so a schema reload only
+    recompiles when a qid or rule actually changed.
+    """
+
+    key = tuple(
+        (
+            question.qid,
+            getattr(question, "visibility_rules", None) or "",
+            getattr(question, "nav_rules", None) or "",
+        )
+        for question in questions
+    )
+    compiled = _COMPILED.get(key)
+    if compiled is not None:
+        _COMPILED.move_to_end(key)
+        return compiled
+    compiled = CompiledRules(questions)
+    _COMPILED[key] = compiled
+    while len(_COMPILED) > _COMPILED_CACHE_SIZE:
+        _COMPILED.popitem(last=False)
+    return compiled
 
 
 def _first_scalar(value: Any) -> str | None:
@@ -263,58 +407,118 @@ def _evaluate_membership(left: Any, right: Any) -> bool:
 def evaluate_visibility(
     questions: Sequence[Question],
     answers: Mapping[str, Any],
+    *,
+    previous: Mapping[str, Mapping[str, Any]] | None = None,
+    changed: Iterable[str] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Return the visibility state for every question.
+
+    When ``previous`` (an earlier result for the same schema) and ``changed``
+    (the answer keys touched since) are given, only questions whose rules read
+    those answers are re-evaluated; the rest keep their previous state.
+    """
+
+    visibility, _flipped = _resolve_visibility(questions, answers, previous, changed)
+    return visibility
+
+
+def update_visibility(
+    questions: Sequence[Question],
+    answers: Mapping[str, Any],
+    previous: Mapping[str, Mapping[str, Any]] | None,
+    changed: Iterable[str],
+) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+    """Re-evaluate after ``changed`` answers; returns ``(visibility, diff)``.
+
+    ``diff`` holds only the entries whose state differs from ``previous`` and
+    is empty when nothing visible changed.
+    """
+
+    visibility, flipped = _resolve_visibility(questions, answers, previous, changed)
+    if flipped is None:
+        return visibility, visibility_changes(previous or {}, visibility)
+    return visibility, {qid: visibility[qid] for qid in flipped}
+
+
+def visibility_changes(
+    previous: Mapping[str, Mapping[str, Any]],
+    current: Mapping[str, Mapping[str, Any]],
 ) -> dict[str, dict[str, Any]]:
+    """Return the entries of ``current`` whose state differs from ``previous``."""
+
+    diff: dict[str, dict[str, Any]] = {}
+    for qid, entry in current.items():
+        prior = previous.get(qid) or {}
+        if prior.get("state") != entry.get("state") or bool(prior.get("required")) != bool(
+            entry.get("required")
+        ):
+            diff[qid] = dict(entry)
+    for qid in previous:
+        if qid not in current:
+            diff[qid] = {}
+    return diff
+
+
+def _resolve_visibility(
+    questions: Sequence[Question],
+    answers: Mapping[str, Any],
+    previous: Mapping[str, Mapping[str, Any]] | None,
+    changed: Iterable[str] | None,
+) -> tuple[dict[str, dict[str, Any]], list[str] | None]:
+    """Evaluate visibility; the flip list is ``None`` unless run incrementally."""
+
+    compiled = compile_rules(questions)
     base_states: dict[str, QuestionState] = {
         question.qid: QuestionState(visible=True, required=bool(question.required))
         for question in questions
     }
-    states: dict[str, QuestionState] = {
-        qid: QuestionState(state.visible, state.required)
-        for qid, state in base_states.items()
-    }
-    directives_by_qid: dict[str, list[VisibilityDirective]] = {}
-    for question in questions:
-        text = question.visibility_rules or ""
-        try:
-            directives_by_qid[question.qid] = parse_visibility_rules(text, qid=question.qid)
-        except RuleParseError as exc:
-            _log_rule_error(question.qid, text, "parse", str(exc))
-            directives_by_qid[question.qid] = []
+    pending: Iterable[str] = compiled.visibility
+    states: dict[str, QuestionState]
+    flipped: list[str] | None = None
+    if previous is not None and changed is not None and all(qid in previous for qid in base_states):
+        states = {
+            qid: QuestionState(bool(previous[qid].get("visible")), bool(previous[qid].get("required")))
+            for qid in base_states
+        }
+        pending = compiled.affected_by(changed)
+        flipped = []
+    else:
+        states = {
+            qid: QuestionState(state.visible, state.required)
+            for qid, state in base_states.items()
+        }
     context = _EvalContext(answers=answers)
-    for _pass in range(MAX_VISIBILITY_PASSES):
-        changed = False
-        for question in questions:
-            qid = question.qid
-            base_state = base_states[qid]
-            directives = directives_by_qid.get(qid, [])
-            selected: VisibilityDirective | None = None
-            selected_priority = -1
-            for directive in directives:
-                try:
-                    context_value = _evaluate(directive.expression, context)
-                except Exception as exc:
-                    _log_rule_error(qid, directive.raw, "eval", str(exc))
-                    continue
-                if not _truthy(context_value):
-                    continue
-                priority = _VISIBILITY_PRIORITY.get(directive.kind, 0)
-                if priority > selected_priority:
-                    selected = directive
-                    selected_priority = priority
-            current_state = states[qid]
-            if selected is None:
-                new_state = QuestionState(base_state.visible, base_state.required)
-                directive_label = "base"
-            else:
-                new_state = _apply_visibility(selected.kind, base_state)
-                directive_label = selected.raw
-            if new_state != current_state:
-                states[qid] = new_state
-                changed = True
-                _log_flip(qid, current_state, new_state, directive_label)
-        if not changed:
-            break
-    return {
+    # Directives read answers only, never other questions' states, so the
+    # affected set is closed after one step and one pass is the fixpoint.
+    for qid in pending:
+        directives = compiled.visibility.get(qid)
+        base_state = base_states.get(qid)
+        if base_state is None:
+            continue
+        selected: _CompiledVisibility | None = None
+        for directive in directives or ():
+            try:
+                context_value = directive.evaluate(context)
+            except Exception as exc:
+                _log_rule_error(qid, directive.raw, "eval", str(exc))
+                continue
+            if not _truthy(context_value):
+                continue
+            if selected is None or directive.priority > selected.priority:
+                selected = directive
+        current_state = states[qid]
+        if selected is None:
+            new_state = QuestionState(base_state.visible, base_state.required)
+            directive_label = "base"
+        else:
+            new_state = _apply_visibility(selected.kind, base_state)
+            directive_label = selected.raw
+        if new_state != current_state:
+            states[qid] = new_state
+            if flipped is not None:
+                flipped.append(qid)
+            _log_flip(qid, current_state, new_state, directive_label)
+    visibility = {
         qid: {
             "state": "skip"
             if not state.visible
@@ -324,6 +528,7 @@ def evaluate_visibility(
         }
         for qid, state in states.items()
     }
+    return visibility, flipped
 
 
 def _apply_visibility(kind: str, base_state: QuestionState) -> QuestionState:
@@ -345,6 +550,7 @@ def evaluate_navigation(
 ) -> int | None:
     if current_index < 0 or current_index >= len(questions):
         return None
+    compiled = compile_rules(questions)
     qid_to_index = {question.qid: idx for idx, question in enumerate(questions)}
     visited: set[str] = set()
     hops = 0
@@ -352,19 +558,14 @@ def evaluate_navigation(
     idx = current_index
     while hops < MAX_NAV_HOPS:
         question = questions[idx]
-        directives: list[NavDirective]
-        try:
-            directives = parse_nav_rules(question.nav_rules or "", qid=question.qid)
-        except RuleParseError as exc:
-            _log_rule_error(question.qid, question.nav_rules or "", "parse", str(exc))
-            break
+        directives = compiled.navigation.get(question.qid)
         if not directives:
             break
         context = _EvalContext(answers=answers, current_qid=question.qid)
         triggered = False
         for directive in directives:
             try:
-                result = _evaluate(directive.expression, context)
+                result = directive.evaluate(context)
             except Exception as exc:
                 _log_rule_error(question.qid, directive.raw, "eval", str(exc))
                 continue
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Tuple
 
+from shared.sheets import async_adapter
 from shared.sheets import onboarding_sessions as sess_sheet
 
 log = logging.getLogger(__name__)
@@ -93,14 +95,16 @@ class Session:
             "auto_closed_at": self.auto_closed_at.isoformat() if self.auto_closed_at else None,
         }
 
-    def save_to_sheet(self) -> None:
-        payload = {
+    def sheet_payload(self) -> dict[str, Any]:
+        """Return the row payload for :func:`sess_sheet.save` as of now."""
+
+        return {
             "user_id": str(self.applicant_id),
             "thread_id": str(self.thread_id),
             "thread_name": self.thread_name or "",
             "panel_message_id": int(self.panel_message_id or 0),
             "step_index": int(self.step_index),
-            "answers": self.answers,
+            "answers": dict(self.answers),
             "completed": bool(self.completed),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "updated_at": _serialize_dt(self.updated_at),
@@ -112,11 +116,29 @@ class Session:
             else None,
             "auto_closed_at": self.auto_closed_at.isoformat() if self.auto_closed_at else None,
         }
-        sess_sheet.save(payload)
+
+    def save_to_sheet(self) -> None:
+        sess_sheet.save(self.sheet_payload())
+
+    async def asave_to_sheet(self) -> None:
+        """Persist through the Sheets executor; newer saves for the thread supersede queued ones."""
+
+        await persist_queue.submit(self.thread_id, self.sheet_payload())
 
     @classmethod
     def load_from_sheet(cls, applicant_id: int, thread_id: int) -> Optional["Session"]:
         row = sess_sheet.load(int(applicant_id), int(thread_id))
+        return cls._from_sheet_row(applicant_id, thread_id, row)
+
+    @classmethod
+    async def aload_from_sheet(cls, applicant_id: int, thread_id: int) -> Optional["Session"]:
+        row = await async_adapter.arun(sess_sheet.load, int(applicant_id), int(thread_id))
+        return cls._from_sheet_row(applicant_id, thread_id, row)
+
+    @classmethod
+    def _from_sheet_row(
+        cls, applicant_id: int, thread_id: int, row: Optional[Dict[str, Any]]
+    ) -> Optional["Session"]:
         if not row:
             return None
         panel_id = row.get("panel_message_id") or None
@@ -179,6 +201,66 @@ def _serialize_dt(value: datetime | None) -> str | None:
     return normalized.isoformat()
 
 
+class SessionPersistQueue:
+    """Per-thread latest-state-wins writer for onboarding session rows.
+
+    At most one write per thread is in flight. Payloads submitted meanwhile
+    replace each other, so only the newest state is written next; every
+    superseded caller resolves with that write.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: Dict[int, dict[str, Any]] = {}
+        self._waiters: Dict[int, list[asyncio.Future[None]]] = {}
+        self._workers: Dict[int, asyncio.Task[None]] = {}
+
+    def _bind(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._pending.clear()
+            self._waiters.clear()
+            self._workers.clear()
+        return loop
+
+    async def submit(self, thread_id: int, payload: dict[str, Any]) -> None:
+        loop = self._bind()
+        key = int(thread_id)
+        waiter: asyncio.Future[None] = loop.create_future()
+        self._pending[key] = payload
+        self._waiters.setdefault(key, []).append(waiter)
+        worker = self._workers.get(key)
+        if worker is None or worker.done():
+            self._workers[key] = loop.create_task(self._drain(key))
+        await asyncio.shield(waiter)
+
+    async def _drain(self, key: int) -> None:
+        try:
+            while key in self._pending:
+                payload = self._pending.pop(key)
+                waiters = self._waiters.pop(key, [])
+                try:
+                    await async_adapter.arun(sess_sheet.save, payload)
+                except Exception as exc:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(exc)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(None)
+        finally:
+            if self._workers.get(key) is asyncio.current_task():
+                self._workers.pop(key, None)
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+
+persist_queue = SessionPersistQueue()
+
+
 class SessionStore:
     """In-memory store for onboarding wizard sessions."""
 
@@ -226,7 +308,7 @@ async def ensure_session_for_thread(
 
     normalized_updated = _normalize_ts(updated_at)
     try:
-        existing = Session.load_from_sheet(int(user_id), int(thread_id))
+        existing = await Session.aload_from_sheet(int(user_id), int(thread_id))
     except Exception:
         log.exception(
             "failed to load onboarding session", extra={"thread_id": thread_id, "user_id": user_id}
@@ -246,7 +328,7 @@ async def ensure_session_for_thread(
             updated = True
         if updated:
             try:
-                existing.save_to_sheet()
+                await existing.asave_to_sheet()
             except Exception:
                 log.exception(
                     "failed to persist onboarding session timestamp",
@@ -264,7 +346,7 @@ async def ensure_session_for_thread(
         updated_at=normalized_updated or utc_now(),
     )
     try:
-        session.save_to_sheet()
+        await session.asave_to_sheet()
     except Exception:
         log.exception(
             "failed to create onboarding session", extra={"thread_id": thread_id, "user_id": user_id}
@@ -272,5 +354,13 @@ async def ensure_session_for_thread(
     return session
 
 
-__all__ = ["Session", "SessionStore", "store", "utc_now", "ensure_session_for_thread"]
+__all__ = [
+    "Session",
+    "SessionPersistQueue",
+    "SessionStore",
+    "ensure_session_for_thread",
+    "persist_queue",
+    "store",
+    "utc_now",
+]
 
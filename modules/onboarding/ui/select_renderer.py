@@ -33,7 +33,8 @@ class SelectQuestionView(discord.ui.View):
         super().__init__(timeout=timeout)
         self.questions = list(questions)
         self.visibility = visibility
-        self.answers = answers or {}
+        # Keep the caller's mapping so in-place answer updates reach this view.
+        self.answers = answers if answers is not None else {}
         self.on_change: SelectChangeCallback | None = None
         self.on_complete: SelectCompleteCallback | None = None
         self.on_page_change: SelectPageChangeCallback | None = None
@@ -215,7 +216,7 @@ def build_select_view(
     view = SelectQuestionView(
         questions=visible_questions,
         visibility=visibility,
-        answers=answers or {},
+        answers=answers if answers is not None else {},
         interaction_check=interaction_check,
         page=page,
     )
@@ -9,7 +9,7 @@ from time import monotonic
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Set
+from typing import Awaitable, Callable, Dict, List, Optional, Set
 
 import discord
 from discord import RawReactionActionEvent
@@ -40,6 +40,7 @@ from shared.config import (
 from shared.logfmt import channel_label
 from shared.logs import log_lifecycle
 from modules.recruitment import availability
+from shared.sheets import async_adapter
 from shared.sheets import onboarding as onboarding_sheets
 from shared.sheets import onboarding_sessions
 from shared.sheets import welcome_tickets
@@ -51,6 +52,9 @@ log = logging.getLogger("c1c.onboarding.welcome_watcher")
 
 _REMINDER_JOB_NAME = "welcome_incomplete_scan"
 _REMINDER_INTERVAL_SECONDS = 900
+# Threads processed at once by the reminder scan; discord.py still serialises
+# per-route rate limits, this only caps how many sends/edits are in flight.
+_SCAN_CONCURRENCY = 4
 _FIRST_REMINDER_AFTER = timedelta(hours=3)
 _WARNING_AFTER = timedelta(hours=24)
 _AUTO_CLOSE_AFTER = timedelta(hours=36)
@@ -362,7 +366,7 @@ async def persist_session_for_thread(
             if session is not None and panel_message_id is not None:
                 session.panel_message_id = panel_message_id
                 try:
-                    session.save_to_sheet()
+                    await session.asave_to_sheet()
                 except Exception:
                     log.exception(
                         "failed to persist onboarding session panel id",
@@ -443,6 +447,21 @@ async def _scan_incomplete_threads(bot: commands.Bot) -> None:
     await bot.wait_until_ready()
 
     now = datetime.now(timezone.utc)
+    scan_start = monotonic()
+    prefetched = False
+
+    async def _prefetch_sessions() -> None:
+        nonlocal prefetched
+        if prefetched:
+            return
+        prefetched = True
+        try:
+            await async_adapter.arun(onboarding_sessions.prefetch)
+        except Exception:
+            log.debug("welcome reminder: session prefetch failed", exc_info=True)
+
+    welcome_timings: list[int] = []
+    promo_timings: list[int] = []
 
     if feature_flags.is_enabled("welcome_dialog") and feature_flags.is_enabled("recruitment_welcome"):
         channel_id = get_welcome_channel_id()
@@ -453,8 +472,11 @@ async def _scan_incomplete_threads(bot: commands.Bot) -> None:
 
         if channel_int is not None:
             threads = await _collect_threads(bot, channel_int, scope_check=thread_scopes.is_welcome_parent)
-            for thread in threads:
-                await _process_incomplete_thread(bot, thread, now)
+            if threads:
+                await _prefetch_sessions()
+            welcome_timings = await _process_threads_bounded(
+                threads, lambda thread: _process_incomplete_thread(bot, thread, now)
+            )
 
     if feature_flags.is_enabled("promo_enabled") and feature_flags.is_enabled("enable_promo_hook"):
         promo_channel = get_promo_channel_id()
@@ -465,8 +487,59 @@ async def _scan_incomplete_threads(bot: commands.Bot) -> None:
 
         if promo_channel_int is not None:
             threads = await _collect_threads(bot, promo_channel_int, scope_check=thread_scopes.is_promo_parent)
-            for thread in threads:
-                await _process_promo_thread(bot, thread, now)
+            if threads:
+                await _prefetch_sessions()
+            promo_timings = await _process_threads_bounded(
+                threads, lambda thread: _process_promo_thread(bot, thread, now)
+            )
+
+    timings = welcome_timings + promo_timings
+    log.info(
+        "welcome reminder scan finished",
+        extra={
+            "duration_ms": int((monotonic() - scan_start) * 1000),
+            "welcome_threads": len(welcome_timings),
+            "promo_threads": len(promo_timings),
+            "thread_max_ms": max(timings, default=0),
+            "thread_avg_ms": sum(timings) // len(timings) if timings else 0,
+        },
+    )
+
+
+async def _process_threads_bounded(
+    threads: List[discord.Thread],
+    worker: Callable[[discord.Thread], Awaitable[None]],
+    *,
+    limit: int = _SCAN_CONCURRENCY,
+) -> list[int]:
+    """Run ``worker`` over ``threads`` with at most ``limit`` in flight.
+
+    Returns per-thread durations in milliseconds, in ``threads`` order. A
+    failure in one thread is logged and does not stop the others.
+    """
+
+    semaphore = asyncio.Semaphore(max(1, limit))
+    timings = [0] * len(threads)
+
+    async def _run(position: int, thread: discord.Thread) -> None:
+        async with semaphore:
+            start = monotonic()
+            try:
+                await worker(thread)
+            except Exception:
+                log.exception(
+                    "welcome reminder: thread scan failed",
+                    extra={"thread_id": getattr(thread, "id", None)},
+                )
+            finally:
+                timings[position] = int((monotonic() - start) * 1000)
+                log.debug(
+                    "welcome reminder: thread scanned",
+                    extra={"thread_id": getattr(thread, "id", None), "elapsed_ms": timings[position]},
+                )
+
+    await asyncio.gather(*(_run(position, thread) for position, thread in enumerate(threads)))
+    return timings
 
 
 async def _collect_threads(
@@ -514,7 +587,7 @@ async def _resolve_target_user(thread: discord.Thread, parts: ThreadNameParts) -
     return target_id, parts.username
 
 
-def _persist_reminder_state(session: Session | None, *, action: str, timestamp: datetime) -> None:
+async def _persist_reminder_state(session: Session | None, *, action: str, timestamp: datetime) -> None:
     if session is None:
         return
 
@@ -533,7 +606,7 @@ def _persist_reminder_state(session: Session | None, *, action: str, timestamp:
 
     session._touch(timestamp=timestamp)
     try:
-        session.save_to_sheet()
+        await session.asave_to_sheet()
     except Exception:
         log.exception(
             "failed to persist welcome reminder state",
@@ -682,7 +755,7 @@ async def _process_incomplete_thread(bot: commands.Bot, thread: discord.Thread,
                 extra={"thread_id": getattr(thread, "id", None)},
             )
             return
-        _persist_reminder_state(session, action=action, timestamp=now)
+        await _persist_reminder_state(session, action=action, timestamp=now)
         if watcher and context:
             await watcher._touch_welcome_sheet_for_reminder(
                 phase="reminder_3h",
@@ -711,7 +784,7 @@ async def _process_incomplete_thread(bot: commands.Bot, thread: discord.Thread,
                 extra={"thread_id": getattr(thread, "id", None)},
             )
             return
-        _persist_reminder_state(session, action=action, timestamp=now)
+        await _persist_reminder_state(session, action=action, timestamp=now)
         if watcher and context:
             await watcher._touch_welcome_sheet_for_reminder(
                 phase="reminder_3h",
@@ -742,7 +815,7 @@ async def _process_incomplete_thread(bot: commands.Bot, thread: discord.Thread,
                 extra={"thread_id": getattr(thread, "id", None)},
             )
             return
-        _persist_reminder_state(session, action=action, timestamp=now)
+        await _persist_reminder_state(session, action=action, timestamp=now)
         if watcher and context:
             await watcher._touch_welcome_sheet_for_reminder(
                 phase="reminder_24h",
@@ -780,7 +853,7 @@ async def _process_incomplete_thread(bot: commands.Bot, thread: discord.Thread,
                 extra={"thread_id": getattr(thread, "id", None)},
             )
             return
-        _persist_reminder_state(session, action=action, timestamp=now)
+        await _persist_reminder_state(session, action=action, timestamp=now)
         if watcher and context:
             await watcher._touch_welcome_sheet_for_reminder(
                 phase="reminder_24h",
@@ -810,7 +883,7 @@ async def _process_incomplete_thread(bot: commands.Bot, thread: discord.Thread,
             "If you still need a clan later, you're welcome to open a new ticket."
         )
 
-        _persist_reminder_state(session, action=action, timestamp=now)
+        await _persist_reminder_state(session, action=action, timestamp=now)
         watcher = bot.get_cog("WelcomeTicketWatcher")
         if watcher is not None:
             context = await watcher._ensure_context(thread)
@@ -860,7 +933,7 @@ async def _process_incomplete_thread(bot: commands.Bot, thread: discord.Thread,
             f"Please remove {mention} from the server."
         )
 
-        _persist_reminder_state(session, action=action, timestamp=now)
+        await _persist_reminder_state(session, action=action, timestamp=now)
         watcher = bot.get_cog("WelcomeTicketWatcher")
         if watcher is not None:
             context = await watcher._ensure_context(thread)
@@ -961,7 +1034,7 @@ async def _process_promo_thread(bot: commands.Bot, thread: discord.Thread, now:
                 extra={"thread_id": getattr(thread, "id", None)},
             )
             return
-        _persist_reminder_state(session, action=action, timestamp=now)
+        await _persist_reminder_state(session, action=action, timestamp=now)
         if watcher and context:
             await watcher._touch_promo_sheet_for_reminder(
                 phase="reminder_3h",
@@ -990,7 +1063,7 @@ async def _process_promo_thread(bot: commands.Bot, thread: discord.Thread, now:
                 extra={"thread_id": getattr(thread, "id", None)},
             )
             return
-        _persist_reminder_state(session, action=action, timestamp=now)
+        await _persist_reminder_state(session, action=action, timestamp=now)
         if watcher and context:
             await watcher._touch_promo_sheet_for_reminder(
                 phase="reminder_3h",
@@ -1021,7 +1094,7 @@ async def _process_promo_thread(bot: commands.Bot, thread: discord.Thread, now:
                 extra={"thread_id": getattr(thread, "id", None)},
             )
             return
-        _persist_reminder_state(session, action=action, timestamp=now)
+        await _persist_reminder_state(session, action=action, timestamp=now)
         if watcher and context:
             await watcher._touch_promo_sheet_for_reminder(
                 phase="reminder_24h",
@@ -1059,7 +1132,7 @@ async def _process_promo_thread(bot: commands.Bot, thread: discord.Thread, now:
                 extra={"thread_id": getattr(thread, "id", None)},
             )
             return
-        _persist_reminder_state(session, action=action, timestamp=now)
+        await _persist_reminder_state(session, action=action, timestamp=now)
         if watcher and context:
             await watcher._touch_promo_sheet_for_reminder(
                 phase="reminder_24h",
@@ -1089,7 +1162,7 @@ async def _process_promo_thread(bot: commands.Bot, thread: discord.Thread, now:
             "If you still want to request a move later, feel free to open a new promo ticket anytime."
         )
 
-        _persist_reminder_state(session, action=action, timestamp=now)
+        await _persist_reminder_state(session, action=action, timestamp=now)
         watcher = bot.get_cog("PromoTicketWatcher")
         if watcher is not None:
             context = await watcher._ensure_context(thread)
@@ -1137,7 +1210,7 @@ async def _process_promo_thread(bot: commands.Bot, thread: discord.Thread, now:
             "If you still want to request a move later, feel free to open a new promo ticket anytime."
         )
 
-        _persist_reminder_state(session, action=action, timestamp=now)
+        await _persist_reminder_state(session, action=action, timestamp=now)
         watcher = bot.get_cog("PromoTicketWatcher")
         if watcher is not None:
             context = await watcher._ensure_context(thread)
@@ -2619,7 +2692,7 @@ class WelcomeTicketWatcher(commands.Cog):
         raw_tags: List[str] = []
         bucket = sheets_cache.get_bucket("clan_tags")
         if bucket is not None:
-            value = bucket.value
+            value = sheets_cache.peek("clan_tags")
             if not value:
                 try:
                     await sheets_cache.refresh_now("clan_tags", actor="welcome_watcher")
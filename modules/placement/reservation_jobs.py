@@ -456,7 +456,7 @@ async def release_reservations_for_thread(
         return
 
     try:
-        ledger = await reservations.load_reservation_ledger()
+        ledger = await reservations.get_reservation_ledger()
     except Exception:
         log.exception("failed to load reservations for thread release")
         return
@@ -469,7 +469,7 @@ async def release_reservations_for_thread(
     if thread_snowflake is None:
         return
 
-    matches = [row for row in ledger.rows if row.is_active and _to_int(row.thread_id) == thread_snowflake]
+    matches = ledger.active_for_thread(thread_snowflake)
     if not matches:
         return
 
@@ -1337,7 +1337,7 @@ class ReservationCog(commands.Cog):
 
     async def _handle_global_reservations(self, ctx: commands.Context) -> None:
         try:
-            ledger = await reservations.load_reservation_ledger()
+            ledger = await reservations.get_reservation_ledger()
         except Exception:
             log.exception("failed to load ledger for global reservations")
             await ctx.reply(
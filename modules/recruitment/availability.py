@@ -6,9 +6,9 @@ import logging
 import re
 from typing import Sequence
 
-from shared.sheets import async_core
 from shared.sheets import recruitment
 from shared.sheets import reservations
+from shared.sheets import write_behind
 
 log = logging.getLogger(__name__)
 
@@ -38,13 +38,12 @@ async def adjust_manual_open_spots(clan_tag: str, delta: int) -> int:
 
     sheet_id = recruitment.get_recruitment_sheet_id()
     tab_name = recruitment.get_clans_tab_name()
-    worksheet = await async_core.aget_worksheet(sheet_id, tab_name)
     column = _column_label(open_index)
-    await async_core.acall_with_backoff(
-        worksheet.update,
+    await write_behind.awrite_range(
+        sheet_id,
+        tab_name,
         f"{column}{sheet_row}",
         [[str(new_value)]],
-        value_input_option="RAW",
     )
 
     recruitment.update_cached_clan_row(sheet_row, updated_row)
@@ -87,7 +86,6 @@ async def recompute_clan_availability(
 
     sheet_id = recruitment.get_recruitment_sheet_id()
     tab_name = recruitment.get_clans_tab_name()
-    worksheet = await async_core.aget_worksheet(sheet_id, tab_name)
 
     payload = [
         [
@@ -97,11 +95,13 @@ async def recompute_clan_availability(
             reservation_summary,
         ]
     ]
-    await async_core.acall_with_backoff(
-        worksheet.update,
+    # Bursts of recomputes (e.g. several reservations expiring together) are
+    # coalesced into one batch update by the write-behind queue.
+    await write_behind.awrite_range(
+        sheet_id,
+        tab_name,
         f"AF{sheet_row}:AI{sheet_row}",
         payload,
-        value_input_option="RAW",
     )
 
     recruitment.update_cached_clan_row(sheet_row, updated_row)
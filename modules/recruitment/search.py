@@ -17,20 +17,27 @@ from shared.sheets.recruitment import (
 
 from modules.recruitment import search_helpers
 from modules.recruitment.search_helpers import (
+    ClanFacetIndex,
     parse_inactives_num,
     parse_spots_num,
-    row_matches,
 )
 
 __all__ = [
     "fetch_roster_records",
     "filter_records",
+    "get_facet_index",
     "normalize_records",
     "enforce_inactives_only",
 ]
 
 log = logging.getLogger(__name__)
 
+# Single-slot cache: the roster list only changes when the "clans" bucket
+# refreshes or a row is patched, both of which swap record objects.
+_FACET_INDEX: ClanFacetIndex | None = None
+_FACET_RECORDS: tuple[RecruitmentClanRecord, ...] = ()
+_FACET_KEY: tuple[int, ...] = ()
+
 
 async def fetch_roster_records(*, force: bool = False) -> list[RecruitmentClanRecord]:
     """Load normalized clan roster records from Sheets."""
@@ -124,33 +131,48 @@ def filter_records(
     """Apply sheet and roster-mode filters to ``records``."""
 
     normalized = normalize_records(records)
-    matches: list[RecruitmentClanRecord] = []
     if not normalized:
-        return matches
+        return []
+
+    index = get_facet_index(normalized)
+    positions = index.match(
+        cb,
+        hydra,
+        chimera,
+        cvc,
+        siege,
+        playstyle,
+        roster_mode,
+    )
+    return [normalized[position] for position in positions]
 
-    for record in normalized:
-        try:
-            if not row_matches(
-                record.row,
-                cb,
-                hydra,
-                chimera,
-                cvc,
-                siege,
-                playstyle,
-            ):
-                continue
-            if roster_mode == "open" and record.open_spots <= 0:
-                continue
-            if roster_mode == "full" and record.open_spots > 0:
-                continue
-            if roster_mode == "inactives" and record.inactives <= 0:
-                continue
-            matches.append(record)
-        except Exception:
-            continue
 
-    return matches
+def get_facet_index(records: Sequence[RecruitmentClanRecord]) -> ClanFacetIndex:
+    """Return the facet index for ``records``, rebuilding it when the roster changes.
+
+    The cache key is the identity of each record; the cached tuple keeps those
+    objects alive so the ids cannot be recycled while the index is in use.
+    """
+
+    global _FACET_INDEX, _FACET_RECORDS, _FACET_KEY
+
+    key = tuple(id(record) for record in records)
+    if _FACET_INDEX is not None and key == _FACET_KEY:
+        return _FACET_INDEX
+
+    index = ClanFacetIndex(
+        [record.row for record in records],
+        open_spots=[record.open_spots for record in records],
+        inactives=[record.inactives for record in records],
+    )
+    _FACET_INDEX = index
+    _FACET_RECORDS = tuple(records)
+    _FACET_KEY = key
+    log.debug(
+        "recruitment facet index rebuilt",
+        extra={"rows": index.size, "searchable": bin(index.searchable).count("1")},
+    )
+    return index
 
 
 def enforce_inactives_only(
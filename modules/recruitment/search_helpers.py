@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Optional, Sequence
+from typing import Any, Dict, Iterator, Optional, Sequence
 
 __all__ = [
+    "ClanFacetIndex",
     "parse_spots_num",
     "parse_inactives_num",
     "row_matches",
@@ -169,14 +170,7 @@ def row_matches(
 ) -> bool:
     """Return ``True`` if ``row`` satisfies the requested filters."""
 
-    if len(row) <= IDX_AB:
-        return False
-    if _is_header_row(row):
-        return False
-    if not (row[COL_B_CLAN] or "").strip():
-        return False
-    roster_cell = row[COL_E_SPOTS] if len(row) > COL_E_SPOTS else ""
-    if not str(roster_cell or "").strip():
+    if not _row_searchable(row):
         return False
     return (
         _cell_has_diff(row[COL_P_CB], cb)
@@ -188,6 +182,119 @@ def row_matches(
     )
 
 
+def _row_searchable(row: Sequence[str]) -> bool:
+    if len(row) <= IDX_AB:
+        return False
+    if _is_header_row(row):
+        return False
+    if not (row[COL_B_CLAN] or "").strip():
+        return False
+    roster_cell = row[COL_E_SPOTS] if len(row) > COL_E_SPOTS else ""
+    return bool(str(roster_cell or "").strip())
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class ClanFacetIndex:
+    """Posting bitsets over roster rows so a search is a chain of ``&`` operations.
+
+    Bit ``i`` of every mask refers to ``rows[i]``. Flag columns (CvC/Siege),
+    playstyles and roster flags are indexed up front; difficulty postings for
+    CB/Hydra/Chimera are computed on first use per token and memoised, which
+    keeps the substring rules of :func:`_cell_has_diff` exact.
+    """
+
+    _DIFF_COLUMNS = (COL_P_CB, COL_Q_HYDRA, COL_R_CHIMERA)
+
+    def __init__(
+        self,
+        rows: Sequence[Sequence[str]],
+        *,
+        open_spots: Sequence[int],
+        inactives: Sequence[int],
+    ) -> None:
+        self.size = len(rows)
+        self._diff_cells: Dict[int, list[str]] = {col: [] for col in self._DIFF_COLUMNS}
+        self._diff_postings: Dict[int, Dict[str, int]] = {col: {} for col in self._DIFF_COLUMNS}
+        self._flag_postings: Dict[int, Dict[str, int]] = {COL_S_CVC: {}, COL_T_SIEGE: {}}
+        self._style_postings: Dict[str, int] = {}
+        self.searchable = 0
+        self.open = 0
+        self.has_inactives = 0
+
+        for index, row in enumerate(rows):
+            bit = 1 << index
+            if open_spots[index] > 0:
+                self.open |= bit
+            if inactives[index] > 0:
+                self.has_inactives |= bit
+            try:
+                if not _row_searchable(row):
+                    raise ValueError("row not searchable")
+                for col in self._DIFF_COLUMNS:
+                    self._diff_cells[col].append(row[col])
+                for col, postings in self._flag_postings.items():
+                    key = (row[col] or "").strip()
+                    postings[key] = postings.get(key, 0) | bit
+                for style in _split_styles(row[COL_U_STYLE]):
+                    self._style_postings[style] = self._style_postings.get(style, 0) | bit
+            except Exception:
+                for col in self._DIFF_COLUMNS:
+                    self._diff_cells[col].append("")
+                continue
+            self.searchable |= bit
+
+    def _diff_mask(self, col: int, token: Optional[str]) -> Optional[int]:
+        if not token:
+            return None
+        key = _map_token(token)
+        postings = self._diff_postings[col]
+        mask = postings.get(key)
+        if mask is None:
+            mask = 0
+            for index, cell in enumerate(self._diff_cells[col]):
+                if _cell_has_diff(cell, token):
+                    mask |= 1 << index
+            postings[key] = mask
+        return mask
+
+    def match(
+        self,
+        cb: Optional[str],
+        hydra: Optional[str],
+        chimera: Optional[str],
+        cvc: Optional[str],
+        siege: Optional[str],
+        playstyle: Optional[str],
+        roster_mode: Optional[str] = None,
+    ) -> list[int]:
+        """Return the matching row positions in sheet order."""
+
+        mask = self.searchable
+        for col, token in zip(self._DIFF_COLUMNS, (cb, hydra, chimera)):
+            posting = self._diff_mask(col, token)
+            if posting is not None:
+                mask &= posting
+        for col, expected in ((COL_S_CVC, cvc), (COL_T_SIEGE, siege)):
+            if expected is not None:
+                mask &= self._flag_postings[col].get(expected, 0)
+        canon = _canon_style(playstyle) if playstyle else None
+        if canon:
+            mask &= self._style_postings.get(canon, 0)
+        if roster_mode == "open":
+            mask &= self.open
+        elif roster_mode == "full":
+            mask &= ~self.open
+        elif roster_mode == "inactives":
+            mask &= self.has_inactives
+        return list(_iter_bits(mask))
+
+
 def format_filters_footer(
     cb: Optional[str],
     hydra: Optional[str],
@@ -36,6 +36,24 @@ class CacheSnapshot:
     ttl_expired: Optional[bool]
     item_count: Optional[int]
     metadata: Optional[Mapping[str, str]] = None
+    hits: Optional[int] = None
+    stale_hits: Optional[int] = None
+    misses: Optional[int] = None
+    refreshes: Optional[int] = None
+    refresh_failures: Optional[int] = None
+    latency_avg_ms: Optional[int] = None
+    latency_histogram: Optional[Mapping[str, int]] = None
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        """Share of reads served fresh from cache, or ``None`` before any read."""
+
+        if self.hits is None or self.stale_hits is None or self.misses is None:
+            return None
+        total = self.hits + self.stale_hits + self.misses
+        if total == 0:
+            return None
+        return self.hits / total
 
 
 @dataclass(frozen=True)
@@ -130,6 +148,20 @@ def _build_snapshot(name: str, raw: Optional[Dict[str, object]]) -> CacheSnapsho
             if cleaned:
                 metadata = cleaned
 
+    counters: Dict[str, Optional[int]] = {}
+    for key in ("hits", "stale_hits", "misses", "refreshes", "refresh_failures", "latency_avg_ms"):
+        counters[key] = _to_int(raw.get(key)) if available else None
+
+    histogram: Optional[Mapping[str, int]] = None
+    if available:
+        hist_raw = raw.get("latency_histogram")
+        if isinstance(hist_raw, Mapping):
+            histogram = {
+                str(key): count
+                for key, count in hist_raw.items()
+                if isinstance(count, int)
+            }
+
     return CacheSnapshot(
         name=name,
         available=available,
@@ -150,6 +182,8 @@ def _build_snapshot(name: str, raw: Optional[Dict[str, object]]) -> CacheSnapsho
         ttl_expired=ttl_expired,
         item_count=item_count,
         metadata=metadata,
+        latency_histogram=histogram,
+        **counters,
     )
 
 
@@ -218,9 +252,14 @@ def _derive_error_text(snapshot: CacheSnapshot) -> Optional[str]:
     return None
 
 
-async def refresh_now(name: str, actor: Optional[str] = None) -> RefreshResult:
+async def refresh_now(
+    name: str, actor: Optional[str] = None, *, stale_only: bool = False
+) -> RefreshResult:
     """Trigger an immediate refresh and return result metadata.
 
+    With ``stale_only`` a bucket that is still fresh is left alone and one
+    that is already refreshing is awaited rather than loaded again.
+
     Notes:
         Some cache loaders record failures in the bucket snapshot (last_result/last_error)
         without raising. We therefore inspect the snapshot after the call and flip `ok`
@@ -233,7 +272,10 @@ async def refresh_now(name: str, actor: Optional[str] = None) -> RefreshResult:
     ok = True
     trigger = "cron" if actor in {"cron", "scheduler"} else "manual"
     try:
-        await cache_service.cache.refresh_now(bucket, trigger=trigger, actor=actor)
+        if stale_only:
+            await cache_service.cache.refresh_if_stale(bucket, trigger=trigger, actor=actor)
+        else:
+            await cache_service.cache.refresh_now(bucket, trigger=trigger, actor=actor)
     except asyncio.CancelledError:
         raise
     except Exception as exc:  # pragma: no cover - defensive guard
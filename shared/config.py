@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import re
 import sys
+import threading
+import time
 from typing import Dict, Iterable, Mapping, Optional, Sequence, Set
 
 from config import runtime as _runtime
@@ -80,6 +83,10 @@ __all__ = [
     "get_emoji_max_bytes",
     "get_emoji_pad_size",
     "get_emoji_pad_box",
+    "get_emoji_pad_cache_bytes",
+    "get_emoji_pad_cache_dir",
+    "get_emoji_pad_max_pending",
+    "get_emoji_pad_workers",
     "get_tag_badge_px",
     "get_tag_badge_box",
     "get_strict_emoji_proxy",
@@ -90,6 +97,10 @@ __all__ = [
     "redact_value",
     "merge_onboarding_config_early",
     "onboarding_config_merge_count",
+    "aload_sheet_config",
+    "start_sheet_config_load",
+    "await_sheet_config",
+    "sheet_config_ready",
     "get_ticket_tool_bot_id",
     "features",
     "update_feature_flags_snapshot",
@@ -127,6 +138,13 @@ LOG_CHANNEL_ID: Optional[int] | None = None
 
 _LAST_ONBOARDING_CONFIG_KEYS = 0
 
+# Sheets-backed Config tab values, overlaid on the env config in this order.
+_SHEET_SOURCES = ("onboarding", "milestones")
+_SHEET_VALUES: Dict[str, Dict[str, str]] = {}
+_SHEETS_READY = threading.Event()
+_SHEETS_TASK: Optional["asyncio.Task[int]"] = None
+_SHEETS_WAIT_SEC = 15.0
+
 _SECRET_KEYS = {
     "DISCORD_TOKEN",
     "GSPREAD_CREDENTIALS",
@@ -331,25 +349,25 @@ def _load_onboarding_config_values() -> tuple[str, Dict[str, str]]:
     return sheet_id, normalized
 
 
-def _merge_onboarding_tab(config: Dict[str, object]) -> None:
-    """Merge the onboarding questions tab name from sheet config."""
+def _fetch_onboarding_tab() -> Optional[Dict[str, str]]:
+    """Return the onboarding Config tab values.
+
+    ``{}`` means the sheet is not configured; ``None`` means the read failed.
+    """
 
     try:
-        sheet_id, values = _load_onboarding_config_values()
+        _, values = _load_onboarding_config_values()
     except RuntimeError:
         log.debug("config: onboarding sheet id not configured; skipping tab merge")
-        return
-    except Exception as exc:  # pragma: no cover - network or credential failures
+        return {}
+    except Exception as exc:
         log.warning("config: failed to load onboarding Config tab: %s", exc)
-        return
-
-    if not values:
-        return
-
-    config.update(values)
+        return None
 
-    global _LAST_ONBOARDING_CONFIG_KEYS
-    _LAST_ONBOARDING_CONFIG_KEYS = len(values)
+    if values:
+        global _LAST_ONBOARDING_CONFIG_KEYS
+        _LAST_ONBOARDING_CONFIG_KEYS = len(values)
+    return values
 
 
 def _parse_sheet_config(rows: Sequence[Mapping[str, object]]) -> Dict[str, str]:
@@ -386,22 +404,62 @@ def _load_milestones_config_values() -> tuple[str, Dict[str, str]]:
     return sheet_id, _parse_sheet_config(rows)
 
 
-def _merge_milestones_tab(config: Dict[str, object]) -> None:
-    """Merge shard tracker settings from the milestones Config tab."""
+def _fetch_milestones_tab() -> Optional[Dict[str, str]]:
+    """Return shard tracker settings from the milestones Config tab.
+
+    ``{}`` means the sheet is not configured; ``None`` means the read failed.
+    """
 
     try:
         _, values = _load_milestones_config_values()
     except RuntimeError:
         log.debug("config: milestones sheet id not configured; skipping tab merge")
-        return
-    except Exception as exc:  # pragma: no cover - network or credential failures
+        return {}
+    except Exception as exc:
         log.warning("config: failed to load milestones Config tab: %s", exc)
-        return
+        return None
+    return values
+
+
+_SHEET_FETCHERS = {
+    "onboarding": _fetch_onboarding_tab,
+    "milestones": _fetch_milestones_tab,
+}
 
-    if not values:
-        return
 
-    config.update(values)
+def _overlay_sheet_values(config: Dict[str, object]) -> int:
+    merged = 0
+    for source in _SHEET_SOURCES:
+        values = _SHEET_VALUES.get(source) or {}
+        config.update(values)
+        merged += len(values)
+    return merged
+
+
+def _remember_sheet_values(fetched: Mapping[str, Optional[Dict[str, str]]]) -> bool:
+    """Keep the tabs that loaded; report ready only when every tab did.
+
+    A tab whose read failed (``None``) keeps the values from the last good load.
+    """
+
+    loaded = True
+    for source, values in fetched.items():
+        if values is None:
+            loaded = False
+            continue
+        _SHEET_VALUES[source] = dict(values)
+    if loaded:
+        _SHEETS_READY.set()
+    else:
+        _SHEETS_READY.clear()
+    return loaded
+
+
+def _store_sheet_values(fetched: Mapping[str, Optional[Dict[str, str]]]) -> int:
+    """Remember freshly fetched tab values and merge them into the live config."""
+
+    _remember_sheet_values(fetched)
+    return _overlay_sheet_values(_CONFIG)
 
 
 def merge_onboarding_config_early() -> int:
@@ -413,6 +471,7 @@ def merge_onboarding_config_early() -> int:
     for key, value in values.items():
         _CONFIG[key] = value
         merged += 1
+    _SHEET_VALUES["onboarding"] = dict(values)
 
     global _LAST_ONBOARDING_CONFIG_KEYS
     _LAST_ONBOARDING_CONFIG_KEYS = len(values)
@@ -510,6 +569,10 @@ def _load_config() -> Dict[str, object]:
         "EMOJI_MAX_BYTES": _int_env("EMOJI_MAX_BYTES", 2_000_000, min_value=1),
         "EMOJI_PAD_SIZE": _int_env("EMOJI_PAD_SIZE", 256, min_value=64, max_value=512),
         "EMOJI_PAD_BOX": _float_env("EMOJI_PAD_BOX", 0.85, min_value=0.2, max_value=0.95),
+        "EMOJI_PAD_CACHE_BYTES": _int_env("EMOJI_PAD_CACHE_BYTES", 8_000_000, min_value=0),
+        "EMOJI_PAD_CACHE_DIR": (os.getenv("EMOJI_PAD_CACHE_DIR") or "").strip(),
+        "EMOJI_PAD_WORKERS": _int_env("EMOJI_PAD_WORKERS", 2, min_value=1, max_value=8),
+        "EMOJI_PAD_MAX_PENDING": _int_env("EMOJI_PAD_MAX_PENDING", 16, min_value=1),
         "TAG_BADGE_PX": _int_env("TAG_BADGE_PX", 128, min_value=32, max_value=512),
         "TAG_BADGE_BOX": _float_env("TAG_BADGE_BOX", 0.90, min_value=0.2, max_value=0.95),
         "STRICT_EMOJI_PROXY": _env_bool("STRICT_EMOJI_PROXY", True),
@@ -522,18 +585,24 @@ def _load_config() -> Dict[str, object]:
             "Legacy ENABLE_WELCOME_WATCHER detected; set ENABLE_WELCOME_HOOK and remove the old key."
         )
 
-    _merge_onboarding_tab(config)
-    _merge_milestones_tab(config)
+    _overlay_sheet_values(config)
 
     return config
 
 
-def reload_config() -> Dict[str, object]:
-    """Reload configuration from environment and return a snapshot."""
+def reload_config(*, sheets: bool = True) -> Dict[str, object]:
+    """Reload configuration from environment and return a snapshot.
+
+    With ``sheets`` the onboarding and milestones Config tabs are fetched again
+    (blocking); otherwise the values from the last fetch are reused.
+    """
 
     for _name in _REQUIRED_ENV:
         _require_env(_name)
 
+    if sheets:
+        _remember_sheet_values({source: fetch() for source, fetch in _SHEET_FETCHERS.items()})
+
     snapshot = _load_config()
 
     global _CONFIG
@@ -542,7 +611,90 @@ def reload_config() -> Dict[str, object]:
     return dict(_CONFIG)
 
 
-reload_config()
+# Import only reads the environment; the Config tabs load during startup.
+reload_config(sheets=False)
+
+
+async def _afetch_tab(source: str) -> Optional[Dict[str, str]]:
+    from shared.sheets import async_adapter
+
+    try:
+        return await async_adapter.arun(_SHEET_FETCHERS[source])
+    except Exception as exc:  # pragma: no cover - executor timeout
+        log.warning("config: failed to load %s Config tab: %s", source, exc)
+        return None
+
+
+async def aload_sheet_config() -> int:
+    """Fetch the Sheets-backed Config tabs in parallel and merge them.
+
+    Returns the number of keys merged.
+    """
+
+    started = time.monotonic()
+    results = await asyncio.gather(*(_afetch_tab(source) for source in _SHEET_SOURCES))
+    fetched = dict(zip(_SHEET_SOURCES, results))
+    merged = _store_sheet_values(fetched)
+    elapsed_ms = int((time.monotonic() - started) * 1000)
+    counts = {source: len(values or {}) for source, values in fetched.items()}
+    failed = [source for source, values in fetched.items() if values is None]
+    log.info(
+        "🧩 Config — merged Sheets config • onboarding=%d • milestones=%d • failed=%s • ms=%d",
+        counts["onboarding"],
+        counts["milestones"],
+        ",".join(failed) or "none",
+        elapsed_ms,
+        extra={
+            "keys": merged,
+            "onboarding_keys": counts["onboarding"],
+            "milestones_keys": counts["milestones"],
+            "failed_tabs": failed,
+            "ms": elapsed_ms,
+        },
+    )
+    return merged
+
+
+def start_sheet_config_load() -> "asyncio.Task[int]":
+    """Start ``aload_sheet_config`` in the background unless it is already running."""
+
+    global _SHEETS_TASK
+    task = _SHEETS_TASK
+    if task is None or task.done():
+        _SHEETS_READY.clear()
+        task = asyncio.create_task(aload_sheet_config(), name="config_sheet_load")
+        _SHEETS_TASK = task
+    return task
+
+
+def sheet_config_ready() -> bool:
+    """Return ``True`` once every Config tab has loaded and been merged."""
+
+    return _SHEETS_READY.is_set()
+
+
+async def await_sheet_config(timeout: float | None = _SHEETS_WAIT_SEC) -> bool:
+    """Wait up to ``timeout`` seconds for the background Config tab load.
+
+    Returns ``False`` when the load has not finished, never started or a tab
+    failed to load; the accessors then keep returning environment values and
+    defaults (or the last good values of a failed tab).
+    """
+
+    if _SHEETS_READY.is_set():
+        return True
+    task = _SHEETS_TASK
+    if task is None:
+        return False
+    try:
+        await asyncio.wait_for(asyncio.shield(task), timeout)
+    except asyncio.TimeoutError:
+        log.warning("config: Config tabs still loading after %ss; using defaults", timeout)
+        return False
+    except Exception:
+        log.exception("config: Config tab load failed")
+        return False
+    return _SHEETS_READY.is_set()
 
 
 def _normalise_key(name: object) -> Optional[str]:
@@ -1145,6 +1297,38 @@ def get_emoji_pad_box(default: float = 0.85) -> float:
     return max(0.2, min(0.95, parsed))
 
 
+def get_emoji_pad_cache_bytes(default: int = 8_000_000) -> int:
+    value = _CONFIG.get("EMOJI_PAD_CACHE_BYTES", default)
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(0, parsed)
+
+
+def get_emoji_pad_cache_dir() -> str:
+    value = _CONFIG.get("EMOJI_PAD_CACHE_DIR", "")
+    return str(value).strip() if value else ""
+
+
+def get_emoji_pad_workers(default: int = 2) -> int:
+    value = _CONFIG.get("EMOJI_PAD_WORKERS", default)
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(8, parsed))
+
+
+def get_emoji_pad_max_pending(default: int = 16) -> int:
+    value = _CONFIG.get("EMOJI_PAD_MAX_PENDING", default)
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, parsed)
+
+
 def get_tag_badge_px(default: int = 128) -> int:
     value = _CONFIG.get("TAG_BADGE_PX", default)
     try:
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
-from shared.logging.config import setup_logging
+from shared.logging.config import logging_stats, setup_logging, shutdown_logging
 from shared.logging.structured import JsonFormatter, get_trace_id, set_trace_id
 
-__all__ = ["JsonFormatter", "get_trace_id", "set_trace_id", "setup_logging"]
+__all__ = [
+    "JsonFormatter",
+    "get_trace_id",
+    "logging_stats",
+    "set_trace_id",
+    "setup_logging",
+    "shutdown_logging",
+]
 
 # --------------------------------------------------------------------
 # Provide a default structured logger for backward-compatibility
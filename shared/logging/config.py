@@ -2,26 +2,171 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import logging.handlers
+import os
+import queue
+import threading
 from typing import Mapping
 
-from shared.logging.structured import JsonFormatter
+from shared.logging.structured import JsonFormatter, get_trace_id
 
-__all__ = ["setup_logging"]
+__all__ = ["logging_stats", "setup_logging", "shutdown_logging"]
 
+_QUEUE_MAX_DEFAULT = 10000
+_SINK_ATTR = "_log_sink"
 
-def _ensure_stream_handler(logger: logging.Logger, formatter: logging.Formatter) -> None:
-    """Ensure ``logger`` has a stream handler using ``formatter``."""
+_LISTENER: logging.handlers.QueueListener | None = None
+_QUEUE: queue.Queue | None = None
+_TARGETS: dict[str, logging.Handler] = {}
+_STATS_LOCK = threading.Lock()
+_DROPPED = 0
+_ATEXIT_REGISTERED = False
 
-    stream_handler_found = False
-    for handler in logger.handlers:
+
+def _queue_max() -> int:
+    raw = os.getenv("LOG_QUEUE_MAX", "").strip()
+    try:
+        value = int(raw) if raw else _QUEUE_MAX_DEFAULT
+    except ValueError:
+        value = _QUEUE_MAX_DEFAULT
+    return max(1, value)
+
+
+def _queue_blocks() -> bool:
+    return os.getenv("LOG_QUEUE_FULL_POLICY", "drop").strip().lower() == "block"
+
+
+class _SinkFilter(logging.Filter):
+    def __init__(self, sink: str) -> None:
+        super().__init__()
+        self._sink = sink
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return getattr(record, _SINK_ATTR, "root") == self._sink
+
+
+class _AsyncQueueHandler(logging.handlers.QueueHandler):
+    """Hand records to the background listener without formatting them.
+
+    The message and trace id are resolved on the calling thread (the trace
+    lives in a context variable the listener thread cannot see); JSON
+    formatting and the stream write happen on the listener thread. When the
+    queue is full, records below WARNING are dropped unless ``block`` is set.
+    """
+
+    def __init__(self, log_queue: queue.Queue, *, sink: str, block: bool) -> None:
+        super().__init__(log_queue)
+        self._sink = sink
+        self._block = block
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        prepared = copy.copy(record)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        if not getattr(prepared, "trace", ""):
+            prepared.trace = get_trace_id()
+        setattr(prepared, _SINK_ATTR, self._sink)
+        return prepared
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        global _DROPPED
+
+        if self._block or record.levelno >= logging.WARNING:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with _STATS_LOCK:
+                _DROPPED += 1
+
+
+def _ensure_listener() -> queue.Queue:
+    global _LISTENER, _QUEUE, _ATEXIT_REGISTERED
+
+    if _LISTENER is not None and _QUEUE is not None:
+        return _QUEUE
+    _QUEUE = queue.Queue(maxsize=_queue_max())
+    _LISTENER = logging.handlers.QueueListener(_QUEUE, respect_handler_level=True)
+    _LISTENER.handlers = tuple(_TARGETS.values())
+    _LISTENER.start()
+    if not _ATEXIT_REGISTERED:
+        atexit.register(shutdown_logging)
+        _ATEXIT_REGISTERED = True
+    return _QUEUE
+
+
+def _install_target(sink: str, handler: logging.Handler) -> None:
+    handler.addFilter(_SinkFilter(sink))
+    _TARGETS[sink] = handler
+    if _LISTENER is not None:
+        _LISTENER.handlers = tuple(_TARGETS.values())
+
+
+def _route_through_queue(
+    logger: logging.Logger, formatter: logging.Formatter, *, sink: str
+) -> None:
+    """Send ``logger``'s stream output through the background listener.
+
+    Plain stderr/stdout ``StreamHandler`` instances move behind the queue;
+    other stream handlers (files, test capture) stay attached and only get
+    ``formatter``, as before.
+    """
+
+    log_queue = _ensure_listener()
+    target = _TARGETS.get(sink)
+    for handler in list(logger.handlers):
+        if isinstance(handler, _AsyncQueueHandler):
+            handler.queue = log_queue
+            handler.setFormatter(formatter)
+            continue
+        if type(handler) is logging.StreamHandler:
+            logger.removeHandler(handler)
+            if target is None:
+                target = handler
+            continue
         if isinstance(handler, logging.StreamHandler):
             handler.setFormatter(formatter)
-            stream_handler_found = True
-    if not stream_handler_found:
-        handler = logging.StreamHandler()
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+    if target is None:
+        target = logging.StreamHandler()
+    target.setFormatter(formatter)
+    if _TARGETS.get(sink) is not target:
+        _install_target(sink, target)
+    if not any(isinstance(handler, _AsyncQueueHandler) for handler in logger.handlers):
+        queue_handler = _AsyncQueueHandler(log_queue, sink=sink, block=_queue_blocks())
+        queue_handler.setFormatter(formatter)
+        logger.addHandler(queue_handler)
+
+
+def logging_stats() -> dict[str, int]:
+    """Return the log queue depth, capacity and how many records were dropped."""
+
+    with _STATS_LOCK:
+        dropped = _DROPPED
+    log_queue = _QUEUE
+    return {
+        "queued": log_queue.qsize() if log_queue is not None else 0,
+        "capacity": log_queue.maxsize if log_queue is not None else 0,
+        "dropped": dropped,
+    }
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background listener."""
+
+    global _LISTENER
+
+    listener = _LISTENER
+    if listener is None:
+        return
+    _LISTENER = None
+    try:
+        listener.stop()
+    except Exception:  # pragma: no cover - interpreter shutdown
+        pass
 
 
 def setup_logging(
@@ -32,6 +177,9 @@ def setup_logging(
 ) -> logging.Logger:
     """Configure JSON logging for the runtime.
 
+    Records are queued by the calling thread and formatted/written by a
+    background listener; see ``LOG_QUEUE_MAX`` and ``LOG_QUEUE_FULL_POLICY``.
+
     Parameters
     ----------
     static_fields:
@@ -52,7 +200,7 @@ def setup_logging(
 
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
-    _ensure_stream_handler(root_logger, JsonFormatter(static=base_static))
+    _route_through_queue(root_logger, JsonFormatter(static=base_static), sink="root")
 
     access_static = dict(base_static)
     access_static.update(access_static_fields or {})
@@ -61,10 +209,7 @@ def setup_logging(
     access_logger = logging.getLogger(access_logger_name)
     access_logger.propagate = False
     access_logger.handlers.clear()
-
-    access_handler = logging.StreamHandler()
-    access_handler.setFormatter(JsonFormatter(static=access_static))
-    access_logger.addHandler(access_handler)
+    _route_through_queue(access_logger, JsonFormatter(static=access_static), sink="access")
     access_logger.setLevel(logging.INFO)
 
     return access_logger
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
 import logging
+import os
+import time
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from threading import Lock
-from typing import Any, Callable, ParamSpec, TypeVar
+from typing import Any, Awaitable, Callable, Iterator, ParamSpec, TypeVar
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -18,6 +24,253 @@ _EXECUTOR_LOCK = Lock()
 _MAX_WORKERS = 4
 _DEFAULT_TIMEOUT = 15.0
 
+LANE_INTERACTIVE = "interactive"
+LANE_BACKGROUND = "background"
+LANE_BULK = "bulk"
+
+# Lower value wins when several callers wait for an executor slot.
+_LANE_PRIORITY = {LANE_INTERACTIVE: 0, LANE_BACKGROUND: 1, LANE_BULK: 2}
+
+_WRITE_METHODS = frozenset(
+    {
+        "append_row",
+        "append_rows",
+        "batch_clear",
+        "batch_update",
+        "clear",
+        "delete_rows",
+        "insert_row",
+        "insert_rows",
+        "update",
+        "update_acell",
+        "update_cell",
+        "update_cells",
+        "values_append",
+        "values_batch_update",
+        "values_update",
+    }
+)
+
+_CURRENT_LANE: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "sheets_lane", default=LANE_INTERACTIVE
+)
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        _logger.warning("invalid %s=%r; using default %s", name, raw, default)
+        return default
+
+
+class TokenBucket:
+    """Per-minute request budget with a slice reserved for interactive work.
+
+    ``clock`` and ``sleep`` are injectable so tests can drive the bucket
+    without waiting on wall time. A ``per_minute`` of ``0`` disables
+    throttling entirely.
+    """
+
+    def __init__(
+        self,
+        per_minute: float,
+        *,
+        burst: float | None = None,
+        reserve: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        self.per_minute = max(0.0, float(per_minute))
+        self.capacity = max(1.0, float(burst if burst is not None else self.per_minute / 4))
+        self.reserve = min(max(0.0, float(reserve)), 1.0) * self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self.throttled = 0
+        self.waited_sec = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.per_minute > 0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.per_minute / 60.0)
+
+    def try_acquire(self, *, lane: str = LANE_INTERACTIVE) -> float:
+        """Take one token or return the seconds to wait before retrying."""
+
+        if not self.enabled:
+            return 0.0
+        self._refill()
+        floor = 0.0 if lane == LANE_INTERACTIVE else self.reserve
+        if self._tokens - 1.0 >= floor:
+            self._tokens -= 1.0
+            return 0.0
+        deficit = floor + 1.0 - self._tokens
+        return deficit * 60.0 / self.per_minute
+
+    async def acquire(self, *, lane: str = LANE_INTERACTIVE) -> None:
+        """Wait until a token is available for ``lane``."""
+
+        delay = self.try_acquire(lane=lane)
+        if delay <= 0:
+            return
+        self.throttled += 1
+        while delay > 0:
+            self.waited_sec += delay
+            await self._sleep(delay)
+            delay = self.try_acquire(lane=lane)
+
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+
+class _LaneSlots:
+    """Executor admission control that hands free slots to the best lane."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._free = size
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for *_, fut in self._waiters if not fut.done())
+
+    async def acquire(self, lane: str) -> None:
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+            return
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (_LANE_PRIORITY.get(lane, 0), next(self._seq), fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slot was handed over just before cancellation; pass it on.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if fut.done() or fut.get_loop().is_closed():
+                continue
+            fut.set_result(None)
+            return
+        self._free = min(self.size, self._free + 1)
+
+
+_READ_BUCKET: TokenBucket | None = None
+_WRITE_BUCKET: TokenBucket | None = None
+_SLOTS: _LaneSlots | None = None
+_LIMITER_LOCK = Lock()
+
+
+def configure_rate_limits(
+    *,
+    reads_per_minute: float | None = None,
+    writes_per_minute: float | None = None,
+    interactive_reserve: float | None = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+) -> None:
+    """(Re)build the read/write budgets; unspecified values come from the env."""
+
+    global _READ_BUCKET, _WRITE_BUCKET, _SLOTS
+    reserve = (
+        interactive_reserve
+        if interactive_reserve is not None
+        else _env_float("GSHEETS_INTERACTIVE_RESERVE", 0.25)
+    )
+    reads = (
+        reads_per_minute
+        if reads_per_minute is not None
+        else _env_float("GSHEETS_READS_PER_MINUTE", 240.0)
+    )
+    writes = (
+        writes_per_minute
+        if writes_per_minute is not None
+        else _env_float("GSHEETS_WRITES_PER_MINUTE", 240.0)
+    )
+    with _LIMITER_LOCK:
+        _READ_BUCKET = TokenBucket(reads, reserve=reserve, clock=clock, sleep=sleep)
+        _WRITE_BUCKET = TokenBucket(writes, reserve=reserve, clock=clock, sleep=sleep)
+        _SLOTS = _LaneSlots(_MAX_WORKERS)
+
+
+def _limiters() -> tuple[TokenBucket, TokenBucket, _LaneSlots]:
+    if _READ_BUCKET is None or _WRITE_BUCKET is None or _SLOTS is None:
+        configure_rate_limits()
+    assert _READ_BUCKET is not None and _WRITE_BUCKET is not None and _SLOTS is not None
+    return _READ_BUCKET, _WRITE_BUCKET, _SLOTS
+
+
+@contextlib.contextmanager
+def lane(name: str) -> Iterator[None]:
+    """Run Sheets calls issued inside the block in the ``name`` priority lane.
+
+    The lane follows the current context, so tasks spawned inside the block
+    inherit it.
+    """
+
+    if name not in _LANE_PRIORITY:
+        raise ValueError(f"unknown sheets lane: {name}")
+    token = _CURRENT_LANE.set(name)
+    try:
+        yield
+    finally:
+        _CURRENT_LANE.reset(token)
+
+
+def current_lane() -> str:
+    """Return the priority lane for Sheets calls in the current context."""
+
+    return _CURRENT_LANE.get()
+
+
+def _is_write(func: Callable[..., Any]) -> bool:
+    target = func.func if isinstance(func, partial) else func
+    return getattr(target, "__name__", "") in _WRITE_METHODS
+
+
+async def athrottle(*, write: bool = False) -> None:
+    """Spend one quota token for a Google request made outside the executor."""
+
+    reads, writes, _ = _limiters()
+    await (writes if write else reads).acquire(lane=_CURRENT_LANE.get())
+
+
+def limiter_stats() -> dict[str, Any]:
+    """Return a snapshot of the current quota budgets for diagnostics."""
+
+    reads, writes, slots = _limiters()
+    return {
+        "reads_available": round(reads.available(), 2),
+        "reads_throttled": reads.throttled,
+        "reads_waited_sec": round(reads.waited_sec, 3),
+        "writes_available": round(writes.available(), 2),
+        "writes_throttled": writes.throttled,
+        "writes_waited_sec": round(writes.waited_sec, 3),
+        "queued": slots.queued,
+    }
+
+
+def executor_capacity() -> int:
+    """Return how many Sheets calls the shared executor runs at once."""
+
+    return _MAX_WORKERS
+
 
 def _get_executor() -> ThreadPoolExecutor:
     """Return the lazily initialised executor used for Sheets I/O."""
@@ -53,13 +306,26 @@ async def _to_thread(
     timeout: float | None = _DEFAULT_TIMEOUT,
     **kwargs: P.kwargs,
 ) -> T:
-    """Execute ``func`` in the adapter executor and await the result."""
-
-    loop = asyncio.get_running_loop()
-    future = loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
-    if timeout is None:
-        return await future
-    return await asyncio.wait_for(future, timeout)
+    """Execute ``func`` in the adapter executor and await the result.
+
+    Calls first spend a read or write token for the active lane and then wait
+    for an executor slot, so interactive callers overtake queued background
+    and bulk work instead of sitting behind it.
+    """
+
+    current = _CURRENT_LANE.get()
+    reads, writes, slots = _limiters()
+    bucket = writes if _is_write(func) else reads
+    await bucket.acquire(lane=current)
+    await slots.acquire(current)
+    try:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
+        if timeout is None:
+            return await future
+        return await asyncio.wait_for(future, timeout)
+    finally:
+        slots.release()
 
 
 # ---------
@@ -108,6 +374,12 @@ def worksheet_values_update(worksheet: Any, a1_range: str, values: Any) -> Any:
     return worksheet.update(a1_range, values)
 
 
+def values_batch_get(spreadsheet: Any, ranges: list[str]) -> Any:
+    """Read several A1 ``ranges`` from ``spreadsheet`` in one request."""
+
+    return spreadsheet.values_batch_get(ranges)
+
+
 def batch_update(spreadsheet: Any, request_body: dict[str, Any]) -> Any:
     """Execute ``batch_update`` on ``spreadsheet``."""
 
@@ -178,6 +450,17 @@ async def aworksheet_values_update(
     return await _to_thread(worksheet.update, a1_range, values, timeout=timeout)
 
 
+async def avalues_batch_get(
+    spreadsheet: Any,
+    ranges: list[str],
+    *,
+    timeout: float | None = _DEFAULT_TIMEOUT,
+) -> Any:
+    """Async wrapper for :func:`values_batch_get`."""
+
+    return await _to_thread(spreadsheet.values_batch_get, ranges, timeout=timeout)
+
+
 async def abatch_update(
     spreadsheet: Any,
     request_body: dict[str, Any],
@@ -201,6 +484,10 @@ async def arun(
 
 
 __all__ = [
+    "LANE_BACKGROUND",
+    "LANE_BULK",
+    "LANE_INTERACTIVE",
+    "TokenBucket",
     "aopen_spreadsheet",
     "aworksheet_by_title",
     "aworksheet_by_index",
@@ -208,11 +495,19 @@ __all__ = [
     "aworksheet_values_all",
     "aworksheet_values_get",
     "aworksheet_values_update",
+    "avalues_batch_get",
     "abatch_update",
     "arun",
+    "athrottle",
     "batch_update",
+    "configure_rate_limits",
+    "current_lane",
+    "executor_capacity",
+    "lane",
+    "limiter_stats",
     "open_spreadsheet",
     "shutdown_executor",
+    "values_batch_get",
     "worksheet_by_index",
     "worksheet_by_title",
     "worksheet_records_all",
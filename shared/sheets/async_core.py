@@ -2,7 +2,7 @@ from __future__ import annotations
 
 """Async wrappers for Google Sheets access built on :mod:`shared.sheets.core`."""
 
-from typing import Any, Callable, ParamSpec, TypeVar
+from typing import Any, Callable, ParamSpec, Sequence, TypeVar
 
 import shared.sheets.core as _core
 
@@ -27,19 +27,39 @@ async def aget_worksheet(
 
 
 async def afetch_records(
-    sheet_id: str, worksheet: str, *, timeout: float | None = None
+    sheet_id: str,
+    worksheet: str,
+    *,
+    timeout: float | None = None,
+    batched: bool = False,
 ) -> list[dict[str, Any]]:
     """Return worksheet records asynchronously with retry semantics."""
 
-    return await _core.afetch_records(sheet_id, worksheet, timeout=timeout)
+    return await _core.afetch_records(
+        sheet_id, worksheet, timeout=timeout, batched=batched
+    )
 
 
 async def afetch_values(
-    sheet_id: str, worksheet: str, *, timeout: float | None = None
+    sheet_id: str,
+    worksheet: str,
+    *,
+    timeout: float | None = None,
+    batched: bool = False,
 ) -> list[list[Any]]:
     """Return worksheet values asynchronously with retry semantics."""
 
-    return await _core.afetch_values(sheet_id, worksheet, timeout=timeout)
+    return await _core.afetch_values(
+        sheet_id, worksheet, timeout=timeout, batched=batched
+    )
+
+
+async def afetch_values_batch(
+    sheet_id: str, ranges: Sequence[str], *, timeout: float | None = None
+) -> list[list[list[Any]]]:
+    """Read several tabs or A1 ranges from one workbook in a single request."""
+
+    return await _core.afetch_values_batch(sheet_id, ranges, timeout=timeout)
 
 
 async def asheets_read(
@@ -80,6 +100,7 @@ __all__ = [
     "aget_worksheet",
     "afetch_records",
     "afetch_values",
+    "afetch_values_batch",
     "asheets_read",
     "acall_with_backoff",
 ]
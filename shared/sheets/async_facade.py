@@ -80,6 +80,10 @@ async def fetch_values(*args: Any, **kwargs: Any) -> Any:
     return await _core_async.afetch_values(*args, **kwargs)
 
 
+async def fetch_values_batch(*args: Any, **kwargs: Any) -> Any:
+    return await _core_async.afetch_values_batch(*args, **kwargs)
+
+
 async def sheets_read(*args: Any, **kwargs: Any) -> Any:
     return await _core_async.asheets_read(*args, **kwargs)
 
@@ -102,6 +106,7 @@ __all__ = [
     "get_worksheet",
     "fetch_records",
     "fetch_values",
+    "fetch_values_batch",
     "sheets_read",
     "call_with_backoff",
 ]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import datetime as dt
 import logging
+import time
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
@@ -14,6 +15,7 @@ from shared.config import get_config_snapshot
 from c1c_coreops.cog import resolve_ops_log_channel_id
 from shared.sheets.runtime import register_default_cache_buckets
 
+from shared.sheets import async_adapter
 from shared.sheets.cache_service import cache
 from modules.common import runtime as rt
 from shared.logfmt import LogTemplates, human_reason
@@ -273,14 +275,29 @@ def schedule_default_jobs(runtime: "rt.Runtime") -> None:
     )
 
 
-async def preload_on_startup() -> None:
-    """Synchronously refresh core cache buckets during startup."""
+async def preload_on_startup() -> Dict[str, int]:
+    """Refresh core cache buckets during startup, several at a time.
+
+    Loads run concurrently up to the Sheets executor capacity, so the wait
+    is roughly the slowest bucket rather than the sum. Returns per-bucket
+    durations in milliseconds.
+    """
 
     ensure_cache_registration()
-    for name in STARTUP_BUCKETS:
+    restored = set(await cache.rehydrate())
+    gate = asyncio.Semaphore(max(1, async_adapter.executor_capacity()))
+    durations: Dict[str, int] = {}
+
+    async def _load(name: str) -> None:
         bucket = _safe_bucket(name)
+        started = time.monotonic()
         try:
-            await cache.refresh_now(bucket, actor="startup")
+            if bucket in restored:
+                # Serve the snapshot now; ``get`` kicks off the live refresh in the background.
+                await cache.get(bucket)
+                return
+            async with gate:
+                await cache.refresh_now(bucket, actor="startup")
         except asyncio.CancelledError:
             raise
         except Exception as exc:  # pragma: no cover - defensive guard
@@ -293,3 +310,14 @@ async def preload_on_startup() -> None:
                     reason=human_reason(exc),
                 )
             )
+        finally:
+            durations[bucket] = int((time.monotonic() - started) * 1000)
+
+    started = time.monotonic()
+    await asyncio.gather(*(_load(name) for name in STARTUP_BUCKETS))
+    total_ms = int((time.monotonic() - started) * 1000)
+    log.info(
+        "startup cache preload finished",
+        extra={"total_ms": total_ms, "bucket_ms": dict(durations)},
+    )
+    return durations
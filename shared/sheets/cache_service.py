@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import asyncio
 import datetime as dt
+import json
 import logging
+import os
+from pathlib import Path
 from types import ModuleType
 from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
+from shared.sheets import async_adapter
+
 UTC = dt.timezone.utc
 log = logging.getLogger(__name__)
 
@@ -50,6 +55,62 @@ def _errtext(exc: BaseException) -> str:
 
 # Type aliases
 Loader = Callable[[], Awaitable[Any]]
+Decoder = Callable[[Any], Any]
+Encoder = Callable[[Any], Any]
+
+_SNAPSHOT_VERSION = 1
+
+# Upper bounds (ms) for loader latency histogram buckets; the last bucket is open-ended.
+LATENCY_BOUNDS_MS: tuple[int, ...] = (100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class CacheStats:
+    """Access and refresh counters for one bucket since process start."""
+
+    __slots__ = (
+        "hits",
+        "stale_hits",
+        "misses",
+        "refreshes",
+        "refresh_failures",
+        "latency_counts",
+        "latency_total_ms",
+    )
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.latency_counts = [0] * (len(LATENCY_BOUNDS_MS) + 1)
+        self.latency_total_ms = 0
+
+    def observe_latency(self, ms: int) -> None:
+        index = len(LATENCY_BOUNDS_MS)
+        for i, bound in enumerate(LATENCY_BOUNDS_MS):
+            if ms <= bound:
+                index = i
+                break
+        self.latency_counts[index] += 1
+        self.latency_total_ms += max(0, int(ms))
+
+    def latency_histogram(self) -> Dict[str, int]:
+        labels = [f"le_{bound}ms" for bound in LATENCY_BOUNDS_MS] + ["gt_%dms" % LATENCY_BOUNDS_MS[-1]]
+        return dict(zip(labels, self.latency_counts))
+
+    def as_dict(self) -> Dict[str, Any]:
+        samples = sum(self.latency_counts)
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "latency_histogram": self.latency_histogram(),
+            "latency_avg_ms": (self.latency_total_ms // samples) if samples else None,
+        }
+
 
 class CacheBucket:
     __slots__ = (
@@ -66,11 +127,26 @@ class CacheBucket:
         "last_item_count",
         "last_trigger",
         "last_ttl_expired",
+        "decode",
+        "encode",
+        "rehydrated",
+        "stats",
     )
-    def __init__(self, name: str, ttl_sec: int, loader: Loader):
+    def __init__(
+        self,
+        name: str,
+        ttl_sec: int,
+        loader: Loader,
+        decode: Optional[Decoder] = None,
+        encode: Optional[Encoder] = None,
+    ):
         self.name = name
         self.ttl_sec = ttl_sec
         self.loader = loader
+        self.decode = decode
+        self.encode = encode
+        # True while ``value`` came from a disk snapshot and no live refresh has landed.
+        self.rehydrated = False
         self.value: Any = None
         self.last_refresh: Optional[dt.datetime] = None
         self.refreshing: Optional[asyncio.Task] = None
@@ -81,6 +157,19 @@ class CacheBucket:
         self.last_item_count: Optional[int] = None
         self.last_trigger: Optional[str] = None
         self.last_ttl_expired: Optional[bool] = None
+        self.stats = CacheStats()
+
+    def record_access(self) -> None:
+        """Count a read as a hit, stale hit (expired or snapshot value) or miss."""
+
+        if self.value is None:
+            self.stats.misses += 1
+            return
+        age = self.age_sec()
+        if self.rehydrated or age is None or age >= self.ttl_sec:
+            self.stats.stale_hits += 1
+        else:
+            self.stats.hits += 1
 
     def age_sec(self) -> Optional[int]:
         if not self.last_refresh:
@@ -93,14 +182,99 @@ class CacheBucket:
         return schedule_hint
 
 class CacheService:
-    def __init__(self):
+    def __init__(self, snapshot_dir: str | os.PathLike[str] | None = None):
         self._buckets: Dict[str, CacheBucket] = {}
-
-    def register(self, name: str, ttl_sec: int, loader: Loader) -> CacheBucket:
-        b = CacheBucket(name, ttl_sec, loader)
+        if snapshot_dir is None:
+            snapshot_dir = os.getenv("CACHE_SNAPSHOT_DIR", "").strip() or None
+        self._snapshot_dir: Optional[Path] = Path(snapshot_dir) if snapshot_dir else None
+
+    def register(
+        self,
+        name: str,
+        ttl_sec: int,
+        loader: Loader,
+        *,
+        decode: Optional[Decoder] = None,
+        encode: Optional[Encoder] = None,
+    ) -> CacheBucket:
+        """Register a bucket.
+
+        ``encode`` turns its value into the snapshot JSON payload and
+        ``decode`` rebuilds the value from it; both default to identity.
+        """
+
+        b = CacheBucket(name, ttl_sec, loader, decode, encode)
         self._buckets[name] = b
         return b
 
+    # ---- disk snapshots -------------------------------------------------
+    def configure_snapshots(self, directory: str | os.PathLike[str] | None) -> None:
+        self._snapshot_dir = Path(directory) if directory else None
+
+    def _snapshot_path(self, name: str) -> Optional[Path]:
+        if self._snapshot_dir is None:
+            return None
+        return self._snapshot_dir / f"{name}.json"
+
+    def _write_snapshot(self, b: CacheBucket) -> None:
+        path = self._snapshot_path(b.name)
+        if path is None or b.last_refresh is None:
+            return
+        payload = {
+            "version": _SNAPSHOT_VERSION,
+            "name": b.name,
+            "last_refresh": b.last_refresh.isoformat(),
+            "value": b.encode(b.value) if b.encode is not None else b.value,
+        }
+        try:
+            text = json.dumps(payload, ensure_ascii=False)
+        except (TypeError, ValueError) as exc:
+            log.debug("cache snapshot skipped for %s: %s", b.name, exc)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _read_snapshot(self, b: CacheBucket) -> bool:
+        path = self._snapshot_path(b.name)
+        if path is None or not path.exists():
+            return False
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("version") != _SNAPSHOT_VERSION or payload.get("name") != b.name:
+            return False
+        if b.value is not None:
+            # A live load already landed; never replace it with disk data.
+            return False
+        value = payload.get("value")
+        if b.decode is not None:
+            value = b.decode(value)
+        saved = dt.datetime.fromisoformat(payload["last_refresh"])
+        b.value = value
+        b.last_refresh = saved
+        b.last_item_count = _count_items(value)
+        b.last_result = "snapshot"
+        b.rehydrated = True
+        return True
+
+    async def rehydrate(self) -> list[str]:
+        """Load bucket values from disk snapshots; returns the restored names."""
+
+        if self._snapshot_dir is None:
+            return []
+        restored: list[str] = []
+        for name, b in list(self._buckets.items()):
+            try:
+                if await asyncio.to_thread(self._read_snapshot, b):
+                    restored.append(name)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                log.warning("cache snapshot unreadable for %s: %s", name, _errtext(exc))
+        if restored:
+            log.info("[cache] rehydrated from snapshot: %s", ", ".join(sorted(restored)))
+        return restored
+
     def get_bucket(self, name: str) -> Optional[CacheBucket]:
         return self._buckets.get(name)
 
@@ -115,8 +289,26 @@ class CacheService:
             }
         return out
 
+    def peek(self, name: str) -> Any:
+        """Return the cached value for ``name`` without scheduling a refresh.
+
+        The read still counts towards the bucket's hit/miss stats. Unknown
+        buckets return ``None``.
+        """
+
+        b = self._buckets.get(name)
+        if b is None:
+            return None
+        b.record_access()
+        return b.value
+
     async def get(self, name: str) -> Any:
         b = self._buckets[name]
+        b.record_access()
+        if b.rehydrated:
+            # Serve the snapshot while the first live refresh runs (stale-while-revalidate).
+            await self._ensure_background_refresh(name)
+            return b.value
         # Fast-path: fresh enough
         age = b.age_sec()
         if age is not None and age < b.ttl_sec and b.value is not None:
@@ -129,11 +321,36 @@ class CacheService:
         b = self._buckets[name]
         b.last_refresh = None  # mark stale
 
+    def prime(self, name: str, value: Any) -> None:
+        """Store a value the caller loaded itself, as if a refresh just landed."""
+
+        b = self._buckets[name]
+        b.value = value
+        b.last_refresh = dt.datetime.now(UTC)
+        b.last_item_count = _count_items(value)
+        b.rehydrated = False
+
     async def refresh_now(
         self, name: str, *, actor: Optional[str] = None, trigger: str = "manual"
     ) -> None:
         await self._refresh(name, trigger=trigger, actor=actor)
 
+    async def refresh_if_stale(
+        self, name: str, *, actor: Optional[str] = None, trigger: str = "manual"
+    ) -> None:
+        """Refresh ``name`` unless it holds a live, unexpired value.
+
+        A refresh already in flight is joined instead of starting another load.
+        """
+
+        b = self._buckets[name]
+        if b.refreshing is None or b.refreshing.done():
+            age = b.age_sec()
+            if b.value is not None and not b.rehydrated and age is not None and age < b.ttl_sec:
+                return
+            b.refreshing = asyncio.create_task(self._refresh(name, trigger=trigger, actor=actor))
+        await asyncio.shield(b.refreshing)
+
     async def _ensure_background_refresh(self, name: str) -> None:
         b = self._buckets[name]
         if b.refreshing and not b.refreshing.done():
@@ -162,7 +379,7 @@ class CacheService:
         try:
             # run loader with async backoff (single retry on failure)
             try:
-                new_val = await b.loader()
+                new_val = await self._run_loader(b)
                 success = True
             except asyncio.CancelledError:
                 # Propagate cancellation so shutdown isn't blocked
@@ -176,7 +393,7 @@ class CacheService:
                 b.last_error = first_err
                 await asyncio.sleep(300)  # 5 minutes
                 try:
-                    new_val = await b.loader()
+                    new_val = await self._run_loader(b)
                     success = True
                     result = "retry_ok"
                 except asyncio.CancelledError:
@@ -194,6 +411,13 @@ class CacheService:
                 b.value = new_val
                 b.last_refresh = dt.datetime.now(UTC)
                 b.last_item_count = _count_items(new_val)
+                b.rehydrated = False
+                try:
+                    await asyncio.to_thread(self._write_snapshot, b)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    log.warning("cache snapshot write failed for %s: %s", name, _errtext(exc))
         except asyncio.CancelledError:
             # Let the runtime cancel this task; finally will still run
             result = "cancelled"
@@ -209,12 +433,27 @@ class CacheService:
             b.last_retries = retries
             b.last_trigger = trigger
             b.last_ttl_expired = ttl_expired
+            if result != "cancelled":
+                b.stats.refreshes += 1
+                if not success:
+                    b.stats.refresh_failures += 1
             await self._log_refresh(b, trigger=trigger, actor=actor, retries=retries)
-            # clear marker
-            b.refreshing = None
+            # Clear the marker only if it is ours; ``refresh_now`` runs inline
+            # and must not drop the handle of a background refresh in flight.
+            if b.refreshing is asyncio.current_task():
+                b.refreshing = None
+
+    async def _run_loader(self, b: CacheBucket) -> Any:
+        rt = _get_runtime_module()
+        started = rt.monotonic_ms()
+        try:
+            with async_adapter.lane(async_adapter.LANE_BACKGROUND):
+                return await b.loader()
+        finally:
+            b.stats.observe_latency(rt.monotonic_ms() - started)
 
     async def _log_refresh(self, b: CacheBucket, *, trigger: str, actor: Optional[str], retries: int) -> None:
-        # Format: [refresh] bucket=clans trigger=schedule actor=@user duration=842ms result=ok hits=?,misses=?,retries=1
+        # Format: [refresh] bucket=clans trigger=schedule actor=@user duration=842ms result=ok retries=1 hits=12 stale=1 misses=0
         normalized_trigger = "manual"
         if trigger in {"schedule", "cron"}:
             normalized_trigger = "cron"
@@ -232,7 +471,8 @@ class CacheService:
             f"[refresh] bucket={b.name} trigger={normalized_trigger} "
             f"actor={normalized_actor} duration={b.last_latency_ms or 0}ms "
             f"result={result_flag} retries={retries} "
-            f"ttl_expired={ttl_flag} count={count_text} error={error_text or '-'}"
+            f"ttl_expired={ttl_flag} count={count_text} error={error_text or '-'} "
+            f"hits={b.stats.hits} stale={b.stats.stale_hits} misses={b.stats.misses}"
         )
         log.info(msg)
 
@@ -268,6 +508,7 @@ def register_onboarding_questions_bucket() -> None:
         "onboarding_questions",
         _ONBOARDING_QUESTIONS_TTL_SEC,
         _load_onboarding_questions,
+        decode=tuple,
     )
 
 
@@ -314,7 +555,11 @@ def get_bucket_snapshot(name: str) -> Dict[str, Any]:
         "last_trigger": getattr(bucket, "last_trigger", None),
         "ttl_expired": getattr(bucket, "last_ttl_expired", None),
         "item_count": getattr(bucket, "last_item_count", None),
+        "rehydrated": getattr(bucket, "rehydrated", False),
     }
+    stats = getattr(bucket, "stats", None)
+    if isinstance(stats, CacheStats):
+        snapshot.update(stats.as_dict())
     if metadata:
         snapshot["metadata"] = dict(metadata)
     return snapshot
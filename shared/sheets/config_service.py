@@ -77,7 +77,7 @@ async def _load_bucket(name: str) -> dict[str, object]:
 
     sheet_id = _resolve_sheet_id(env_keys)
     tab_name = _resolve_tab(name)
-    rows = await afetch_records(sheet_id, tab_name)
+    rows = await afetch_records(sheet_id, tab_name, batched=True)
     filtered = _filter_rows(rows or [])
 
     return {
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import os
+import re
 from functools import lru_cache
-from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Set, Tuple, TypeVar
 
 try:
     import gspread
@@ -20,6 +22,8 @@ else:
 
 import shared.sheets.async_adapter as async_adapter
 
+log = logging.getLogger(__name__)
+
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
 _WorksheetT = TypeVar("_WorksheetT")
@@ -32,6 +36,13 @@ _CONFIG_UNAVAILABLE = False
 _DEFAULT_ATTEMPTS = int(os.getenv("GSHEETS_RETRY_ATTEMPTS", "5"))
 _DEFAULT_BACKOFF_BASE = float(os.getenv("GSHEETS_RETRY_BASE", "0.5"))
 _DEFAULT_BACKOFF_FACTOR = float(os.getenv("GSHEETS_RETRY_FACTOR", "2.0"))
+_BATCH_WINDOW_SEC = max(0.0, float(os.getenv("GSHEETS_BATCH_WINDOW_MS", "25")) / 1000.0)
+
+# sheet_id -> {a1_range: [waiting futures]} for reads coalesced into one batch.
+_PENDING_BATCHES: Dict[str, Dict[str, List["asyncio.Future[List[List[Any]]]"]]] = {}
+# sheet_id -> shortest timeout requested by any caller that joined the batch.
+_BATCH_TIMEOUTS: Dict[str, float | None] = {}
+_BATCH_TASKS: Set["asyncio.Task[None]"] = set()
 
 
 def _service_account_info() -> dict[str, Any]:
@@ -220,9 +231,21 @@ def fetch_records(sheet_id: str, worksheet: str):
 
 
 async def afetch_records(
-    sheet_id: str, worksheet: str, *, timeout: float | None = None
+    sheet_id: str,
+    worksheet: str,
+    *,
+    timeout: float | None = None,
+    batched: bool = False,
 ) -> list[dict[str, Any]]:
-    """Async wrapper around :func:`fetch_records`."""
+    """Async wrapper around :func:`fetch_records`.
+
+    With ``batched=True`` the read joins other concurrent batched reads for the
+    same workbook and is served from one ``values_batch_get`` request.
+    """
+
+    if batched:
+        values = await _afetch_values_coalesced(sheet_id, worksheet, timeout=timeout)
+        return _values_to_records(values)
 
     ws = await aget_worksheet(sheet_id, worksheet, timeout=timeout)
     kwargs: dict[str, Any] = {}
@@ -239,9 +262,20 @@ def fetch_values(sheet_id: str, worksheet: str):
 
 
 async def afetch_values(
-    sheet_id: str, worksheet: str, *, timeout: float | None = None
+    sheet_id: str,
+    worksheet: str,
+    *,
+    timeout: float | None = None,
+    batched: bool = False,
 ) -> list[list[Any]]:
-    """Async wrapper around :func:`fetch_values`."""
+    """Async wrapper around :func:`fetch_values`.
+
+    ``batched=True`` coalesces the read with other concurrent batched reads for
+    the same workbook (see :func:`afetch_records`).
+    """
+
+    if batched:
+        return await _afetch_values_coalesced(sheet_id, worksheet, timeout=timeout)
 
     ws = await aget_worksheet(sheet_id, worksheet, timeout=timeout)
     kwargs: dict[str, Any] = {}
@@ -252,6 +286,168 @@ async def afetch_values(
     )
 
 
+def _batch_range(name: str) -> str:
+    """Return an A1 range for ``name``, quoting bare tab names."""
+
+    text = str(name).strip()
+    if "!" in text:
+        return text
+    return "'" + text.replace("'", "''") + "'"
+
+
+def _fill_gaps(values: Sequence[Sequence[Any]]) -> List[List[Any]]:
+    """Pad ragged rows like ``get_all_values`` does."""
+
+    rows = [list(row) for row in values]
+    width = max((len(row) for row in rows), default=0)
+    for row in rows:
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+    return rows
+
+
+def _values_to_records(values: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Convert a value grid into ``get_all_records``-style dictionaries."""
+
+    if not values:
+        return []
+    header = list(values[0])
+    rows = [list(row) for row in values[1:]]
+    if gspread is not None:
+        from gspread.utils import numericise_all
+
+        rows = [numericise_all(row) for row in rows]
+    return [dict(zip(header, row)) for row in rows]
+
+
+def _split_value_ranges(response: Any, count: int) -> List[List[List[Any]]]:
+    value_ranges = []
+    if isinstance(response, dict):
+        value_ranges = list(response.get("valueRanges") or [])
+    results: List[List[List[Any]]] = []
+    for index in range(count):
+        entry = value_ranges[index] if index < len(value_ranges) else {}
+        results.append(_fill_gaps(entry.get("values") or []))
+    return results
+
+
+def fetch_values_batch(sheet_id: str, ranges: Sequence[str]) -> List[List[List[Any]]]:
+    """Read several tabs or A1 ranges from one workbook in a single request.
+
+    Bare tab names are read whole. Results are returned in ``ranges`` order
+    with rows padded the same way as :func:`fetch_values`.
+    """
+
+    if not ranges:
+        return []
+    workbook = open_by_key(sheet_id)
+    a1_ranges = [_batch_range(name) for name in ranges]
+    response = _retry_with_backoff(async_adapter.values_batch_get, workbook, a1_ranges)
+    return _split_value_ranges(response, len(a1_ranges))
+
+
+async def afetch_values_batch(
+    sheet_id: str,
+    ranges: Sequence[str],
+    *,
+    timeout: float | None = None,
+) -> List[List[List[Any]]]:
+    """Async variant of :func:`fetch_values_batch`."""
+
+    if not ranges:
+        return []
+    workbook = await aopen_by_key(sheet_id, timeout=timeout)
+    a1_ranges = [_batch_range(name) for name in ranges]
+    kwargs: dict[str, Any] = {}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    response = await _retry_with_backoff_async(
+        async_adapter.avalues_batch_get, workbook, a1_ranges, **kwargs
+    )
+    return _split_value_ranges(response, len(a1_ranges))
+
+
+def _resolve_waiters(
+    waiters: List["asyncio.Future[List[List[Any]]]"],
+    values: List[List[Any]] | BaseException,
+) -> None:
+    for waiter in waiters:
+        if waiter.done():
+            continue
+        if isinstance(values, BaseException):
+            waiter.set_exception(values)
+        else:
+            waiter.set_result([list(row) for row in values])
+
+
+async def _flush_batch(sheet_id: str) -> None:
+    await asyncio.sleep(_BATCH_WINDOW_SEC)
+    pending = _PENDING_BATCHES.pop(sheet_id, {})
+    timeout = _BATCH_TIMEOUTS.pop(sheet_id, None)
+    if not pending:
+        return
+    ranges = list(pending)
+    try:
+        results: List[Any] = await afetch_values_batch(sheet_id, ranges, timeout=timeout)
+    except asyncio.CancelledError as exc:
+        for waiters in pending.values():
+            _resolve_waiters(waiters, exc)
+        raise
+    except Exception as exc:
+        if len(ranges) == 1:
+            results = [exc]
+        else:
+            # One bad tab fails the whole batch request; read the ranges on
+            # their own so only the callers of the bad range see the error.
+            log.warning(
+                "batched read failed; retrying ranges individually",
+                extra={"sheet_id": sheet_id, "ranges": len(ranges), "error": str(exc)},
+            )
+            try:
+                results = await asyncio.gather(
+                    *(_afetch_single_range(sheet_id, name, timeout) for name in ranges),
+                    return_exceptions=True,
+                )
+            except asyncio.CancelledError as cancelled:
+                for waiters in pending.values():
+                    _resolve_waiters(waiters, cancelled)
+                raise
+    for name, values in zip(ranges, results):
+        _resolve_waiters(pending[name], values)
+
+
+async def _afetch_single_range(
+    sheet_id: str, a1_range: str, timeout: float | None
+) -> List[List[Any]]:
+    results = await afetch_values_batch(sheet_id, [a1_range], timeout=timeout)
+    return results[0]
+
+
+async def _afetch_values_coalesced(
+    sheet_id: str, a1_range: str, *, timeout: float | None = None
+) -> List[List[Any]]:
+    """Join the pending batch read for ``sheet_id`` (or start one).
+
+    The batch uses the shortest ``timeout`` of the callers that joined it.
+    """
+
+    loop = asyncio.get_running_loop()
+    resolved = _resolve_sheet_id(sheet_id)
+    pending = _PENDING_BATCHES.get(resolved)
+    if pending is None:
+        pending = _PENDING_BATCHES[resolved] = {}
+        _BATCH_TIMEOUTS[resolved] = timeout
+        task = loop.create_task(_flush_batch(resolved))
+        _BATCH_TASKS.add(task)
+        task.add_done_callback(_BATCH_TASKS.discard)
+    elif timeout is not None:
+        current = _BATCH_TIMEOUTS.get(resolved)
+        _BATCH_TIMEOUTS[resolved] = timeout if current is None else min(current, timeout)
+    waiter: "asyncio.Future[List[List[Any]]]" = loop.create_future()
+    pending.setdefault(a1_range, []).append(waiter)
+    return await waiter
+
+
 def sheets_read(sheet_id: str, a1_range: str):
     """Read a specific ``a1_range`` from ``sheet_id`` with retry semantics."""
 
@@ -325,6 +521,17 @@ def call_with_backoff(func: Callable[..., _WorksheetT], *args: Any, **kwargs: An
     return _retry_with_backoff(func, *args, **kwargs)
 
 
+def appended_row_number(response: Any) -> int | None:
+    """Return the sheet row an ``append_row`` response reports, if it names one."""
+
+    if not isinstance(response, dict):
+        return None
+    updates = response.get("updates")
+    updated_range = updates.get("updatedRange") if isinstance(updates, dict) else None
+    match = re.search(r"![A-Za-z]+(\d+)", str(updated_range or ""))
+    return int(match.group(1)) if match else None
+
+
 def _get_config():
     """Return the cached config facade if available without raising."""
 
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import datetime as dt
+import hashlib
 import io
 import json
 import logging
 import os
-from typing import Any, Dict
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import importlib.util
 import requests
@@ -13,6 +18,8 @@ from PIL import Image, ImageChops  # noqa: F401 - provided for potential downstr
 from google.auth.transport.requests import Request
 from google.oauth2.service_account import Credentials
 
+from shared.sheets import async_adapter
+from shared.sheets import async_core
 from shared.sheets import core as sheets_core
 
 log = logging.getLogger("c1c.sheets.export")
@@ -29,6 +36,25 @@ if _pdf2image_spec is not None:
 
 GOOGLE_EXPORT_URL = "https://docs.google.com/spreadsheets/d/{sheet_id}/export"
 
+# Refresh the cached access token this long before Google's stated expiry.
+_TOKEN_REFRESH_MARGIN = dt.timedelta(minutes=5)
+
+_CREDS_LOCK = threading.Lock()
+_CREDS: Credentials | None = None
+_SESSION_LOCK = threading.Lock()
+_SESSION: requests.Session | None = None
+# google-auth's Request closes its session when collected, so keep one alive.
+_AUTH_REQUEST: Request | None = None
+
+_STATS_LOCK = threading.Lock()
+_STATS: Dict[str, int] = {
+    "exports": 0,
+    "token_refreshes": 0,
+    "auth_ms": 0,
+    "download_ms": 0,
+    "convert_ms": 0,
+}
+
 
 def _export_delay_seconds() -> float:
     """
@@ -77,13 +103,68 @@ def _service_account_info() -> Dict[str, Any]:
     return json.loads(raw)
 
 
-def _get_service_account_headers() -> dict[str, str]:
-    info = _service_account_info()
-    creds = Credentials.from_service_account_info(info, scopes=sheets_core.SCOPES)
-    creds.refresh(Request())
+def _http_session() -> requests.Session:
+    """Return the pooled session shared by token refreshes and export downloads."""
+
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4)
+            session.mount("https://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
+def _auth_request() -> Request:
+    global _AUTH_REQUEST
+    session = _http_session()
+    if _AUTH_REQUEST is None or _AUTH_REQUEST.session is not session:
+        _AUTH_REQUEST = Request(session=session)
+    return _AUTH_REQUEST
+
+
+def _token_expiring(creds: Credentials) -> bool:
     if not creds.token:
-        raise RuntimeError("service account token unavailable")
-    return {"Authorization": f"Bearer {creds.token}"}
+        return True
+    expiry = getattr(creds, "expiry", None)
+    if expiry is None:
+        return False
+    # google-auth stores expiry as a naive UTC datetime.
+    now = dt.datetime.now(dt.timezone.utc).replace(tzinfo=None)
+    return expiry - _TOKEN_REFRESH_MARGIN <= now
+
+
+def _get_service_account_headers() -> dict[str, str]:
+    global _CREDS
+    with _CREDS_LOCK:
+        if _CREDS is None:
+            info = _service_account_info()
+            _CREDS = Credentials.from_service_account_info(info, scopes=sheets_core.SCOPES)
+        creds = _CREDS
+        if _token_expiring(creds):
+            creds.refresh(_auth_request())
+            _record_stats(token_refreshes=1)
+        if not creds.token:
+            raise RuntimeError("service account token unavailable")
+        return {"Authorization": f"Bearer {creds.token}"}
+
+
+def _record_stats(**deltas: int) -> None:
+    with _STATS_LOCK:
+        for key, value in deltas.items():
+            _STATS[key] = _STATS.get(key, 0) + int(value)
+
+
+def export_stats() -> Dict[str, int]:
+    """Return cumulative export counters and per-phase totals (milliseconds)."""
+
+    with _STATS_LOCK:
+        return dict(_STATS)
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.perf_counter() - started) * 1000)
 
 
 def _log_error(reason: str, *, log_context: dict[str, Any]) -> None:
@@ -143,19 +224,40 @@ def _export_pdf_as_png_sync(
 ) -> bytes | None:
     context = {"range": cell_range}
     context.update(log_context or {})
+    timings = {"auth_ms": 0, "download_ms": 0, "convert_ms": 0}
+    try:
+        return _export_phases(sheet_id, gid, cell_range, context, timings)
+    finally:
+        _record_stats(exports=1, **timings)
+        log.debug(
+            "export_pdf_as_png timings",
+            extra={"label": context.get("label", ""), "range": cell_range, **timings},
+        )
+
 
+def _export_phases(
+    sheet_id: str,
+    gid: str | int | None,
+    cell_range: str,
+    context: dict[str, Any],
+    timings: dict[str, int],
+) -> bytes | None:
+    started = time.perf_counter()
     try:
         headers = _get_service_account_headers()
     except Exception as exc:  # pragma: no cover - network/auth failure
         _log_error(f"auth_failure:{exc}", log_context=context)
         return None
+    finally:
+        timings["auth_ms"] = _elapsed_ms(started)
 
     if not gid and gid != 0:
         _log_error("missing_gid", log_context=context)
         return None
 
+    started = time.perf_counter()
     try:
-        response = requests.get(
+        response = _http_session().get(
             GOOGLE_EXPORT_URL.format(sheet_id=sheet_id),
             headers=headers,
             params={
@@ -167,9 +269,12 @@ def _export_pdf_as_png_sync(
             },
             timeout=20,
         )
+        pdf_content = response.content or b""
     except Exception as exc:  # pragma: no cover - network failure
         _log_error(f"pdf_request_failed:{exc}", log_context=context)
         return None
+    finally:
+        timings["download_ms"] = _elapsed_ms(started)
 
     if response.status_code != 200:
         _log_error(
@@ -178,12 +283,15 @@ def _export_pdf_as_png_sync(
         )
         return None
 
-    pdf_content = response.content or b""
     if not pdf_content:
         _log_error("empty_pdf_response", log_context=context)
         return None
 
-    return _convert_pdf_to_png(pdf_content)
+    started = time.perf_counter()
+    try:
+        return _convert_pdf_to_png(pdf_content)
+    finally:
+        timings["convert_ms"] = _elapsed_ms(started)
 
 
 async def export_pdf_as_png(
@@ -198,6 +306,8 @@ async def export_pdf_as_png(
         label = str(log_context.get("label", ""))
 
     try:
+        with async_adapter.lane(async_adapter.LANE_BULK):
+            await async_adapter.athrottle()
         return await asyncio.to_thread(
             _export_pdf_as_png_sync,
             sheet_id,
@@ -207,3 +317,168 @@ async def export_pdf_as_png(
         )
     finally:
         await _sleep_after_export(label)
+
+
+# ---------------------------------------------------------------------------
+# Change detection for exported ranges
+# ---------------------------------------------------------------------------
+
+
+def _digest(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+
+def range_fingerprint(values: Sequence[Sequence[Any]]) -> str:
+    """Return a stable hash of a range's formatted values."""
+
+    normalized = [["" if cell is None else str(cell) for cell in row] for row in values or []]
+    return _digest(json.dumps(normalized, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def _quoted_range(tab_name: str, cell_range: str) -> str:
+    return "'" + tab_name.replace("'", "''") + "'!" + cell_range
+
+
+async def afetch_range_fingerprints(
+    sheet_id: str, ranges: Sequence[Tuple[str, str]]
+) -> List[Optional[str]]:
+    """Fingerprint ``(tab, range)`` pairs with one batched values read.
+
+    Returns ``None`` for every entry when the read fails so callers fall back to
+    exporting unconditionally.
+    """
+
+    if not ranges:
+        return []
+    a1_ranges = [_quoted_range(tab, cell_range) for tab, cell_range in ranges]
+    try:
+        with async_adapter.lane(async_adapter.LANE_BULK):
+            results = await async_core.afetch_values_batch(sheet_id, a1_ranges)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        log.warning("export fingerprint read failed", extra={"error": str(exc)})
+        return [None] * len(ranges)
+    return [range_fingerprint(values) for values in results]
+
+
+class ExportFingerprints:
+    """Last exported source/PNG fingerprints per export key.
+
+    Backed by ``export_fingerprints.json`` (plus one PNG per key) under
+    ``directory`` when given, otherwise kept in memory for the process lifetime.
+    Async callers use :meth:`aload_png` / :meth:`aremember`, which run the disk
+    I/O in a worker thread.
+    """
+
+    _FILENAME = "export_fingerprints.json"
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None) -> None:
+        self.directory = Path(directory) if directory else None
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._pngs: Dict[str, bytes] = {}
+        self._load()
+
+    def _index_path(self) -> Optional[Path]:
+        return self.directory / self._FILENAME if self.directory else None
+
+    def _png_path(self, key: str) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        return self.directory / "exports" / f"{_digest(key.encode('utf-8'))[:24]}.png"
+
+    def _load(self) -> None:
+        path = self._index_path()
+        if path is None or not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            log.warning("export fingerprints unreadable", extra={"error": str(exc)})
+            return
+        if isinstance(data, dict):
+            self._entries = {
+                str(key): dict(value) for key, value in data.items() if isinstance(value, dict)
+            }
+
+    def _save(self) -> None:
+        path = self._index_path()
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self._entries, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def source_unchanged(self, key: str, fingerprint: Optional[str]) -> bool:
+        if not fingerprint:
+            return False
+        with self._lock:
+            entry = self._entries.get(key)
+        return bool(entry) and entry.get("source") == fingerprint
+
+    def png_unchanged(self, key: str, png: bytes) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+        return bool(entry) and entry.get("png") == _digest(png)
+
+    def load_png(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            cached = self._pngs.get(key)
+        if cached is not None:
+            return cached
+        path = self._png_path(key)
+        if path is None:
+            return None
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        if not self.png_unchanged(key, data):
+            return None
+        with self._lock:
+            self._pngs[key] = data
+        return data
+
+    def remember(self, key: str, fingerprint: Optional[str], png: bytes) -> None:
+        """Record ``png`` as the current export for ``key``."""
+
+        with self._lock:
+            self._entries[key] = {"source": fingerprint or "", "png": _digest(png)}
+            self._pngs[key] = png
+            try:
+                path = self._png_path(key)
+                if path is not None:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_bytes(png)
+                self._save()
+            except OSError as exc:
+                log.warning("export fingerprints not persisted", extra={"error": str(exc)})
+
+    async def aload_png(self, key: str) -> Optional[bytes]:
+        return await asyncio.to_thread(self.load_png, key)
+
+    async def aremember(self, key: str, fingerprint: Optional[str], png: bytes) -> None:
+        await asyncio.to_thread(self.remember, key, fingerprint, png)
+
+
+_FINGERPRINTS: ExportFingerprints | None = None
+
+
+def get_fingerprint_store() -> ExportFingerprints:
+    """Return the shared store (persisted under ``CACHE_SNAPSHOT_DIR`` when set)."""
+
+    global _FINGERPRINTS
+    if _FINGERPRINTS is None:
+        directory = os.getenv("CACHE_SNAPSHOT_DIR", "").strip() or None
+        _FINGERPRINTS = ExportFingerprints(directory)
+    return _FINGERPRINTS
+
+
+async def aget_fingerprint_store() -> ExportFingerprints:
+    """Async variant of :func:`get_fingerprint_store` that loads the index off the loop."""
+
+    if _FINGERPRINTS is None:
+        return await asyncio.to_thread(get_fingerprint_store)
+    return _FINGERPRINTS
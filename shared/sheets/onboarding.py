@@ -696,7 +696,7 @@ async def _load_clan_tags_async() -> List[str]:
     _ensure_service_account_credentials()
     sheet_id = _sheet_id()
     tab = _clanlist_tab()
-    values = await afetch_values(sheet_id, tab)
+    values = await afetch_values(sheet_id, tab, batched=True)
     tags: List[str] = []
     for row in values:
         if len(row) < 2:
@@ -26,12 +26,16 @@ __all__ = [
     "get_questions",
     "register_cache_buckets",
     "schema_hash",
+    "schema_hash_stats",
 ]
 
 log = logging.getLogger(__name__)
 
 _cached_rows_snapshot: Tuple[dict[str, str], ...] | None = None
 _cached_questions_by_flow: dict[str, Tuple[Question, ...]] = {}
+# Schema hashes share the lifetime of ``_cached_questions_by_flow``.
+_cached_schema_hash_by_flow: dict[str, str] = {}
+_schema_hash_computations = 0
 
 def _question_tab() -> str:
     """Return the configured onboarding question tab name."""
@@ -136,7 +140,7 @@ async def fetch_question_rows_async() -> Tuple[dict[str, str], ...]:
             "has_ONBOARDING_TAB": "true" if has_onboarding_tab else "false",
         },
     )
-    records = await afetch_records(sheet_id, tab)
+    records = await afetch_records(sheet_id, tab, batched=True)
     return _normalise_records(records)
 
 
@@ -159,16 +163,15 @@ def cached_rows() -> Tuple[dict[str, str], ...] | None:
 
     from shared.sheets.cache_service import cache
 
-    bucket = cache.get_bucket("onboarding_questions")
-    if bucket is None:
+    if cache.get_bucket("onboarding_questions") is None:
         return None
-    return _coerce_rows(bucket.value)
+    return _coerce_rows(cache.peek("onboarding_questions"))
 
 
 def _cached_rows() -> Tuple[dict[str, str], ...]:
     """Return the cached onboarding question rows."""
 
-    global _cached_rows_snapshot, _cached_questions_by_flow
+    global _cached_rows_snapshot, _cached_questions_by_flow, _cached_schema_hash_by_flow
 
     from shared.sheets.cache_service import cache
 
@@ -176,12 +179,14 @@ def _cached_rows() -> Tuple[dict[str, str], ...]:
     if bucket is None:
         _cached_rows_snapshot = None
         _cached_questions_by_flow.clear()
+        _cached_schema_hash_by_flow.clear()
         raise RuntimeError("onboarding_questions cache bucket is not registered")
 
-    rows = _coerce_rows(bucket.value)
+    rows = _coerce_rows(cache.peek("onboarding_questions"))
     if rows is None:
         _cached_rows_snapshot = None
         _cached_questions_by_flow.clear()
+        _cached_schema_hash_by_flow.clear()
         raise RuntimeError("onboarding_questions cache is empty (should be preloaded)")
     return rows
 
@@ -389,12 +394,13 @@ def _hash_payload(questions: Iterable[Question]) -> str:
 
 
 def _questions_tuple(flow: str) -> Tuple[Question, ...]:
-    global _cached_rows_snapshot, _cached_questions_by_flow
+    global _cached_rows_snapshot, _cached_questions_by_flow, _cached_schema_hash_by_flow
 
     rows = _cached_rows()
     if rows is not _cached_rows_snapshot:
         _cached_rows_snapshot = rows
         _cached_questions_by_flow = {}
+        _cached_schema_hash_by_flow = {}
 
     if flow not in _cached_questions_by_flow:
         _cached_questions_by_flow[flow] = tuple(_build_questions(flow, rows))
@@ -404,8 +410,24 @@ def _questions_tuple(flow: str) -> Tuple[Question, ...]:
 def schema_hash(flow: str) -> str:
     """Return the stable schema hash for the onboarding question flow."""
 
+    global _schema_hash_computations
+
     questions = _questions_tuple(flow)
-    return _hash_payload(questions)
+    cached = _cached_schema_hash_by_flow.get(flow)
+    if cached is None:
+        cached = _hash_payload(questions)
+        _cached_schema_hash_by_flow[flow] = cached
+        _schema_hash_computations += 1
+    return cached
+
+
+def schema_hash_stats() -> dict[str, int]:
+    """Return how often schema hashes were computed versus currently cached."""
+
+    return {
+        "computed": _schema_hash_computations,
+        "cached_flows": len(_cached_schema_hash_by_flow),
+    }
 
 
 def register_cache_buckets() -> None:
@@ -3,7 +3,11 @@ from __future__ import annotations
 from datetime import datetime, timezone
 import json
 import logging
-from typing import Any, Dict, Iterable, Optional, Sequence
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
 
 from shared.config import get_onboarding_sessions_tab, get_onboarding_sheet_id
 from shared.sheets import core
@@ -29,6 +33,12 @@ _HEADER_MISMATCH_LOGGED = False
 _MISSING_COLUMN_LOGGED = False
 _REQUIRED_COLUMNS = {"thread_id", "thread_name", "updated_at"}
 
+_INDEX_TTL = int(os.getenv("SHEETS_CACHE_TTL_SEC", "900"))
+_INDEX_LOCK = threading.RLock()
+_INDEX: Optional["_SessionIndex"] = None
+_SAVE_LISTENERS: list[Callable[[Dict[str, Any]], None]] = []
+_SAVE_LOCKS: "weakref.WeakValueDictionary[str, threading.Lock]" = weakref.WeakValueDictionary()
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -44,26 +54,131 @@ def _sheet():
     return core.get_worksheet(sheet_id, tab_name)
 
 
-def load(user_id: int | None, thread_id: int) -> Optional[Dict[str, Any]]:
+class _SessionRow:
+    """One sheet row; the record and answers are decoded on first use."""
+
+    __slots__ = ("row_number", "values", "_record", "_answers")
+
+    def __init__(self, row_number: int, values: Sequence[Any]) -> None:
+        self.row_number = row_number
+        self.values = list(values)
+        self._record: Optional[Dict[str, Any]] = None
+        self._answers: Optional[Dict[str, Any]] = None
+
+    def record(self, index: "_SessionIndex") -> Dict[str, Any]:
+        if self._record is None:
+            self._record = _record_from_row(self.values, index.header, index.header_map)
+        return self._record
+
+    def answers(self, index: "_SessionIndex") -> Dict[str, Any]:
+        if self._answers is None:
+            raw_answers = self.record(index).get("answers_json") or "{}"
+            try:
+                answers = json.loads(raw_answers)
+            except Exception:
+                answers = {}
+            self._answers = answers if isinstance(answers, dict) else {}
+        return self._answers
+
+    def replace(self, values: Sequence[Any]) -> None:
+        self.values = list(values)
+        self._record = None
+        self._answers = None
+
+
+class _SessionIndex:
+    """Thread id → sheet row index built from one ``get_all_values`` read."""
+
+    __slots__ = ("worksheet", "header", "header_map", "rows", "by_thread", "loaded_at")
+
+    def __init__(self, worksheet: Any, header: list[str], rows: Sequence[Sequence[Any]]) -> None:
+        self.worksheet = worksheet
+        self.header = header
+        self.header_map = _header_index_map(header)
+        self.rows: list[_SessionRow] = []
+        self.by_thread: Dict[str, _SessionRow] = {}
+        self.loaded_at = time.monotonic()
+        for row_number, values in enumerate(rows, start=2):
+            self.add(_SessionRow(row_number, values))
+
+    def add(self, row: _SessionRow) -> None:
+        self.rows.append(row)
+        thread_id = str(_cell(row.values, self.header_map, "thread_id") or "").strip()
+        # First match wins, mirroring the old top-down scan.
+        if thread_id and thread_id not in self.by_thread:
+            self.by_thread[thread_id] = row
+
+    def find(self, thread_id: int | str | None) -> Optional[_SessionRow]:
+        if thread_id is None:
+            return None
+        target_thread = str(thread_id).strip()
+        if not target_thread:
+            return None
+        return self.by_thread.get(target_thread)
+
+    def fresh(self, worksheet: Any) -> bool:
+        return worksheet is self.worksheet and time.monotonic() - self.loaded_at < _INDEX_TTL
+
+
+def _session_index(*, force: bool = False) -> Optional[_SessionIndex]:
+    """Return the cached row index, re-reading the tab when stale or forced."""
+
+    global _INDEX
     worksheet = _sheet()
-    rows = worksheet.get_all_values()
-    header = _validated_header(rows[0] if rows else [])
-    if header is None:
-        return None
+    with _INDEX_LOCK:
+        index = _INDEX
+        if not force and index is not None and index.fresh(worksheet):
+            return index
+        rows = worksheet.get_all_values()
+        header = _validated_header(rows[0] if rows else [])
+        if header is None:
+            _INDEX = None
+            return None
+        _INDEX = _SessionIndex(worksheet, header, rows[1:])
+        return _INDEX
 
-    header_map = _header_index_map(header)
-    target_row = _get_row_index_by_thread_id(rows[1:], header_map, thread_id)
-    if target_row is None:
-        return None
 
-    row = rows[target_row]
-    record = _record_from_row(row, header, header_map)
-    raw_answers = record.get("answers_json") or "{}"
-    try:
-        answers = json.loads(raw_answers)
-    except Exception:
-        answers = {}
+def prefetch() -> int:
+    """Re-read the whole tab into the row index; returns the number of sessions."""
+
+    index = _session_index(force=True)
+    return len(index.by_thread) if index is not None else 0
+
+
+def add_save_listener(listener: Callable[[Dict[str, Any]], None]) -> None:
+    """Call ``listener`` with the stored session after every successful save.
+
+    Listeners run on the thread that performed the save (usually the Sheets
+    executor) and must not block; exceptions are logged and swallowed.
+    """
+
+    if listener not in _SAVE_LISTENERS:
+        _SAVE_LISTENERS.append(listener)
+
 
+def remove_save_listener(listener: Callable[[Dict[str, Any]], None]) -> None:
+    if listener in _SAVE_LISTENERS:
+        _SAVE_LISTENERS.remove(listener)
+
+
+def _notify_saved(session: Dict[str, Any]) -> None:
+    for listener in list(_SAVE_LISTENERS):
+        try:
+            listener(session)
+        except Exception:
+            log.debug("onboarding session save listener failed", exc_info=True)
+
+
+def invalidate_index() -> None:
+    """Drop the cached row index so the next call re-reads the tab."""
+
+    global _INDEX
+    with _INDEX_LOCK:
+        _INDEX = None
+
+
+def _session_from_row(row: _SessionRow, index: _SessionIndex) -> Dict[str, Any]:
+    record = row.record(index)
     panel_id = _safe_int(record.get("panel_message_id"))
     completed_token = str(record.get("completed", "")).strip().lower()
     completed = completed_token in {"true", "1", "yes", "true"}
@@ -80,81 +195,111 @@ def load(user_id: int | None, thread_id: int) -> Optional[Dict[str, Any]]:
         "first_reminder_at": record.get("first_reminder_at") or "",
         "warning_sent_at": record.get("warning_sent_at") or "",
         "auto_closed_at": record.get("auto_closed_at") or "",
-        "answers": answers,
+        "answers": dict(row.answers(index)),
     }
 
 
-def load_all() -> list[Dict[str, Any]]:
-    worksheet = _sheet()
-    rows = worksheet.get_all_values()
-    header = _validated_header(rows[0] if rows else [])
-    if header is None:
-        return []
+def load(user_id: int | None, thread_id: int) -> Optional[Dict[str, Any]]:
+    index = _session_index()
+    if index is None:
+        return None
 
-    header_map = _header_index_map(header)
-    sessions: list[Dict[str, Any]] = []
+    row = index.find(thread_id)
+    if row is None:
+        return None
+    return _session_from_row(row, index)
 
-    for row in rows[1:]:
-        record = _record_from_row(row, header, header_map)
-        raw_answers = record.get("answers_json") or "{}"
-        try:
-            answers = json.loads(raw_answers)
-        except Exception:
-            answers = {}
 
-        panel_id = _safe_int(record.get("panel_message_id"))
-        completed_token = str(record.get("completed", "")).strip().lower()
-        completed = completed_token in {"true", "1", "yes", "true"}
-        completed_at = record.get("completed_at") or None
-
-        sessions.append(
-            {
-                "thread_name": record.get("thread_name") or "",
-                "user_id": str(record.get("user_id") or ""),
-                "thread_id": str(record.get("thread_id") or ""),
-                "panel_message_id": panel_id if panel_id not in (None, 0) else None,
-                "step_index": _safe_int(record.get("step_index"), default=0),
-                "completed": completed,
-                "completed_at": completed_at,
-                "updated_at": record.get("updated_at") or "",
-                "first_reminder_at": record.get("first_reminder_at") or "",
-                "warning_sent_at": record.get("warning_sent_at") or "",
-                "auto_closed_at": record.get("auto_closed_at") or "",
-                "answers": answers,
-            }
-        )
-
-    return sessions
+def load_all() -> list[Dict[str, Any]]:
+    """Return every session row; always re-reads the tab and refreshes the index."""
 
+    index = _session_index(force=True)
+    if index is None:
+        return []
+    return [_session_from_row(row, index) for row in index.rows]
 
-def save(payload: Dict[str, Any], *, allow_create: bool = True) -> bool:
-    worksheet = _sheet()
-    rows = worksheet.get_all_values()
-    header = _validated_header(rows[0] if rows else [])
-    if header is None:
-        return False
 
-    header_map = _header_index_map(header)
-    target_row = _get_row_index_by_thread_id(rows[1:], header_map, payload.get("thread_id"))
+def _save_lock(thread_key: str) -> threading.Lock:
+    """Return the lock that serialises saves for one thread."""
+
+    with _INDEX_LOCK:
+        lock = _SAVE_LOCKS.get(thread_key)
+        if lock is None:
+            lock = threading.Lock()
+            _SAVE_LOCKS[thread_key] = lock
+        return lock
 
-    existing: Dict[str, Any] = {}
-    if target_row is not None:
-        existing = _record_from_row(rows[target_row], header, header_map)
 
-    record = _merge_record(existing, payload)
-    values = build_row(record, headers=header)
+def _record_saved_row(
+    index: _SessionIndex, thread_key: str, row_number: Optional[int], values: Sequence[Any]
+) -> None:
+    """Mirror a finished sheet write into the live index; caller holds ``_INDEX_LOCK``."""
 
-    if target_row is not None:
-        worksheet.update(_range_for_row(target_row + 1, header), [values])
-    elif allow_create:
-        worksheet.append_row(values)
+    live = _INDEX
+    if live is None:
+        return
+    if row_number is None:
+        invalidate_index()
+        return
+    row = live.find(thread_key)
+    if row is not None and row.row_number == row_number:
+        row.replace(values)
+    elif row is None and live is index:
+        live.add(_SessionRow(row_number, values))
     else:
-        log.info(
-            "🧾 onboarding session skipped • thread_id=%s • reason=missing_row",
-            record.get("thread_id"),
-        )
-        return False
+        # The index was reloaded while the write was in flight and does not
+        # agree with it; re-read on the next call rather than guess.
+        invalidate_index()
+
 
+def save(payload: Dict[str, Any], *, allow_create: bool = True) -> bool:
+    thread_key = str(payload.get("thread_id") or "").strip()
+    # Saves for the same thread run one at a time so merges never race; the
+    # index lock is only held for lookups, never across the sheet write.
+    with _save_lock(thread_key):
+        for attempt in range(2):
+            with _INDEX_LOCK:
+                index = _session_index(force=attempt > 0)
+                if index is None:
+                    return False
+                target = index.find(thread_key)
+                existing = target.record(index) if target is not None else {}
+
+            record = _merge_record(existing, payload)
+            values = build_row(record, headers=index.header)
+            worksheet = index.worksheet
+            try:
+                if target is not None:
+                    worksheet.update(_range_for_row(target.row_number, index.header), [values])
+                    row_number: Optional[int] = target.row_number
+                elif allow_create:
+                    row_number = core.appended_row_number(worksheet.append_row(values))
+                else:
+                    log.info(
+                        "🧾 onboarding session skipped • thread_id=%s • reason=missing_row",
+                        record.get("thread_id"),
+                    )
+                    return False
+            except Exception:
+                invalidate_index()
+                if target is None or attempt:
+                    raise
+                # The indexed row may have moved out of band; re-read and retry once.
+                log.info(
+                    "🧾 onboarding session update failed; re-indexing • thread_id=%s • row=%s",
+                    thread_key,
+                    target.row_number,
+                    exc_info=True,
+                )
+                continue
+            break
+
+        with _INDEX_LOCK:
+            _record_saved_row(index, thread_key, row_number, values)
+        stored = _session_from_row(_SessionRow(0, values), index) if _SAVE_LISTENERS else None
+
+    if stored is not None:
+        _notify_saved(stored)
     log.info(
         "🧾 onboarding session saved • thread_id=%s • thread_name=%s • answers=%s",
         record.get("thread_id"),
@@ -301,11 +446,13 @@ def _record_from_row(row: Sequence[Any], header: Sequence[str], header_map: Dict
 
 
 def _merge_record(existing: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
-    existing_answers = existing.get("answers_json") or existing.get("answers") or "{}"
-    try:
-        existing_answers = json.loads(existing_answers)
-    except Exception:
-        existing_answers = {}
+    existing_answers: Any = {}
+    if "answers" not in payload:
+        existing_answers = existing.get("answers_json") or existing.get("answers") or "{}"
+        try:
+            existing_answers = json.loads(existing_answers)
+        except Exception:
+            existing_answers = {}
 
     merged_payload: Dict[str, Any] = {
         "thread_name": payload.get("thread_name") or existing.get("thread_name") or "",
@@ -338,23 +485,6 @@ def _cell(row: Sequence[Any], header_map: Dict[str, int], key: str) -> Any:
         return ""
 
 
-def _get_row_index_by_thread_id(
-    rows: Sequence[Sequence[Any]], header_map: Dict[str, int], thread_id: int | str | None
-) -> Optional[int]:
-    if thread_id is None:
-        return None
-    target_thread = str(thread_id).strip()
-    if not target_thread:
-        return None
-    for idx, row in enumerate(rows, start=1):
-        row_thread = str(_cell(row, header_map, "thread_id") or "").strip()
-        if not row_thread:
-            continue
-        if row_thread == target_thread:
-            return idx
-    return None
-
-
 def _safe_int(value: Any, *, default: int | None = None) -> int | None:
     try:
         return int(value)
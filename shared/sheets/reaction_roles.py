@@ -134,7 +134,7 @@ async def fetch_reaction_role_rows_async() -> tuple[ReactionRoleRow, ...]:
         tab,
         extra={"sheet_tail": sheet_tail, "tab": tab},
     )
-    records = await afetch_records(sheet_id, tab)
+    records = await afetch_records(sheet_id, tab, batched=True)
     return _parse_rows(records or [], _ParseContext(sheet_tail=sheet_tail, tab=tab))
 
 
@@ -147,16 +147,18 @@ def register_cache_buckets() -> None:
 
     if cache.get_bucket("reaction_roles") is not None:
         return
-    cache.register("reaction_roles", _CACHE_TTL, _load_reaction_roles)
+    cache.register(
+        "reaction_roles",
+        _CACHE_TTL,
+        _load_reaction_roles,
+        decode=lambda rows: tuple(ReactionRoleRow(*row) for row in rows or ()),
+    )
 
 
 def cached_reaction_roles() -> tuple[ReactionRoleRow, ...] | None:
     from shared.sheets.cache_service import cache
 
-    bucket = cache.get_bucket("reaction_roles")
-    if bucket is None:
-        return None
-    value = bucket.value
+    value = cache.peek("reaction_roles")
     if value is None:
         return None
     if isinstance(value, tuple):
@@ -229,23 +229,25 @@ def _make_clan_record(row: Sequence[str], header_map: Dict[str, int]) -> Recruit
 def _process_clan_sheet(
     raw_rows: List[List[str]], now: float, tab: str
 ) -> List[List[str]]:
-    global _CLAN_HEADER_ROW, _CLAN_HEADER_MAP, _CLAN_HEADER_TS
-    global _CLAN_RECORDS, _CLAN_RECORDS_TS
-
     header_row = _find_header_row(raw_rows)
     header_map = _build_header_map(header_row, tab)
     sanitized = _sanitize_clan_rows(raw_rows, header_map.get("roster"))
+    _store_clan_records(header_row, header_map, sanitized, now)
+    return sanitized
 
-    records = [_make_clan_record(row, header_map) for row in sanitized]
+
+def _store_clan_records(
+    header_row: Sequence[Any], header_map: Dict[str, int], rows: List[List[str]], now: float
+) -> None:
+    global _CLAN_HEADER_ROW, _CLAN_HEADER_MAP, _CLAN_HEADER_TS
+    global _CLAN_RECORDS, _CLAN_RECORDS_TS
 
     _CLAN_HEADER_ROW = list(header_row)
     _CLAN_HEADER_MAP = dict(header_map)
     _CLAN_HEADER_TS = now
-    _CLAN_RECORDS = records
+    _CLAN_RECORDS = [_make_clan_record(row, header_map) for row in rows]
     _CLAN_RECORDS_TS = now
 
-    return sanitized
-
 
 def _sheet_id() -> str:
     sheet_id = os.getenv("RECRUITMENT_SHEET_ID", "").strip()
@@ -433,6 +435,18 @@ def _sanitize_clan_rows(
     return cleaned
 
 
+def _record_clans_access(*, hit: bool) -> None:
+    """Mirror module-level roster reads into the ``clans`` bucket stats."""
+
+    bucket = cache.get_bucket("clans")
+    if bucket is None:
+        return
+    if hit:
+        bucket.stats.hits += 1
+    else:
+        bucket.stats.misses += 1
+
+
 def fetch_clans(force: bool = False) -> List[List[str]]:
     """Fetch the recruitment clan matrix from Sheets."""
 
@@ -443,8 +457,11 @@ def fetch_clans(force: bool = False) -> List[List[str]]:
         if _CLAN_TAG_INDEX is None:
             _CLAN_TAG_INDEX = _build_tag_index(_CLAN_ROWS)
             _CLAN_TAG_INDEX_TS = _CLAN_ROWS_TS
+        _record_clans_access(hit=True)
         return _CLAN_ROWS
 
+    if not force:
+        _record_clans_access(hit=False)
     tab = _clans_tab()
     rows = core.fetch_values(_sheet_id(), tab)
     sanitized = _process_clan_sheet(rows, now, tab)
@@ -507,9 +524,9 @@ def fetch_welcome_templates(tab: str | None = None) -> List[Dict[str, Any]]:
 def get_cached_welcome_templates() -> List[Dict[str, Any]]:
     """Return cached WelcomeTemplates rows when available, falling back to a live fetch."""
 
-    bucket = cache.get_bucket("templates")
-    if bucket and bucket.value is not None:
-        return cast(List[Dict[str, Any]], bucket.value)
+    value = cache.peek("templates")
+    if value is not None:
+        return cast(List[Dict[str, Any]], value)
     return fetch_welcome_templates()
 
 
@@ -524,7 +541,7 @@ async def _load_clans_async() -> List[List[str]]:
     _ensure_service_account_credentials()
     sheet_id = _sheet_id()
     tab = _clans_tab()
-    rows = await afetch_values(sheet_id, tab)
+    rows = await afetch_values(sheet_id, tab, batched=True)
     now = time.time()
     sanitized = _process_clan_sheet(rows, now, tab)
 
@@ -541,18 +558,73 @@ async def _load_templates_async() -> List[Dict[str, Any]]:
     _ensure_service_account_credentials()
     sheet_id = _sheet_id()
     tab = _templates_tab()
-    return await afetch_records(sheet_id, tab)
+    rows = await afetch_records(sheet_id, tab, batched=True)
 
+    global _TEMPLATE_ROWS, _TEMPLATE_ROWS_TS
+    _TEMPLATE_ROWS = rows
+    _TEMPLATE_ROWS_TS = time.time()
+
+    return rows
 
 
+def _encode_clans_snapshot(rows: List[List[str]]) -> Dict[str, Any]:
+    # Sanitized rows drop the header, which the records need; keep it alongside.
+    return {"header": list(_CLAN_HEADER_ROW or []), "rows": rows}
+
+
+def _decode_clans_snapshot(value: Any) -> List[List[str]]:
+    """Rebuild the clan rows, records and tag index from a disk snapshot.
+
+    The module state is seeded only when no live load has landed yet, so
+    recruiter searches are served from the snapshot instead of a blocking
+    Sheets read while the first live refresh runs.
+    """
+
+    global _CLAN_ROWS, _CLAN_ROWS_TS, _CLAN_TAG_INDEX, _CLAN_TAG_INDEX_TS
+
+    if isinstance(value, dict):
+        header_row = list(value.get("header") or [])
+        raw_rows = value.get("rows") or []
+    else:
+        header_row, raw_rows = [], value or []
+    rows = [list(row) for row in raw_rows]
+    if header_row and _CLAN_ROWS is None:
+        now = time.time()
+        # The tab name only labels header warnings; resolving it could hit Sheets.
+        header_map = _build_header_map(header_row, "snapshot")
+        _store_clan_records(header_row, header_map, rows, now)
+        _CLAN_ROWS = rows
+        _CLAN_ROWS_TS = now
+        _CLAN_TAG_INDEX = _build_tag_index(rows)
+        _CLAN_TAG_INDEX_TS = now
+    return rows
+
+
+def _decode_templates_snapshot(value: Any) -> List[Dict[str, Any]]:
+    global _TEMPLATE_ROWS, _TEMPLATE_ROWS_TS
+
+    rows = [dict(row) for row in value or []]
+    if _TEMPLATE_ROWS is None:
+        _TEMPLATE_ROWS = rows
+        _TEMPLATE_ROWS_TS = time.time()
+    return rows
+
 
 def register_cache_buckets() -> None:
     """Register recruitment cache buckets if they are not already present."""
 
     if cache.get_bucket("clans") is None:
-        cache.register("clans", _TTL_CLANS_SEC, _load_clans_async)
+        cache.register(
+            "clans",
+            _TTL_CLANS_SEC,
+            _load_clans_async,
+            decode=_decode_clans_snapshot,
+            encode=_encode_clans_snapshot,
+        )
     if cache.get_bucket("templates") is None:
-        cache.register("templates", _TTL_TEMPLATES_SEC, _load_templates_async)
+        cache.register(
+            "templates", _TTL_TEMPLATES_SEC, _load_templates_async, decode=_decode_templates_snapshot
+        )
 
 
 def _normalize_tag(tag: str | None) -> str:
@@ -5,15 +5,24 @@ from __future__ import annotations
 import datetime as dt
 import inspect
 import logging
+import os
 import re
-from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, List, Optional, Protocol, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Protocol, Sequence
 
 from shared.sheets import async_core
 from shared.sheets import recruitment
+from shared.sheets import write_behind
+from shared.sheets.core import appended_row_number
 
 log = logging.getLogger(__name__)
 
+_CACHE_BUCKET = "reservations"
+_CACHE_TTL = int(os.getenv("SHEETS_CACHE_TTL_SEC", "900"))
+
+# Bumped on every write so a ledger load that raced a write is not trusted.
+_WRITE_GENERATION = 0
+
 
 class SupportsMemberLookup(Protocol):
     """Minimal protocol for Discord guild lookups."""
@@ -83,14 +92,122 @@ class ReservationRow:
 
 @dataclass(slots=True)
 class ReservationLedger:
-    """Container for parsed reservation rows and header metadata."""
+    """Container for parsed reservation rows and header metadata.
+
+    Active rows are indexed by clan tag, recruit id, username snapshot and
+    thread id; the ``apply_*`` helpers keep those indexes in step with writes.
+    """
 
     rows: list[ReservationRow]
     status_index: int
+    # Set when a write could not be mirrored locally; the next read reloads.
+    dirty: bool = field(default=False, compare=False)
+    _by_row: dict[int, ReservationRow] = field(init=False, repr=False, compare=False)
+    _by_clan: dict[str, list[ReservationRow]] = field(init=False, repr=False, compare=False)
+    _by_user: dict[int, list[ReservationRow]] = field(init=False, repr=False, compare=False)
+    _by_username: dict[str, list[ReservationRow]] = field(init=False, repr=False, compare=False)
+    _by_thread: dict[int, list[ReservationRow]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._by_row = {}
+        self._by_clan = {}
+        self._by_user = {}
+        self._by_username = {}
+        self._by_thread = {}
+        for row in self.rows:
+            self._by_row[row.row_number] = row
+            self._index(row)
+
+    def __len__(self) -> int:
+        return len(self.rows)
 
     def status_column(self) -> int | None:
         return self.status_index
 
+    def _index_keys(self, row: ReservationRow) -> Iterable[tuple[dict[Any, list[ReservationRow]], Any]]:
+        return (
+            (self._by_clan, row.normalized_clan_tag),
+            (self._by_user, row.ticket_user_id),
+            (self._by_username, _normalize_username(row.username_snapshot)),
+            (self._by_thread, _thread_key(row.thread_id)),
+        )
+
+    def _index(self, row: ReservationRow) -> None:
+        if not row.is_active:
+            return
+        for mapping, key in self._index_keys(row):
+            if key is None or key == "":
+                continue
+            bucket = mapping.setdefault(key, [])
+            bucket.append(row)
+            if len(bucket) > 1 and bucket[-2].row_number > row.row_number:
+                bucket.sort(key=lambda item: item.row_number)
+
+    def _unindex(self, row: ReservationRow) -> None:
+        if not row.is_active:
+            return
+        for mapping, key in self._index_keys(row):
+            bucket = mapping.get(key)
+            if not bucket:
+                continue
+            remaining = [item for item in bucket if item is not row]
+            if remaining:
+                mapping[key] = remaining
+            else:
+                mapping.pop(key, None)
+
+    def row(self, row_number: int) -> ReservationRow | None:
+        return self._by_row.get(row_number)
+
+    def active_for_clan(self, clan_tag: str | None) -> list[ReservationRow]:
+        return list(self._by_clan.get(_normalize_tag(clan_tag), ()))
+
+    def active_for_user(self, ticket_user_id: int) -> list[ReservationRow]:
+        return list(self._by_user.get(ticket_user_id, ()))
+
+    def active_for_username(self, username: str | None) -> list[ReservationRow]:
+        return list(self._by_username.get(_normalize_username(username), ()))
+
+    def active_for_thread(self, thread_id: int | str | None) -> list[ReservationRow]:
+        return list(self._by_thread.get(_thread_key(thread_id), ()))
+
+    def active_by_clan(self) -> dict[str, list[ReservationRow]]:
+        return {tag: list(rows) for tag, rows in self._by_clan.items()}
+
+    def apply_status(self, row_number: int, status: str) -> bool:
+        """Mirror a status write; returns ``False`` when the row is unknown."""
+
+        row = self._by_row.get(row_number)
+        if row is None:
+            return False
+        self._unindex(row)
+        row.status = status
+        row.raw = _with_cell(row.raw, STATUS_COL, status)
+        self._index(row)
+        return True
+
+    def apply_expiry(self, row_number: int, reserved_until: dt.date) -> bool:
+        """Mirror a ``reserved_until`` write; returns ``False`` when the row is unknown."""
+
+        row = self._by_row.get(row_number)
+        if row is None:
+            return False
+        row.reserved_until = reserved_until
+        row.raw = _with_cell(row.raw, RESERVED_UNTIL_COL, reserved_until.isoformat())
+        return True
+
+    def append(self, row: ReservationRow) -> bool:
+        """Add a freshly appended sheet row, replacing any row at the same number."""
+
+        existing = self._by_row.get(row.row_number)
+        if existing is not None:
+            self._unindex(existing)
+            self.rows = [item for item in self.rows if item is not existing]
+        self.rows.append(row)
+        self._by_row[row.row_number] = row
+        self._index(row)
+        return True
+
 
 async def append_reservation_row(row_values: Sequence[Any]) -> None:
     """Append ``row_values`` to the reservations worksheet."""
@@ -106,11 +223,26 @@ async def append_reservation_row(row_values: Sequence[Any]) -> None:
     tab_name = recruitment.get_reservations_tab_name()
     worksheet = await async_core.aget_worksheet(sheet_id, tab_name)
     payload = [str(value) if value is not None else "" for value in row_values]
-    await async_core.acall_with_backoff(
-        worksheet.append_row,
-        payload,
-        value_input_option="RAW",
+    try:
+        response = await async_core.acall_with_backoff(
+            worksheet.append_row,
+            payload,
+            value_input_option="RAW",
+        )
+    except Exception:
+        _mark_ledger_dirty()
+        raise
+
+    row_number = appended_row_number(response)
+    if row_number is None:
+        _mark_ledger_dirty()
+        return
+    record = ReservationRow(
+        row_number=row_number,
+        **_parse_reservation_row(payload),
+        raw=list(payload),
     )
+    _mirror_write(lambda ledger: ledger.append(record))
 
 
 async def load_reservation_ledger() -> ReservationLedger:
@@ -150,6 +282,67 @@ async def load_reservation_ledger() -> ReservationLedger:
     return ReservationLedger(rows=records, status_index=STATUS_COLUMN_INDEX)
 
 
+async def _load_ledger_bucket() -> ReservationLedger:
+    generation = _WRITE_GENERATION
+    ledger = await load_reservation_ledger()
+    ledger.dirty = generation != _WRITE_GENERATION
+    return ledger
+
+
+def register_cache_buckets() -> None:
+    from shared.sheets.cache_service import cache
+
+    if cache.get_bucket(_CACHE_BUCKET) is not None:
+        return
+    cache.register(_CACHE_BUCKET, _CACHE_TTL, _load_ledger_bucket)
+
+
+def _cached_ledger() -> ReservationLedger | None:
+    from shared.sheets.cache_service import cache
+
+    bucket = cache.get_bucket(_CACHE_BUCKET)
+    if bucket is None or not isinstance(bucket.value, ReservationLedger):
+        return None
+    return bucket.value
+
+
+async def get_reservation_ledger() -> ReservationLedger:
+    """Return the cached reservations ledger, loading it on first use.
+
+    Reads fall straight through to :func:`load_reservation_ledger` when the
+    ``reservations`` cache bucket is not registered.
+    """
+
+    from shared.sheets.cache_service import cache
+
+    bucket = cache.get_bucket(_CACHE_BUCKET)
+    if bucket is None:
+        return await load_reservation_ledger()
+
+    ledger = _cached_ledger()
+    if ledger is None or ledger.dirty:
+        bucket.record_access()
+        ledger = await _load_ledger_bucket()
+        cache.prime(_CACHE_BUCKET, ledger)
+        return ledger
+
+    value = await cache.get(_CACHE_BUCKET)
+    return value if isinstance(value, ReservationLedger) else ledger
+
+
+def _mirror_write(apply: Callable[[ReservationLedger], bool]) -> None:
+    global _WRITE_GENERATION
+
+    _WRITE_GENERATION += 1
+    ledger = _cached_ledger()
+    if ledger is not None and not apply(ledger):
+        ledger.dirty = True
+
+
+def _mark_ledger_dirty() -> None:
+    _mirror_write(lambda _ledger: False)
+
+
 async def get_active_reservations_for_clan(clan_tag: str) -> List[ReservationRow]:
     """Return active reservations matching ``clan_tag``."""
 
@@ -157,8 +350,8 @@ async def get_active_reservations_for_clan(clan_tag: str) -> List[ReservationRow
     if not normalized:
         return []
 
-    rows = await _load_reservations()
-    return [row for row in rows if row.is_active and row.normalized_clan_tag == normalized]
+    ledger = await get_reservation_ledger()
+    return ledger.active_for_clan(normalized)
 
 
 async def find_active_reservations_for_recruit(
@@ -167,24 +360,14 @@ async def find_active_reservations_for_recruit(
 ) -> List[ReservationRow]:
     """Return active reservations for the recruit identified by ``ticket_user_id`` or ``username``."""
 
-    rows = await _load_reservations()
+    ledger = await get_reservation_ledger()
 
     matches: List[ReservationRow] = []
     if ticket_user_id is not None:
-        matches = [
-            row
-            for row in rows
-            if row.is_active and row.ticket_user_id is not None and row.ticket_user_id == ticket_user_id
-        ]
+        matches = ledger.active_for_user(ticket_user_id)
 
-    if not matches:
-        normalized_name = _normalize_username(username)
-        if normalized_name:
-            matches = [
-                row
-                for row in rows
-                if row.is_active and _normalize_username(row.username_snapshot) == normalized_name
-            ]
+    if not matches and _normalize_username(username):
+        matches = ledger.active_for_username(username)
 
     if not matches:
         return []
@@ -206,16 +389,8 @@ async def count_active_reservations_for_clan(clan_tag: str) -> int:
 async def get_active_reservations_by_clan() -> dict[str, List[ReservationRow]]:
     """Return a mapping of clan tag → active reservation rows."""
 
-    rows = await _load_reservations()
-    grouped: dict[str, List[ReservationRow]] = {}
-    for row in rows:
-        if not row.is_active:
-            continue
-        tag = row.normalized_clan_tag
-        if not tag:
-            continue
-        grouped.setdefault(tag, []).append(row)
-    return grouped
+    ledger = await get_reservation_ledger()
+    return ledger.active_by_clan()
 
 
 async def get_active_reservation_names_for_clan(
@@ -297,11 +472,6 @@ async def _resolve_reservation_name(
     return None
 
 
-async def _load_reservations() -> List[ReservationRow]:
-    ledger = await load_reservation_ledger()
-    return ledger.rows
-
-
 async def update_reservation_status(
     row_number: int,
     status: str,
@@ -315,23 +485,23 @@ async def update_reservation_status(
 
     column_index = status_column
     if column_index is None or column_index < 0:
-        ledger = await load_reservation_ledger()
-        column_index = ledger.status_column()
-        if column_index is None:
-            raise ValueError("Reservations sheet missing a 'status' column")
+        # The header is validated against RESERVATIONS_HEADERS on every load.
+        column_index = STATUS_COLUMN_INDEX
 
     recruitment.ensure_service_account_credentials()
     sheet_id = recruitment.get_recruitment_sheet_id()
     tab_name = recruitment.get_reservations_tab_name()
-    worksheet = await async_core.aget_worksheet(sheet_id, tab_name)
 
     cell = f"{_column_label(column_index)}{row_number}"
-    await async_core.acall_with_backoff(
-        worksheet.update,
-        cell,
-        [[str(status)]],
-        value_input_option="RAW",
-    )
+    try:
+        await write_behind.awrite_range(sheet_id, tab_name, cell, [[str(status)]])
+    except Exception:
+        _mark_ledger_dirty()
+        raise
+    if column_index != STATUS_COLUMN_INDEX:
+        _mark_ledger_dirty()
+        return
+    _mirror_write(lambda ledger: ledger.apply_status(row_number, str(status)))
 
 
 async def update_reservation_expiry(row_number: int, reserved_until: dt.date) -> None:
@@ -343,15 +513,16 @@ async def update_reservation_expiry(row_number: int, reserved_until: dt.date) ->
     recruitment.ensure_service_account_credentials()
     sheet_id = recruitment.get_recruitment_sheet_id()
     tab_name = recruitment.get_reservations_tab_name()
-    worksheet = await async_core.aget_worksheet(sheet_id, tab_name)
 
     cell = f"{_column_label(RESERVED_UNTIL_COL)}{row_number}"
-    await async_core.acall_with_backoff(
-        worksheet.update,
-        cell,
-        [[reserved_until.isoformat()]],
-        value_input_option="RAW",
-    )
+    try:
+        await write_behind.awrite_range(
+            sheet_id, tab_name, cell, [[reserved_until.isoformat()]]
+        )
+    except Exception:
+        _mark_ledger_dirty()
+        raise
+    _mirror_write(lambda ledger: ledger.apply_expiry(row_number, reserved_until))
 
 
 async def _fetch_reservations_matrix() -> List[List[str]]:
@@ -471,6 +642,23 @@ def _normalize_username(value: str | None) -> str:
     return (value or "").strip().lower()
 
 
+def _thread_key(value: int | str | None) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _with_cell(raw: Sequence[str], index: int, value: str) -> list[str]:
+    cells = list(raw)
+    if len(cells) <= index:
+        cells.extend([""] * (index + 1 - len(cells)))
+    cells[index] = value
+    return cells
+
+
 __all__ = [
     "ReservationLedger",
     "ReservationRow",
@@ -480,6 +668,8 @@ __all__ = [
     "RESERVATIONS_HEADERS",
     "append_reservation_row",
     "load_reservation_ledger",
+    "get_reservation_ledger",
+    "register_cache_buckets",
     "get_active_reservations_for_clan",
     "find_active_reservations_for_recruit",
     "count_active_reservations_for_clan",
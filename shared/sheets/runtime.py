@@ -13,9 +13,11 @@ def register_default_cache_buckets() -> None:
     import shared.sheets.config_service as config_service
     import shared.sheets.recruitment as recruitment
     import shared.sheets.reaction_roles as reaction_roles
+    import shared.sheets.reservations as reservations
 
     onboarding.register_cache_buckets()
     onboarding_questions.register_cache_buckets()
     config_service.register_cache_buckets()
     recruitment.register_cache_buckets()
     reaction_roles.register_cache_buckets()
+    reservations.register_cache_buckets()
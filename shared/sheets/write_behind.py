@@ -0,0 +1,303 @@
+"""Write-behind queue that coalesces Sheets range updates per worksheet."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+from shared.sheets import async_core
+
+log = logging.getLogger("c1c.sheets.write_behind")
+
+_WINDOW_SEC = max(0.0, float(os.getenv("GSHEETS_WRITE_BEHIND_MS", "100")) / 1000.0)
+
+_A1_CELL = re.compile(r"^\$?([A-Za-z]+)\$?(\d+)$")
+
+_QueueKey = Tuple[str, str, str]
+_Cell = Tuple[int, int]
+
+
+def _column_index(label: str) -> int:
+    value = 0
+    for char in label.upper():
+        value = value * 26 + (ord(char) - 64)
+    return value - 1
+
+
+def _column_label(index: int) -> str:
+    if index < 0:
+        raise ValueError("column index must be non-negative")
+    value = index + 1
+    label = ""
+    while value > 0:
+        value, remainder = divmod(value - 1, 26)
+        label = chr(65 + remainder) + label
+    return label
+
+
+def _parse_anchor(a1_range: str) -> _Cell:
+    """Return the zero-based ``(row, column)`` of the top-left cell in ``a1_range``."""
+
+    start = a1_range.split("!", 1)[-1].split(":", 1)[0].strip()
+    match = _A1_CELL.match(start)
+    if not match:
+        raise ValueError(f"unsupported A1 range for write-behind: {a1_range!r}")
+    return int(match.group(2)) - 1, _column_index(match.group(1))
+
+
+def _format_range(top: int, left: int, bottom: int, right: int) -> str:
+    start = f"{_column_label(left)}{top + 1}"
+    if top == bottom and left == right:
+        return start
+    return f"{start}:{_column_label(right)}{bottom + 1}"
+
+
+def coalesce_cells(cells: Dict[_Cell, Any]) -> List[Tuple[str, List[List[Any]]]]:
+    """Group ``cells`` into as few rectangular ``(range, values)`` blocks as possible.
+
+    Contiguous columns on a row form a run; consecutive rows with identical runs
+    are stacked into one block.
+    """
+
+    runs: List[Tuple[int, int, int]] = []
+    for row in sorted({r for r, _ in cells}):
+        columns = sorted(c for r, c in cells if r == row)
+        start = prev = columns[0]
+        for col in columns[1:]:
+            if col != prev + 1:
+                runs.append((row, start, prev))
+                start = col
+            prev = col
+        runs.append((row, start, prev))
+
+    blocks: List[Tuple[int, int, int, int]] = []
+    for row, left, right in runs:
+        merged = False
+        for index, (top, b_left, bottom, b_right) in enumerate(blocks):
+            if (b_left, b_right) == (left, right) and bottom == row - 1:
+                blocks[index] = (top, b_left, row, b_right)
+                merged = True
+                break
+        if not merged:
+            blocks.append((row, left, row, right))
+
+    out: List[Tuple[str, List[List[Any]]]] = []
+    for top, left, bottom, right in blocks:
+        values = [
+            [cells[(row, col)] for col in range(left, right + 1)]
+            for row in range(top, bottom + 1)
+        ]
+        out.append((_format_range(top, left, bottom, right), values))
+    return out
+
+
+@dataclass
+class _PendingWrites:
+    cells: Dict[_Cell, Any] = field(default_factory=dict)
+    waiters: List["asyncio.Future[None]"] = field(default_factory=list)
+    submitted: int = 0
+    flush_task: "asyncio.Task[None] | None" = None
+
+
+class WriteBehindQueue:
+    """Buffer range writes per worksheet and flush them as one batch update.
+
+    Overlapping writes resolve cell by cell with the last submission winning.
+    Callers await the returned future to learn when (and whether) their write
+    reached the sheet; :meth:`flush_all` drains everything on shutdown.
+    """
+
+    def __init__(self, *, window_sec: float | None = None) -> None:
+        self.window_sec = _WINDOW_SEC if window_sec is None else max(0.0, window_sec)
+        self._pending: Dict[_QueueKey, _PendingWrites] = {}
+        # Serialises flushes per worksheet so an older batch never lands last.
+        self._flush_locks: Dict[_QueueKey, asyncio.Lock] = {}
+        # Window timers, including ones that already popped their batch and
+        # are mid-write; flush_all waits for them.
+        self._timers: Set["asyncio.Task[None]"] = set()
+        self.flushes = 0
+        self.writes = 0
+
+    def submit(
+        self,
+        sheet_id: str,
+        tab_name: str,
+        a1_range: str,
+        values: Sequence[Sequence[Any]],
+        *,
+        value_input_option: str = "RAW",
+    ) -> "asyncio.Future[None]":
+        """Queue ``values`` at ``a1_range`` and return a future for the flush."""
+
+        loop = asyncio.get_running_loop()
+        top, left = _parse_anchor(a1_range)
+        key = (sheet_id, tab_name, value_input_option)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingWrites()
+        for row_offset, row in enumerate(values):
+            for col_offset, value in enumerate(row):
+                pending.cells[(top + row_offset, left + col_offset)] = value
+        pending.submitted += 1
+        self.writes += 1
+        waiter: "asyncio.Future[None]" = loop.create_future()
+        pending.waiters.append(waiter)
+        if pending.flush_task is None:
+            timer = loop.create_task(self._flush_after_window(key, pending))
+            pending.flush_task = timer
+            self._timers.add(timer)
+            timer.add_done_callback(self._timers.discard)
+        return waiter
+
+    async def write(
+        self,
+        sheet_id: str,
+        tab_name: str,
+        a1_range: str,
+        values: Sequence[Sequence[Any]],
+        *,
+        value_input_option: str = "RAW",
+    ) -> None:
+        """Queue a write and wait until the batch containing it is flushed."""
+
+        await self.submit(
+            sheet_id,
+            tab_name,
+            a1_range,
+            values,
+            value_input_option=value_input_option,
+        )
+
+    async def _flush_after_window(self, key: _QueueKey, pending: _PendingWrites) -> None:
+        await asyncio.sleep(self.window_sec)
+        if self._pending.get(key) is not pending:
+            return  # flush_all already took this batch; never flush a newer one
+        await self._flush(key)
+
+    async def _flush(self, key: _QueueKey) -> None:
+        pending = self._pending.pop(key, None)
+        if pending is None or not pending.cells:
+            return
+        lock = self._flush_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            await self._write_pending(key, pending)
+
+    async def _write_pending(self, key: _QueueKey, pending: _PendingWrites) -> None:
+        sheet_id, tab_name, value_input_option = key
+        blocks = coalesce_cells(pending.cells)
+        error: BaseException | None = None
+        try:
+            worksheet = await async_core.aget_worksheet(sheet_id, tab_name)
+            if len(blocks) == 1:
+                a1_range, values = blocks[0]
+                await async_core.acall_with_backoff(
+                    worksheet.update,
+                    a1_range,
+                    values,
+                    value_input_option=value_input_option,
+                )
+            else:
+                await async_core.acall_with_backoff(
+                    worksheet.batch_update,
+                    [{"range": a1_range, "values": values} for a1_range, values in blocks],
+                    value_input_option=value_input_option,
+                )
+        except Exception as exc:
+            error = exc
+            log.warning(
+                "write-behind flush failed",
+                extra={"tab": tab_name, "ranges": len(blocks), "error": str(exc)},
+            )
+        except BaseException as exc:
+            error = exc
+            raise
+        else:
+            self.flushes += 1
+            log.debug(
+                "write-behind flush",
+                extra={"tab": tab_name, "writes": pending.submitted, "ranges": len(blocks)},
+            )
+        finally:
+            # Runs on cancellation too, so no writer is left waiting forever.
+            for waiter in pending.waiters:
+                if waiter.done():
+                    continue
+                if error is None:
+                    waiter.set_result(None)
+                elif isinstance(error, asyncio.CancelledError):
+                    waiter.cancel()
+                else:
+                    waiter.set_exception(error)
+
+    async def flush_all(self) -> None:
+        """Flush every pending worksheet and wait for in-flight flushes (used on shutdown)."""
+
+        current = asyncio.current_task()
+        while True:
+            for key in list(self._pending):
+                pending = self._pending.get(key)
+                timer = pending.flush_task if pending is not None else None
+                if timer is not None and timer is not current:
+                    # The timer has not taken this batch yet, so it is still sleeping.
+                    timer.cancel()
+                await self._flush(key)
+            inflight = [task for task in self._timers if task is not current and not task.done()]
+            if not inflight:
+                if not self._pending:
+                    return
+                continue
+            await asyncio.gather(*inflight, return_exceptions=True)
+
+    def pending_count(self) -> int:
+        return sum(p.submitted for p in self._pending.values())
+
+
+_QUEUE: WriteBehindQueue | None = None
+
+
+def get_queue() -> WriteBehindQueue:
+    """Return the process-wide write-behind queue."""
+
+    global _QUEUE
+    if _QUEUE is None:
+        _QUEUE = WriteBehindQueue()
+    return _QUEUE
+
+
+async def awrite_range(
+    sheet_id: str,
+    tab_name: str,
+    a1_range: str,
+    values: Sequence[Sequence[Any]],
+    *,
+    value_input_option: str = "RAW",
+) -> None:
+    """Write ``values`` through the shared queue and wait for the flush."""
+
+    await get_queue().write(
+        sheet_id,
+        tab_name,
+        a1_range,
+        values,
+        value_input_option=value_input_option,
+    )
+
+
+async def flush_all() -> None:
+    """Flush the shared queue if it has been created."""
+
+    if _QUEUE is not None:
+        await _QUEUE.flush_all()
+
+
+__all__ = [
+    "WriteBehindQueue",
+    "awrite_range",
+    "coalesce_cells",
+    "flush_all",
+    "get_queue",
+]
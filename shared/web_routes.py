@@ -4,9 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import hashlib
 import io
 import logging
+import os
 import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Tuple
 
 from aiohttp import ClientSession, ClientTimeout, web
 from PIL import Image, UnidentifiedImageError
@@ -14,7 +20,11 @@ from PIL import Image, UnidentifiedImageError
 from shared.config import (
     get_emoji_max_bytes,
     get_emoji_pad_box,
+    get_emoji_pad_cache_bytes,
+    get_emoji_pad_cache_dir,
+    get_emoji_pad_max_pending,
     get_emoji_pad_size,
+    get_emoji_pad_workers,
 )
 
 log = logging.getLogger("c1c.web.routes")
@@ -26,6 +36,10 @@ _MIN_BOX = 0.2
 _MAX_BOX = 0.95
 _TIMEOUT = 8
 _SESSION_KEY = "emoji_pad.session"
+_CACHE_KEY = "emoji_pad.cache"
+_RENDER_KEY = "emoji_pad.renderer"
+_INFLIGHT_KEY = "emoji_pad.inflight"
+_CACHE_CONTROL = "public, max-age=86400"
 
 try:  # Pillow >= 10
     RESAMPLE_LANCZOS = Image.Resampling.LANCZOS
@@ -61,6 +75,232 @@ async def _fetch_emoji_bytes(session: ClientSession, url: str, max_bytes: int) -
         raise web.HTTPGatewayTimeout(text="timeout") from exc
 
 
+def _etag_for(body: bytes) -> str:
+    return '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    # If-None-Match uses weak comparison, so ``W/"abc"`` matches ``"abc"``.
+    candidates = [item.strip().removeprefix("W/") for item in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+class PaddedEmojiCache:
+    """Byte-bounded LRU of rendered ``/emoji-pad`` PNGs, optionally mirrored to disk.
+
+    Entries are keyed on the source URL (which embeds the emoji id) plus the
+    clamped size/box parameters. The disk directory survives restarts and is
+    consulted on memory misses; it shares the ``max_bytes`` budget, dropping the
+    least recently used files (by mtime) once it grows past it.
+    """
+
+    def __init__(self, max_bytes: int, directory: str | Path | None = None) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self.directory = Path(directory) if directory else None
+        self._entries: "OrderedDict[str, Tuple[bytes, str]]" = OrderedDict()
+        self._bytes = 0
+        # Unknown until the first write scans the directory; then tracked per write.
+        self._disk_bytes: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(source_url: str, size: int, box: float) -> str:
+        raw = f"{source_url}|{size}|{box:.4f}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        return self.directory / f"{key}.png"
+
+    async def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        path = self._disk_path(key)
+        if path is not None:
+            try:
+                body = await asyncio.to_thread(self._read_disk, path)
+            except FileNotFoundError:
+                body = None
+            except OSError:
+                log.debug("/emoji-pad cache read failed", exc_info=True)
+                body = None
+            if body:
+                self.hits += 1
+                return self._remember(key, body)
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, body: bytes) -> Tuple[bytes, str]:
+        entry = self._remember(key, body)
+        path = self._disk_path(key)
+        if path is not None and len(body) <= self.max_bytes:
+            try:
+                await asyncio.to_thread(self._write_disk, path, body)
+            except OSError:
+                log.debug("/emoji-pad cache write failed", exc_info=True)
+                return entry
+            if self._disk_bytes is not None:
+                self._disk_bytes += len(body)
+            if self._disk_bytes is None or self._disk_bytes > self.max_bytes:
+                try:
+                    self._disk_bytes = await asyncio.to_thread(
+                        self._prune_disk, path.parent, self.max_bytes, path
+                    )
+                except OSError:
+                    log.debug("/emoji-pad cache prune failed", exc_info=True)
+        return entry
+
+    @staticmethod
+    def _read_disk(path: Path) -> bytes:
+        body = path.read_bytes()
+        # Refresh the mtime so disk pruning evicts least recently served first.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return body
+
+    @staticmethod
+    def _write_disk(path: Path, body: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(body)
+        tmp.replace(path)
+
+    @staticmethod
+    def _prune_disk(directory: Path, max_bytes: int, keep: Path) -> int:
+        """Delete the oldest PNGs but ``keep`` until ``directory`` fits ``max_bytes``.
+
+        Returns the remaining size in bytes.
+        """
+
+        files = []
+        for path in directory.glob("*.png"):
+            if path == keep:
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _mtime, size, _path in files)
+        with contextlib.suppress(FileNotFoundError):
+            total += keep.stat().st_size
+        for _mtime, size, path in sorted(files, key=lambda item: item[0]):
+            if total <= max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+            total -= size
+        return total
+
+    def _remember(self, key: str, body: bytes) -> Tuple[bytes, str]:
+        entry = (body, _etag_for(body))
+        if len(body) > self.max_bytes:
+            return entry
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous[0])
+        self._entries[key] = entry
+        self._bytes += len(body)
+        while self._bytes > self.max_bytes and self._entries:
+            _, (evicted, _etag) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+        return entry
+
+
+def _render_padded_png(data: bytes, size: int, box: float) -> bytes:
+    try:
+        image = Image.open(io.BytesIO(data)).convert("RGBA")
+    except (UnidentifiedImageError, OSError) as exc:
+        raise web.HTTPUnsupportedMediaType(text="unsupported media type") from exc
+
+    alpha = image.split()[-1]
+    bbox = alpha.getbbox()
+    if bbox:
+        image = image.crop(bbox)
+
+    width, height = image.size
+    if width <= 0 or height <= 0:
+        raise web.HTTPUnsupportedMediaType(text="unsupported media type")
+
+    canvas = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    target = int(size * box)
+    longest = max(width, height)
+    scale = target / float(longest or 1)
+    new_width = max(1, int(round(width * scale)))
+    new_height = max(1, int(round(height * scale)))
+    if new_width != width or new_height != height:
+        image = image.resize((new_width, new_height), RESAMPLE_LANCZOS)
+
+    offset = ((size - new_width) // 2, (size - new_height) // 2)
+    canvas.paste(image, offset, mask=image)
+
+    buf = io.BytesIO()
+    canvas.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class EmojiRenderPool:
+    """Bounded worker pool that keeps Pillow work off the event loop.
+
+    At most ``max_pending`` transforms may be running or queued; further
+    requests are rejected with ``503`` so a burst cannot build an unbounded
+    backlog behind the gateway.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.max_pending = max(1, int(max_pending))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, int(workers)),
+            thread_name_prefix="emoji-pad",
+        )
+        self.pending = 0
+        self.rejected = 0
+
+    async def render(self, data: bytes, size: int, box: float) -> bytes:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise web.HTTPServiceUnavailable(text="busy", headers={"Retry-After": "1"})
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, _render_padded_png, data, size, box
+            )
+        finally:
+            self.pending -= 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _forget_inflight(inflight: dict, key: str, task: "asyncio.Task[Tuple[bytes, str]]") -> None:
+    inflight.pop(key, None)
+    if not task.cancelled():
+        # Mark the exception as retrieved even if every waiter went away.
+        task.exception()
+
+
+def _png_response(request: web.Request, body: bytes, etag: str) -> web.StreamResponse:
+    headers = {"Cache-Control": _CACHE_CONTROL, "ETag": etag}
+    if _etag_matches(request.headers.get("If-None-Match"), etag):
+        return web.Response(status=304, headers=headers)
+    return web.Response(body=body, headers=headers, content_type="image/png")
+
+
 def mount_emoji_pad(app: web.Application) -> None:
     """Register the legacy ``/emoji-pad`` proxy route if not already mounted."""
 
@@ -80,6 +320,34 @@ def mount_emoji_pad(app: web.Application) -> None:
 
         app.on_cleanup.append(_close_session)
 
+    if _CACHE_KEY not in app:
+        app[_CACHE_KEY] = PaddedEmojiCache(
+            get_emoji_pad_cache_bytes(),
+            get_emoji_pad_cache_dir() or None,
+        )
+
+    if _RENDER_KEY not in app:
+        app[_RENDER_KEY] = EmojiRenderPool(
+            get_emoji_pad_workers(),
+            get_emoji_pad_max_pending(),
+        )
+        app[_INFLIGHT_KEY] = {}
+
+        async def _shutdown_renderer(_app: web.Application) -> None:
+            renderer = _app.get(_RENDER_KEY)
+            if renderer is not None:
+                renderer.shutdown()
+
+        app.on_cleanup.append(_shutdown_renderer)
+
+    async def _produce(
+        app_: web.Application, cache_key: str, source_url: str, size: int, box: float
+    ) -> Tuple[bytes, str]:
+        session: ClientSession = app_[_SESSION_KEY]
+        data = await _fetch_emoji_bytes(session, source_url, get_emoji_max_bytes())
+        body = await app_[_RENDER_KEY].render(data, size, box)
+        return await app_[_CACHE_KEY].put(cache_key, body)
+
     async def handle(request: web.Request) -> web.StreamResponse:
         source_url = request.query.get("u")
         if not source_url:
@@ -103,44 +371,26 @@ def mount_emoji_pad(app: web.Application) -> None:
             box = get_emoji_pad_box()
         box = max(_MIN_BOX, min(_MAX_BOX, box))
 
-        max_bytes = get_emoji_max_bytes()
+        cache: PaddedEmojiCache = request.app[_CACHE_KEY]
+        cache_key = cache.make_key(source_url, size, box)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return _png_response(request, *cached)
 
         try:
-            session: ClientSession = request.app[_SESSION_KEY]
-            data = await _fetch_emoji_bytes(session, source_url, max_bytes)
-
-            try:
-                image = Image.open(io.BytesIO(data)).convert("RGBA")
-            except (UnidentifiedImageError, OSError) as exc:
-                raise web.HTTPUnsupportedMediaType(text="unsupported media type") from exc
-
-            alpha = image.split()[-1]
-            bbox = alpha.getbbox()
-            if bbox:
-                image = image.crop(bbox)
-
-            width, height = image.size
-            if width <= 0 or height <= 0:
-                raise web.HTTPUnsupportedMediaType(text="unsupported media type")
-
-            canvas = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-            target = int(size * box)
-            longest = max(width, height)
-            scale = target / float(longest or 1)
-            new_width = max(1, int(round(width * scale)))
-            new_height = max(1, int(round(height * scale)))
-            if new_width != width or new_height != height:
-                image = image.resize((new_width, new_height), RESAMPLE_LANCZOS)
-
-            offset = ((size - new_width) // 2, (size - new_height) // 2)
-            canvas.paste(image, offset, mask=image)
-
-            buf = io.BytesIO()
-            canvas.save(buf, format="PNG")
-            body = buf.getvalue()
-
-            headers = {"Cache-Control": "public, max-age=86400"}
-            return web.Response(body=body, headers=headers, content_type="image/png")
+            # Concurrent requests for the same emoji/size share one fetch + render.
+            inflight: dict = request.app[_INFLIGHT_KEY]
+            task = inflight.get(cache_key)
+            if task is None:
+                task = asyncio.create_task(
+                    _produce(request.app, cache_key, source_url, size, box)
+                )
+                inflight[cache_key] = task
+                task.add_done_callback(
+                    lambda done, key=cache_key: _forget_inflight(inflight, key, done)
+                )
+            body, etag = await asyncio.shield(task)
+            return _png_response(request, body, etag)
         except web.HTTPException:
             raise
         except Exception as exc:  # pragma: no cover - unexpected failure
@@ -126,19 +126,22 @@ def test_load_record_appends_when_missing(monkeypatch):
         )
         store.get_config = AsyncMock(return_value=config)
 
-        async def fake_values(sheet_id, tab_name, **kwargs):
-            return [list(shard_data.EXPECTED_HEADERS)]
-
-        monkeypatch.setattr(shard_data.async_core, "afetch_values", fake_values)
-
         class DummyWorksheet:
             def __init__(self) -> None:
                 self.append_payloads: list[list[str]] = []
 
             async def append_row(self, row, value_input_option="RAW"):
+                # No ``updatedRange`` in the response, so the store must re-read.
                 self.append_payloads.append(list(row))
 
         worksheet = DummyWorksheet()
+        reads: list[str] = []
+
+        async def fake_values(sheet_id, tab_name, **kwargs):
+            reads.append(tab_name)
+            return [list(shard_data.EXPECTED_HEADERS), ["55555", "Other"], *worksheet.append_payloads]
+
+        monkeypatch.setattr(shard_data.async_core, "afetch_values", fake_values)
 
         async def fake_worksheet(sheet_id, tab_name, **kwargs):
             return worksheet
@@ -151,9 +154,11 @@ def test_load_record_appends_when_missing(monkeypatch):
 
         record = await store.load_record(99999, "Fresh User")
 
-        assert record.row_number == 2
+        assert record.row_number == 3
         assert worksheet.append_payloads, "append_row should be invoked for new records"
         assert worksheet.append_payloads[0][0] == "99999"
+        assert reads == ["ShardTracker", "ShardTracker"]
+        assert (await store.load_record(99999, "Fresh User")).row_number == 3
 
     asyncio.run(runner())
 
@@ -175,3 +180,100 @@ def test_load_record_invalid_header(monkeypatch):
             await store.load_record(1, "Name")
 
     asyncio.run(runner())
+
+
+def test_load_record_serves_repeat_lookups_from_index(monkeypatch):
+    async def runner():
+        store = shard_data.ShardSheetStore()
+        config = shard_data.ShardTrackerConfig(
+            sheet_id="sheet-1", tab_name="ShardTracker", channel_id=123
+        )
+        store.get_config = AsyncMock(return_value=config)
+        reads: list[str] = []
+        writes: list[tuple[str, list[list[str]]]] = []
+
+        async def fake_values(sheet_id, tab_name, **kwargs):
+            reads.append(tab_name)
+            return [list(shard_data.EXPECTED_HEADERS), ["111", "Old", "3"]]
+
+        async def fake_write(sheet_id, tab_name, range_label, rows):
+            writes.append((range_label, rows))
+
+        class DummyWorksheet:
+            async def append_row(self, row, value_input_option="RAW"):
+                return {"updates": {"updatedRange": "'ShardTracker'!A7:V7"}}
+
+        async def fake_worksheet(sheet_id, tab_name, **kwargs):
+            return DummyWorksheet()
+
+        async def fake_backoff(func, *args, **kwargs):
+            return await func(*args, **kwargs)
+
+        monkeypatch.setattr(shard_data.async_core, "afetch_values", fake_values)
+        monkeypatch.setattr(shard_data.async_core, "aget_worksheet", fake_worksheet)
+        monkeypatch.setattr(shard_data.async_core, "acall_with_backoff", fake_backoff)
+        monkeypatch.setattr(shard_data.write_behind, "awrite_range", fake_write)
+
+        record = await store.load_record(111, "Tester")
+        record.ancients_owned = 9
+        unsaved = await store.load_record(111, "Tester")
+        assert unsaved.ancients_owned == 3
+
+        await store.save_record(config, record)
+        saved = await store.load_record(111, "Tester")
+        assert saved.ancients_owned == 9
+        assert writes and writes[0][0] == "A2:V2"
+
+        fresh = await store.load_record(222, "Newbie")
+        assert fresh.row_number == 7
+        assert (await store.load_record(222, "Newbie")).row_number == 7
+        assert reads == ["ShardTracker"]
+
+        store.invalidate_index()
+        await store.load_record(111, "Tester")
+        assert reads == ["ShardTracker", "ShardTracker"]
+
+    asyncio.run(runner())
+
+
+def test_saves_lock_per_row_and_record_wait_metrics(monkeypatch):
+    async def runner():
+        store = shard_data.ShardSheetStore()
+        config = shard_data.ShardTrackerConfig(
+            sheet_id="sheet-1", tab_name="ShardTracker", channel_id=123
+        )
+        in_flight = 0
+        peak = 0
+
+        async def fake_write(sheet_id, tab_name, range_label, rows):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        monkeypatch.setattr(shard_data.write_behind, "awrite_range", fake_write)
+
+        def record(discord_id: int, row_number: int) -> shard_data.ShardRecord:
+            return shard_data.ShardRecord(
+                header=list(shard_data.EXPECTED_HEADERS),
+                discord_id=discord_id,
+                username_snapshot="x",
+                row_number=row_number,
+            )
+
+        await asyncio.gather(*(store.save_record(config, record(i, i + 2)) for i in range(4)))
+        assert peak == 4
+
+        peak = 0
+        await asyncio.gather(store.save_record(config, record(1, 9)), store.save_record(config, record(1, 9)))
+        assert peak == 1
+
+        stats = store.lock_stats()["row"]
+        assert stats["acquired"] == 6
+        assert stats["contended"] == 1
+        assert stats["max_wait_ms"] >= 5
+        # Row locks are dropped once no save holds or waits on them.
+        assert len(store._row_locks) == 0
+
+    asyncio.run(runner())
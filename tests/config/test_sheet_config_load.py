@@ -0,0 +1,98 @@
+import asyncio
+import importlib
+import sys
+import threading
+import types
+
+
+def _apply_env(monkeypatch):
+    monkeypatch.setenv("DISCORD_TOKEN", "token")
+    monkeypatch.setenv("GSPREAD_CREDENTIALS", "{}")
+    monkeypatch.setenv("RECRUITMENT_SHEET_ID", "recruit-sheet")
+    monkeypatch.setenv("ONBOARDING_SHEET_ID", "onboard-sheet")
+    monkeypatch.setenv("MILESTONES_SHEET_ID", "milestones-sheet")
+
+
+def test_import_reads_env_only_and_startup_fetches_tabs_in_parallel(monkeypatch):
+    _apply_env(monkeypatch)
+    calls: list[str] = []
+    both_started = threading.Barrier(2, timeout=5)
+
+    def _read_onboarding_config(sheet_id):
+        calls.append("onboarding")
+        both_started.wait()
+        return {"ONBOARDING_TAB": "WelcomeQuestions"}
+
+    def _fetch_records(sheet_id, tab_name):
+        calls.append("milestones")
+        both_started.wait()
+        return [{"key": "SHARD_MERCY_TAB", "value": "ShardMercy"}]
+
+    monkeypatch.setitem(
+        sys.modules,
+        "shared.sheets.onboarding",
+        types.SimpleNamespace(_read_onboarding_config=_read_onboarding_config),
+    )
+    from shared.sheets import core as sheets_core
+
+    monkeypatch.setattr(sheets_core, "fetch_records", _fetch_records)
+
+    import shared.config as config
+
+    config = importlib.reload(config)
+    assert calls == []
+    assert config.sheet_config_ready() is False
+    assert config.get_onboarding_questions_tab() == ""
+    assert config.get_shard_mercy_tab("default") == "default"
+
+    async def runner() -> None:
+        assert await config.await_sheet_config(timeout=0.01) is False
+        config.start_sheet_config_load()
+        assert await config.await_sheet_config(timeout=5) is True
+
+    asyncio.run(runner())
+
+    assert sorted(calls) == ["milestones", "onboarding"]
+    assert config.get_onboarding_questions_tab() == "WelcomeQuestions"
+    assert config.get_shard_mercy_tab("default") == "ShardMercy"
+
+    # An env-only reload keeps the fetched tab values.
+    config.reload_config(sheets=False)
+    assert config.get_onboarding_questions_tab() == "WelcomeQuestions"
+    assert sorted(calls) == ["milestones", "onboarding"]
+
+    config._SHEET_VALUES.clear()
+    config.reload_config(sheets=False)
+
+
+def test_failed_tab_load_is_not_reported_ready(monkeypatch):
+    _apply_env(monkeypatch)
+
+    def _read_onboarding_config(sheet_id):
+        raise ConnectionError("sheets unavailable")
+
+    def _fetch_records(sheet_id, tab_name):
+        return [{"key": "SHARD_MERCY_TAB", "value": "ShardMercy"}]
+
+    monkeypatch.setitem(
+        sys.modules,
+        "shared.sheets.onboarding",
+        types.SimpleNamespace(_read_onboarding_config=_read_onboarding_config),
+    )
+    from shared.sheets import core as sheets_core
+
+    monkeypatch.setattr(sheets_core, "fetch_records", _fetch_records)
+
+    import shared.config as config
+
+    config = importlib.reload(config)
+
+    async def runner() -> None:
+        config.start_sheet_config_load()
+        assert await config.await_sheet_config(timeout=5) is False
+
+    asyncio.run(runner())
+
+    assert config.sheet_config_ready() is False
+    assert config.get_shard_mercy_tab("default") == "ShardMercy"
+    assert config.get_onboarding_questions_tab() == ""
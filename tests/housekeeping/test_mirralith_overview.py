@@ -0,0 +1,62 @@
+import asyncio
+
+import discord
+
+from modules.housekeeping import mirralith_overview
+from shared.sheets import export_utils
+
+
+class _Channel(discord.TextChannel):
+    def __init__(self) -> None:  # pragma: no cover - bypass discord state
+        pass
+
+
+class _Bot:
+    def __init__(self, channel) -> None:
+        self.channel = channel
+
+    def get_channel(self, channel_id):
+        return self.channel
+
+
+def test_scheduled_run_fingerprints_all_specs_in_one_read(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("MIRRALITH_CHANNEL_ID", "123")
+    monkeypatch.setenv("RECRUITMENT_SHEET_ID", "sheet")
+    monkeypatch.setattr(
+        mirralith_overview.recruitment,
+        "get_config_value",
+        lambda key, default="": "Mirralith" if key.endswith("_TAB") else "A1:B2",
+    )
+
+    store = export_utils.ExportFingerprints(tmp_path)
+    for spec in mirralith_overview.IMAGE_SPECS:
+        store.remember(f"mirralith:{spec.label}", f"fp-{spec.label}", b"png")
+
+    async def fake_store():
+        return store
+
+    calls: list[list[tuple[str, str]]] = []
+
+    async def fake_fingerprints(sheet_id, ranges):
+        calls.append(list(ranges))
+        return [f"fp-{spec.label}" for spec in mirralith_overview.IMAGE_SPECS]
+
+    summaries: list[str] = []
+
+    async def fake_log(message: str) -> None:
+        summaries.append(message)
+
+    async def fail_export(*_args, **_kwargs):
+        raise AssertionError("unchanged ranges should not export")
+
+    monkeypatch.setattr(mirralith_overview, "aget_fingerprint_store", fake_store)
+    monkeypatch.setattr(mirralith_overview, "afetch_range_fingerprints", fake_fingerprints)
+    monkeypatch.setattr(mirralith_overview, "export_pdf_as_png", fail_export)
+    monkeypatch.setattr(mirralith_overview.runtime_helpers, "send_log_message", fake_log)
+
+    asyncio.run(mirralith_overview.run_mirralith_overview_job(_Bot(_Channel())))
+
+    assert len(calls) == 1
+    assert len(calls[0]) == len(mirralith_overview.IMAGE_SPECS)
+    total = len(mirralith_overview.IMAGE_SPECS)
+    assert f"Unchanged (skipped): {total}" in summaries[0]
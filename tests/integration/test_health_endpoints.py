@@ -82,7 +82,58 @@ def test_health_endpoints_exist_and_return_json(monkeypatch):
                     assert resp.status == 200
                     ready_payload = await resp.json()
                     assert ready_payload.get("ok") is False
+                    assert "bucket_ms" in ready_payload.get("cache_preload", {})
         finally:
             await runtime.shutdown_webserver()
 
     asyncio.run(runner())
+
+
+def test_cache_preload_reports_terminal_states(monkeypatch) -> None:
+    class _NeverReadyBot(DummyBot):
+        async def wait_until_ready(self) -> None:
+            await asyncio.Event().wait()
+
+    monkeypatch.setattr(rt, "_PRELOAD_STATUS", {"state": "pending", "total_ms": None, "bucket_ms": {}})
+    monkeypatch.setattr(rt, "_ACTIVE_RUNTIME", None)
+
+    asyncio.run(rt._startup_preload(None))
+    assert rt.preload_status()["state"] == "failed"
+
+    async def runner() -> None:
+        task = asyncio.create_task(rt._startup_preload(_NeverReadyBot()))
+        await asyncio.sleep(0)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        else:  # pragma: no cover - the preload must propagate cancellation
+            raise AssertionError("startup preload swallowed cancellation")
+
+    asyncio.run(runner())
+    status = rt.preload_status()
+    assert status["state"] == "cancelled"
+    assert status["ready"] is False
+
+
+def test_close_drops_log_lines_when_bot_never_became_ready(monkeypatch) -> None:
+    class _FailedLoginBot(DummyBot):
+        async def wait_until_ready(self) -> None:
+            await asyncio.Event().wait()
+
+        def is_ready(self) -> bool:
+            return False
+
+        def is_closed(self) -> bool:
+            return True
+
+    monkeypatch.setattr(rt, "get_log_channel_id", lambda: 123)
+
+    async def runner() -> None:
+        runtime = rt.Runtime(bot=_FailedLoginBot())
+        await runtime.send_log_message("extension failed to load")
+        await asyncio.wait_for(runtime.close(), timeout=2)
+        assert runtime._log_sink.stats()["dropped"] == 1
+
+    asyncio.run(runner())
@@ -1,5 +1,6 @@
 import asyncio
 import io
+import os
 
 from aiohttp import web
 from aiohttp.test_utils import TestClient, TestServer
@@ -55,3 +56,147 @@ def test_emoji_proxy_allows_https(monkeypatch):
                 assert body.startswith(b"\x89PNG")
 
     asyncio.run(runner())
+
+
+def test_emoji_proxy_caches_render_and_answers_conditional_get(monkeypatch):
+    async def runner() -> None:
+        app = web.Application()
+        web_routes.mount_emoji_pad(app)
+
+        png_data = _png_bytes()
+        calls = 0
+
+        async def fake_fetch(session, url, max_bytes):
+            nonlocal calls
+            calls += 1
+            return png_data
+
+        monkeypatch.setattr(web_routes, "_fetch_emoji_bytes", fake_fetch)
+        params = {"u": "https://cdn.discordapp.com/emojis/123.png", "s": "128"}
+
+        async with TestServer(app) as server:
+            async with TestClient(server) as client:
+                first = await client.get("/emoji-pad", params=params)
+                assert first.status == 200
+                etag = first.headers["ETag"]
+                body = await first.read()
+
+                second = await client.get("/emoji-pad", params=params)
+                assert second.status == 200
+                assert await second.read() == body
+
+                revalidate = await client.get(
+                    "/emoji-pad", params=params, headers={"If-None-Match": etag}
+                )
+                assert revalidate.status == 304
+                assert revalidate.headers["ETag"] == etag
+
+                other_size = await client.get(
+                    "/emoji-pad", params={**params, "s": "256"}
+                )
+                assert other_size.status == 200
+
+        assert calls == 2
+
+    asyncio.run(runner())
+
+
+def test_padded_emoji_cache_evicts_by_bytes_and_reads_disk(tmp_path):
+    async def runner() -> None:
+        cache = web_routes.PaddedEmojiCache(10, tmp_path)
+        await cache.put("a", b"12345")
+        await cache.put("b", b"67890")
+        await cache.get("a")
+        await cache.put("c", b"abcde")
+
+        assert len(cache) == 2
+        assert cache.size_bytes == 10
+        assert "b" not in cache._entries
+
+        # The disk mirror shares the budget: the newest file stays, one older goes.
+        on_disk = sorted(path.stem for path in tmp_path.glob("*.png"))
+        assert len(on_disk) == 2 and "c" in on_disk
+        survivor = next(key for key in on_disk if key != "c")
+        cache._entries.clear()
+        cache._bytes = 0
+        entry = await cache.get(survivor)
+        assert entry is not None and entry[0] == {"a": b"12345", "b": b"67890"}[survivor]
+
+        fresh = web_routes.PaddedEmojiCache(10, tmp_path)
+        assert (await fresh.get("c"))[0] == b"abcde"
+        assert await fresh.get("missing") is None
+
+    asyncio.run(runner())
+
+
+def test_padded_emoji_cache_prunes_disk_by_mtime(tmp_path):
+    for age, key in enumerate(("old", "mid", "new")):
+        path = tmp_path / f"{key}.png"
+        path.write_bytes(b"x" * 4)
+        os.utime(path, (1_000 + age, 1_000 + age))
+
+    async def runner() -> None:
+        cache = web_routes.PaddedEmojiCache(10, tmp_path)
+        # Serving from disk refreshes the mtime, so "old" becomes most recent.
+        assert (await cache.get("old"))[0] == b"xxxx"
+        await cache.put("fresh", b"yyyy")
+
+    asyncio.run(runner())
+    assert sorted(path.stem for path in tmp_path.glob("*.png")) == ["fresh", "old"]
+
+
+def test_emoji_proxy_shares_inflight_render(monkeypatch):
+    async def runner() -> None:
+        app = web.Application()
+        web_routes.mount_emoji_pad(app)
+
+        png_data = _png_bytes()
+        calls = 0
+        release = asyncio.Event()
+
+        async def fake_fetch(session, url, max_bytes):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return png_data
+
+        monkeypatch.setattr(web_routes, "_fetch_emoji_bytes", fake_fetch)
+        params = {"u": "https://cdn.discordapp.com/emojis/456.png"}
+
+        async with TestServer(app) as server:
+            async with TestClient(server) as client:
+                requests = [
+                    asyncio.create_task(client.get("/emoji-pad", params=params))
+                    for _ in range(3)
+                ]
+                await asyncio.sleep(0.05)
+                release.set()
+                responses = await asyncio.gather(*requests)
+                bodies = {await resp.read() for resp in responses}
+
+        assert calls == 1
+        assert [resp.status for resp in responses] == [200, 200, 200]
+        assert len(bodies) == 1
+
+    asyncio.run(runner())
+
+
+def test_emoji_render_pool_rejects_when_saturated():
+    async def runner() -> None:
+        pool = web_routes.EmojiRenderPool(workers=1, max_pending=1)
+        pool.pending = 1
+        try:
+            await pool.render(_png_bytes(), 64, 0.8)
+        except web.HTTPServiceUnavailable as exc:
+            assert exc.headers["Retry-After"] == "1"
+        else:  # pragma: no cover - defensive
+            raise AssertionError("expected 503")
+        assert pool.rejected == 1
+
+        pool.pending = 0
+        body = await pool.render(_png_bytes(), 64, 0.8)
+        assert body.startswith(b"\x89PNG")
+        assert pool.pending == 0
+        pool.shutdown()
+
+    asyncio.run(runner())
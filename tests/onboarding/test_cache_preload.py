@@ -179,6 +179,29 @@ def test_preload_on_startup_refreshes_onboarding(monkeypatch: pytest.MonkeyPatch
     asyncio.run(runner())
 
 
+def test_preload_on_startup_loads_buckets_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def runner() -> None:
+        active = {"now": 0, "peak": 0}
+
+        async def fake_refresh(name: str, *, actor: str | None = None, trigger: str = "manual") -> None:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+
+        monkeypatch.setattr(cache_scheduler, "ensure_cache_registration", lambda: None)
+        monkeypatch.setattr(cache_scheduler.cache, "rehydrate", AsyncMock(return_value=[]))
+        monkeypatch.setattr(cache_scheduler.cache, "refresh_now", fake_refresh)
+        monkeypatch.setattr(cache_scheduler.async_adapter, "executor_capacity", lambda: 2)
+
+        durations = await cache_scheduler.preload_on_startup()
+
+        assert active["peak"] == 2
+        assert set(durations) == set(cache_scheduler.STARTUP_BUCKETS)
+
+    asyncio.run(runner())
+
+
 def test_schema_loader_refreshes_when_cache_cold(monkeypatch: pytest.MonkeyPatch) -> None:
     async def runner() -> None:
         onboarding_schema._clear_welcome_questions_cache()
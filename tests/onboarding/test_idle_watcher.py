@@ -69,6 +69,39 @@ def _row(age_hours: float, **overrides):
     return base
 
 
+def _scan_then_act(monkeypatch, bot) -> int:
+    """Seed a fresh schedule from ``load_all`` and run the actions it queued."""
+
+    rows = {str(row["thread_id"]): row for row in idle_watcher.onboarding_sessions.load_all()}
+    monkeypatch.setattr(idle_watcher, "_SCHEDULE", idle_watcher._DeadlineSchedule())
+    monkeypatch.setattr(idle_watcher.onboarding_sessions, "get_by_thread_id", lambda tid: rows.get(str(tid)))
+
+    async def runner():
+        await idle_watcher.run_idle_scan(bot, now=_fixed_now())
+        return await idle_watcher.run_due_actions(bot, now=_fixed_now())
+
+    return asyncio.run(runner())
+
+
+def test_idle_scan_only_reseeds_schedule(monkeypatch):
+    thread = _DummyThread(999)
+    bot = _DummyBot({999: thread})
+    schedule = idle_watcher._DeadlineSchedule()
+
+    async def _resolve(_bot, _tid):  # pragma: no cover - the scan must not act on rows
+        raise AssertionError("idle scan acted on a row")
+
+    monkeypatch.setattr(idle_watcher, "_SCHEDULE", schedule)
+    monkeypatch.setattr(idle_watcher, "_resolve_thread", _resolve)
+    monkeypatch.setattr(idle_watcher.onboarding_sessions, "load_all", lambda: [_row(3.1), _row(1, thread_id=555)])
+
+    asyncio.run(idle_watcher.run_idle_scan(bot, now=_fixed_now()))
+
+    assert not thread.sent
+    assert len(schedule) == 2
+    assert schedule.pop_due(_fixed_now()) == ["999"]
+
+
 def test_idle_watcher_posts_first_reminder(monkeypatch):
     thread = _DummyThread(999)
     bot = _DummyBot({999: thread})
@@ -96,7 +129,7 @@ def test_idle_watcher_posts_first_reminder(monkeypatch):
         ),
     )
 
-    asyncio.run(idle_watcher.run_idle_scan(bot, now=_fixed_now()))
+    _scan_then_act(monkeypatch, bot)
 
     assert thread.sent
     assert "open questions" in thread.sent[0].lower()
@@ -130,7 +163,7 @@ def test_idle_watcher_posts_warning(monkeypatch):
         ),
     )
 
-    asyncio.run(idle_watcher.run_idle_scan(bot, now=_fixed_now()))
+    _scan_then_act(monkeypatch, bot)
 
     assert thread.sent
     assert "<@&42>" in thread.sent[0]
@@ -165,7 +198,7 @@ def test_idle_watcher_autoclose_welcome(monkeypatch):
         ),
     )
 
-    asyncio.run(idle_watcher.run_idle_scan(bot, now=_fixed_now()))
+    _scan_then_act(monkeypatch, bot)
 
     assert thread.archived and thread.locked
     assert thread.name.startswith("Closed-")
@@ -201,8 +234,68 @@ def test_idle_watcher_autoclose_promo(monkeypatch):
         ),
     )
 
-    asyncio.run(idle_watcher.run_idle_scan(bot, now=_fixed_now()))
+    _scan_then_act(monkeypatch, bot)
 
     assert thread.sent and "promo ticket" in thread.sent[-1].lower()
     assert "remove the user" not in thread.sent[-1]
     assert saves and saves[0].get("auto_closed_at")
+
+
+def test_deadline_schedule_orders_and_replaces_entries():
+    schedule = idle_watcher._DeadlineSchedule()
+    schedule.seed(
+        [
+            _row(1, thread_id=1),
+            _row(3.5, thread_id=2),
+            _row(
+                30,
+                thread_id=3,
+                first_reminder_at=_fixed_now().isoformat(),
+                warning_sent_at=_fixed_now().isoformat(),
+            ),
+            _row(50, thread_id=4, completed=True),
+        ]
+    )
+    assert len(schedule) == 3
+    assert schedule.next_due() == _fixed_now() - timedelta(hours=0.5)
+
+    # Activity on thread 2 pushes its first reminder out past thread 1's.
+    schedule.update(_row(0, thread_id=2))
+    assert schedule.pop_due(_fixed_now()) == []
+    assert schedule.pop_due(_fixed_now() + timedelta(hours=2)) == ["1"]
+    assert schedule.pop_due(_fixed_now() + timedelta(hours=6)) == ["2", "3"]
+    assert schedule.next_due() is None
+
+
+def test_run_due_actions_reads_only_due_rows(monkeypatch):
+    thread = _DummyThread(999)
+    bot = _DummyBot({999: thread})
+    rows = {"999": _row(3.1), "555": _row(1, thread_id=555)}
+    reads: list[str] = []
+    saves: list[dict] = []
+
+    def _get(thread_id):
+        reads.append(str(thread_id))
+        return rows.get(str(thread_id))
+
+    def _update(thread_id, payload):
+        saves.append(payload)
+        rows[str(thread_id)] = payload
+
+    async def _resolve(_bot, _tid):
+        return thread
+
+    schedule = idle_watcher._DeadlineSchedule()
+    schedule.seed(rows.values())
+    monkeypatch.setattr(idle_watcher, "_SCHEDULE", schedule)
+    monkeypatch.setattr(idle_watcher, "_resolve_thread", _resolve)
+    monkeypatch.setattr(idle_watcher.onboarding_sessions, "get_by_thread_id", _get)
+    monkeypatch.setattr(idle_watcher.onboarding_sessions, "update_existing", _update)
+    monkeypatch.setattr(welcome_flow, "resolve_onboarding_flow", lambda t: welcome_flow.FlowResolution("welcome"))
+
+    handled = asyncio.run(idle_watcher.run_due_actions(bot, now=_fixed_now()))
+
+    assert handled == 1
+    assert set(reads) == {"999"}
+    assert saves and saves[0].get("first_reminder_at")
+    assert schedule.next_due() == _fixed_now() - timedelta(hours=1) + idle_watcher.FIRST_REMINDER_AFTER
@@ -135,3 +135,27 @@ def test_schema_hash_varies_by_flow() -> None:
     )
 
     assert promo_r_hash != promo_m_hash
+
+
+def test_schema_hash_is_memoised_per_rows_snapshot(monkeypatch: "pytest.MonkeyPatch") -> None:
+    def _rows(label: str) -> tuple[dict[str, str], ...]:
+        return (
+            {"flow": "welcome", "qid": "w_ign", "label": label, "order": "1", "type": "short"},
+        )
+
+    snapshot = {"rows": _rows("IGN")}
+    monkeypatch.setattr(onboarding_questions, "_cached_rows", lambda: snapshot["rows"])
+    monkeypatch.setattr(onboarding_questions, "_cached_rows_snapshot", None)
+    monkeypatch.setattr(onboarding_questions, "_cached_questions_by_flow", {})
+    monkeypatch.setattr(onboarding_questions, "_cached_schema_hash_by_flow", {})
+    before = onboarding_questions.schema_hash_stats()["computed"]
+
+    first = onboarding_questions.schema_hash("welcome")
+    assert onboarding_questions.schema_hash("welcome") == first
+    assert onboarding_questions.schema_hash_stats()["computed"] == before + 1
+
+    snapshot["rows"] = _rows("In-game name")
+    second = onboarding_questions.schema_hash("welcome")
+    assert second != first
+    assert onboarding_questions.schema_hash_stats()["computed"] == before + 2
+    assert onboarding_questions.schema_hash_stats()["cached_flows"] == 1
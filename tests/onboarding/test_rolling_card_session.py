@@ -46,6 +46,9 @@ class DummyController:
     def _complete_rolling(self, thread_id):
         self.completed.append(thread_id)
 
+    def _update_thread_visibility(self, thread_id, visibility):
+        return None
+
 
 def _question(
     order: str, qid: str, label: str, rules: str = "", nav_rules: str = ""
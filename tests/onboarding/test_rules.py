@@ -113,3 +113,77 @@ def test_visibility_precedence_and_flags() -> None:
     mid = rules.evaluate_visibility(questions, {"w_level_detail": "Mid Game"})
     assert mid["w_hydra_detail"]["state"] == "show"
     assert mid["w_hydra_detail"]["required"] is True
+
+
+def test_rules_compile_once_per_schema(monkeypatch) -> None:
+    from modules.onboarding.rules import evaluator
+
+    calls = {"count": 0}
+    real_parse = evaluator.parse_visibility_rules
+
+    def counting_parse(text, *, qid):
+        calls["count"] += 1
+        return real_parse(text, qid=qid)
+
+    monkeypatch.setattr(evaluator, "parse_visibility_rules", counting_parse)
+    questions = [
+        _question("w_level_detail"),
+        _question("w_compile_probe", visibility_rules='skip_if(w_level_detail = "Beginner")'),
+    ]
+
+    first = rules.compile_rules(questions)
+    for level in ("Beginner", "Mid Game", "Beginner"):
+        rules.evaluate_visibility(list(questions), {"w_level_detail": level})
+    assert rules.compile_rules(questions) is first
+    assert calls["count"] == 2
+
+    edited = [questions[0], _question("w_compile_probe", visibility_rules='skip_if(w_level_detail = "Mid Game")')]
+    assert rules.compile_rules(edited) is not first
+
+
+def test_incremental_visibility_only_reevaluates_dependents() -> None:
+    questions = [
+        _question("w_level_detail"),
+        _question("w_siege"),
+        _question("w_hydra_detail", visibility_rules='skip_if(w_level_detail = "Beginner")'),
+        _question("w_siege_detail", visibility_rules='optional_if(w_siege = "no")'),
+    ]
+    answers = {"w_level_detail": "Beginner", "w_siege": "yes"}
+    previous = rules.evaluate_visibility(questions, answers)
+    assert rules.compile_rules(questions).affected_by(["w_siege"]) == {"w_siege_detail"}
+
+    answers["w_siege"] = "no"
+    incremental = rules.evaluate_visibility(
+        questions, answers, previous=previous, changed=["w_siege"]
+    )
+    assert incremental == rules.evaluate_visibility(questions, answers)
+    assert incremental["w_hydra_detail"]["state"] == "skip"
+    assert incremental["w_siege_detail"]["state"] == "optional"
+
+
+def test_update_visibility_returns_only_flipped_entries() -> None:
+    questions = [
+        _question("w_gate"),
+        _question("w_detail", visibility_rules='skip_if(w_gate = "no")'),
+        _question("w_other"),
+    ]
+    previous = rules.evaluate_visibility(questions, {"w_gate": "no"})
+
+    unchanged, diff = rules.update_visibility(
+        questions, {"w_gate": "no", "w_other": "x"}, previous, ("w_other",)
+    )
+    assert diff == {}
+    assert unchanged == previous
+
+    current, diff = rules.update_visibility(
+        questions, {"w_gate": "yes"}, previous, ("w_gate",)
+    )
+    assert list(diff) == ["w_detail"]
+    assert diff["w_detail"]["visible"] is True
+    assert rules.visibility_changes(previous, current) == diff
+
+
+def test_update_visibility_diffs_full_pass_without_previous() -> None:
+    questions = [_question("w_gate")]
+    current, diff = rules.update_visibility(questions, {}, None, ("w_gate",))
+    assert diff == current
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from modules.onboarding import sessions
+
+
+def test_queue_writes_only_latest_state_per_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    written: list[tuple[str, int]] = []
+
+    async def runner() -> None:
+        release = asyncio.Event()
+
+        async def fake_arun(func, payload):
+            if not written:
+                await release.wait()
+            written.append((payload["thread_id"], payload["step_index"]))
+            return func(payload)
+
+        monkeypatch.setattr(sessions.async_adapter, "arun", fake_arun)
+        monkeypatch.setattr(sessions.sess_sheet, "save", lambda payload: True)
+        queue = sessions.SessionPersistQueue()
+
+        first = asyncio.create_task(queue.submit(1, {"thread_id": "1", "step_index": 0}))
+        await asyncio.sleep(0)
+        later = [
+            asyncio.create_task(queue.submit(1, {"thread_id": "1", "step_index": step}))
+            for step in (1, 2, 3)
+        ]
+        other = asyncio.create_task(queue.submit(2, {"thread_id": "2", "step_index": 9}))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        # Thread 2's write is in flight; thread 1 holds only its newest payload.
+        assert queue.pending_count() == 1
+
+        release.set()
+        await asyncio.gather(first, *later, other)
+
+    asyncio.run(runner())
+    assert sorted(written) == [("1", 0), ("1", 3), ("2", 9)]
+
+
+def test_queue_propagates_write_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def runner() -> None:
+        async def failing_arun(func, payload):
+            raise RuntimeError("quota")
+
+        monkeypatch.setattr(sessions.async_adapter, "arun", failing_arun)
+        session = sessions.Session(thread_id=5, applicant_id=6)
+        monkeypatch.setattr(sessions, "persist_queue", sessions.SessionPersistQueue())
+        with pytest.raises(RuntimeError):
+            await session.asave_to_sheet()
+
+    asyncio.run(runner())
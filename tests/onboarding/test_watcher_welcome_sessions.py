@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
@@ -202,3 +203,54 @@ def test_welcome_session_saves_subject_not_actor(monkeypatch):
     payload = saved[0]
     assert payload["user_id"] == 44444
     assert payload["thread_id"] == thread.id
+
+
+def test_thread_scan_is_bounded_and_isolates_failures() -> None:
+    in_flight = 0
+    peak = 0
+    seen: list[int] = []
+
+    async def worker(thread):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        seen.append(thread.id)
+        if thread.id == 3:
+            raise RuntimeError("boom")
+
+    threads = [DummyThread(f"W000{index}", thread_id=index) for index in range(8)]
+    timings = asyncio.run(watcher_welcome._process_threads_bounded(threads, worker, limit=3))
+
+    assert sorted(seen) == list(range(8))
+    assert peak == 3
+    assert len(timings) == 8
+
+
+def test_reminder_state_persists_without_blocking_save() -> None:
+    calls: list[str] = []
+
+    class _Session:
+        thread_id = 4242
+        applicant_id = 1
+        first_reminder_at = None
+        empty_first_reminder_at = None
+
+        def _touch(self, *, timestamp):
+            calls.append("touch")
+
+        def save_to_sheet(self):  # pragma: no cover - must not be used
+            raise AssertionError("sync save called from the event loop")
+
+        async def asave_to_sheet(self):
+            calls.append("asave")
+
+    session = _Session()
+    now = datetime.now(timezone.utc)
+
+    asyncio.run(watcher_welcome._persist_reminder_state(session, action="reminder_empty", timestamp=now))
+
+    assert calls == ["touch", "asave"]
+    assert session.first_reminder_at == now
+    assert session.empty_first_reminder_at == now
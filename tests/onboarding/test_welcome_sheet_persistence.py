@@ -24,10 +24,10 @@ def test_persist_session_start_records_sheet_row(monkeypatch: pytest.MonkeyPatch
     async def _ensure(applicant_id: int, thread_id: int, **_kwargs):
         session = welcome_controller.Session(thread_id=thread_id, applicant_id=applicant_id)
 
-        def _save() -> None:
+        async def _save() -> None:
             saved["session"] = session
 
-        session.save_to_sheet = _save
+        session.asave_to_sheet = _save
         return session
 
     monkeypatch.setattr(welcome_controller, "ensure_session_for_thread", _ensure)
@@ -61,7 +61,10 @@ def test_persist_session_completion_updates_answers(monkeypatch: pytest.MonkeyPa
     async def _ensure(applicant_id: int, thread_id: int, **_kwargs):
         assert applicant_id == 606
         assert thread_id == 505
-        existing.save_to_sheet = lambda: saved.setdefault("session", existing)
+        async def _save() -> None:
+            saved.setdefault("session", existing)
+
+        existing.asave_to_sheet = _save
         return existing
 
     monkeypatch.setattr(welcome_controller, "ensure_session_for_thread", _ensure)
@@ -4,7 +4,7 @@ from typing import Any
 import pytest
 
 from modules.recruitment import availability
-from shared.sheets import reservations
+from shared.sheets import reservations, write_behind
 
 
 class StubWorksheet:
@@ -69,8 +69,8 @@ def test_recompute_clan_availability_updates_sheet(monkeypatch):
     async def fake_acall(func, *args, **kwargs):
         return func(*args, **kwargs)
 
-    monkeypatch.setattr(availability.async_core, "aget_worksheet", fake_aget)
-    monkeypatch.setattr(availability.async_core, "acall_with_backoff", fake_acall)
+    monkeypatch.setattr(write_behind.async_core, "aget_worksheet", fake_aget)
+    monkeypatch.setattr(write_behind.async_core, "acall_with_backoff", fake_acall)
 
     updated_rows = {}
 
@@ -124,8 +124,8 @@ def test_recompute_clan_availability_zero_reservations(monkeypatch):
     async def fake_acall(func, *args, **kwargs):
         return func(*args, **kwargs)
 
-    monkeypatch.setattr(availability.async_core, "aget_worksheet", fake_aget)
-    monkeypatch.setattr(availability.async_core, "acall_with_backoff", fake_acall)
+    monkeypatch.setattr(write_behind.async_core, "aget_worksheet", fake_aget)
+    monkeypatch.setattr(write_behind.async_core, "acall_with_backoff", fake_acall)
 
     monkeypatch.setattr(availability.recruitment, "update_cached_clan_row", lambda *args, **kwargs: None)
 
@@ -119,3 +119,102 @@ def test_load_reservation_ledger_rejects_bad_header(monkeypatch):
 
     with pytest.raises(reservations.ReservationSchemaError):
         asyncio.run(reservations.load_reservation_ledger())
+
+
+def _patch_sheet_writes(monkeypatch, writes):
+    async def fake_write(sheet_id, tab_name, cell, values):
+        writes.append((cell, values))
+
+    class FakeWorksheet:
+        def append_row(self, payload, value_input_option="RAW"):
+            writes.append(("append", payload))
+            return {"updates": {"updatedRange": "Reservations!A5:I5"}}
+
+    async def fake_worksheet(sheet_id, tab_name):
+        return FakeWorksheet()
+
+    async def fake_call(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(reservations.recruitment, "ensure_service_account_credentials", lambda: None)
+    monkeypatch.setattr(reservations.recruitment, "get_recruitment_sheet_id", lambda: "sheet")
+    monkeypatch.setattr(reservations.recruitment, "get_reservations_tab_name", lambda: "Reservations")
+    monkeypatch.setattr(reservations.write_behind, "awrite_range", fake_write)
+    monkeypatch.setattr(reservations.async_core, "aget_worksheet", fake_worksheet)
+    monkeypatch.setattr(reservations.async_core, "acall_with_backoff", fake_call)
+
+
+def test_cached_ledger_indexes_follow_writes(monkeypatch):
+    from shared.sheets import cache_service
+
+    header = list(reservations.RESERVATIONS_HEADERS)
+    matrix = [
+        header,
+        ["100", "1", "", "#AAA", "", "", "active", "", "Alice"],
+        ["200", "2", "", "#AAA", "", "", "active", "", "Bob"],
+        ["300", "3", "", "#BBB", "", "", "expired", "", "Cara"],
+    ]
+    fetches = 0
+
+    async def fake_fetch():
+        nonlocal fetches
+        fetches += 1
+        return matrix
+
+    writes: list = []
+    monkeypatch.setattr(reservations, "_fetch_reservations_matrix", fake_fetch)
+    monkeypatch.setattr(cache_service, "cache", cache_service.CacheService(snapshot_dir=""))
+    _patch_sheet_writes(monkeypatch, writes)
+    reservations.register_cache_buckets()
+
+    async def runner() -> None:
+        assert await reservations.count_active_reservations_for_clan("#AAA") == 2
+        assert [row.thread_id for row in await reservations.find_active_reservations_for_recruit(2)] == ["200"]
+        assert await reservations.find_active_reservations_for_recruit(None, "alice")
+
+        await reservations.update_reservation_status(2, "released")
+        await reservations.update_reservation_expiry(3, dt.date(2025, 12, 1))
+        await reservations.append_reservation_row(
+            ["400", "4", "9", "#BBB", "2025-12-02", "", "active", "", "Dan"]
+        )
+
+        assert [row.thread_id for row in await reservations.get_active_reservations_for_clan("#AAA")] == ["200"]
+        assert await reservations.find_active_reservations_for_recruit(None, "Alice") == []
+        by_clan = await reservations.get_active_reservations_by_clan()
+        assert [row.row_number for row in by_clan["BBB"]] == [5]
+        ledger = await reservations.get_reservation_ledger()
+        assert ledger.row(3).reserved_until == dt.date(2025, 12, 1)
+        assert [row.row_number for row in ledger.active_for_thread(400)] == [5]
+
+    asyncio.run(runner())
+    assert fetches == 1
+    assert [cell for cell, _ in writes] == ["G2", "E3", "append"]
+
+
+def test_cached_ledger_reloads_when_write_cannot_be_mirrored(monkeypatch):
+    from shared.sheets import cache_service
+
+    header = list(reservations.RESERVATIONS_HEADERS)
+    matrix = [header, ["100", "1", "", "#AAA", "", "", "active", "", "Alice"]]
+    fetches = 0
+
+    async def fake_fetch():
+        nonlocal fetches
+        fetches += 1
+        return matrix
+
+    writes: list = []
+    monkeypatch.setattr(reservations, "_fetch_reservations_matrix", fake_fetch)
+    monkeypatch.setattr(cache_service, "cache", cache_service.CacheService(snapshot_dir=""))
+    _patch_sheet_writes(monkeypatch, writes)
+    reservations.register_cache_buckets()
+
+    async def runner() -> None:
+        await reservations.get_reservation_ledger()
+        # Row 9 is not in the cached ledger, so the next read goes back to the sheet.
+        await reservations.update_reservation_status(9, "expired")
+        await reservations.get_reservation_ledger()
+        await reservations.get_reservation_ledger()
+
+    asyncio.run(runner())
+    assert fetches == 2
@@ -0,0 +1,107 @@
+import itertools
+
+from modules.recruitment import search, search_helpers
+from shared.sheets.recruitment import RecruitmentClanRecord
+
+
+def _record(
+    name: str,
+    *,
+    spots: int,
+    inactives: int = 0,
+    cb: str = "UNM",
+    hydra: str = "NM",
+    chimera: str = "Hard",
+    cvc: str = "1",
+    siege: str = "0",
+    playstyle: str = "Competitive",
+) -> RecruitmentClanRecord:
+    row = [""] * (search_helpers.IDX_AG_INACTIVES + 1)
+    row[search_helpers.COL_B_CLAN] = name
+    row[search_helpers.COL_C_TAG] = name[:3].upper()
+    row[search_helpers.COL_E_SPOTS] = str(spots)
+    row[search_helpers.COL_P_CB] = cb
+    row[search_helpers.COL_Q_HYDRA] = hydra
+    row[search_helpers.COL_R_CHIMERA] = chimera
+    row[search_helpers.COL_S_CVC] = cvc
+    row[search_helpers.COL_T_SIEGE] = siege
+    row[search_helpers.COL_U_STYLE] = playstyle
+    row[search_helpers.IDX_AG_INACTIVES] = str(inactives)
+    return RecruitmentClanRecord(
+        row=tuple(row),
+        open_spots=spots,
+        inactives=inactives,
+        reserved=0,
+        roster=str(spots),
+    )
+
+
+ROSTER = [
+    _record("Alpha", spots=2, cb="Ultra Nightmare", playstyle="Casual, Stress-Free"),
+    _record("Bravo", spots=0, inactives=3, cb="NM", hydra="Brutal", siege="1"),
+    _record("Charlie", spots=1, cb="Hard", chimera="Normal", cvc="0", playstyle="Semi Competitive"),
+    _record("Delta", spots=0, cb="UNM / NM", hydra="Hard", playstyle="Competitive|Casual"),
+]
+
+
+def _scan(records, **filters):
+    roster_mode = filters.pop("roster_mode")
+    out = []
+    for record in records:
+        if not search_helpers.row_matches(record.row, **filters):
+            continue
+        if roster_mode == "open" and record.open_spots <= 0:
+            continue
+        if roster_mode == "full" and record.open_spots > 0:
+            continue
+        if roster_mode == "inactives" and record.inactives <= 0:
+            continue
+        out.append(record)
+    return out
+
+
+def test_index_matches_row_scan_for_all_filter_combinations() -> None:
+    options = {
+        "cb": [None, "UNM", "NM", "Hard", "Ultra-Nightmare"],
+        "hydra": [None, "Brutal", "Hard"],
+        "chimera": [None, "Normal"],
+        "cvc": [None, "1", "0"],
+        "siege": [None, "1"],
+        "playstyle": [None, "Casual", "Stress Free", "Semi-Competitive"],
+        "roster_mode": [None, "open", "full", "inactives"],
+    }
+    keys = list(options)
+    for combo in itertools.product(*(options[key] for key in keys)):
+        filters = dict(zip(keys, combo))
+        expected = _scan(ROSTER, **dict(filters))
+        assert search.filter_records(ROSTER, **filters) == expected, filters
+
+
+def test_index_is_reused_until_roster_changes() -> None:
+    first = search.get_facet_index(ROSTER)
+    assert search.get_facet_index(list(ROSTER)) is first
+
+    patched = list(ROSTER)
+    patched[0] = _record("Alpha", spots=0, cb="Brutal")
+    rebuilt = search.get_facet_index(patched)
+    assert rebuilt is not first
+    assert search.filter_records(
+        patched,
+        cb="Brutal",
+        hydra=None,
+        chimera=None,
+        cvc=None,
+        siege=None,
+        playstyle=None,
+        roster_mode=None,
+    ) == [patched[0]]
+
+
+def test_header_rows_are_never_searchable() -> None:
+    header = _record("Clan", spots=5)
+    index = search_helpers.ClanFacetIndex(
+        [header.row, ROSTER[0].row],
+        open_spots=[5, 2],
+        inactives=[0, 0],
+    )
+    assert index.match(None, None, None, None, None, None) == [1]
@@ -0,0 +1,211 @@
+import asyncio
+import json
+
+from shared.sheets.cache_service import CacheService
+
+
+def test_refresh_writes_snapshot_and_rehydrates(tmp_path) -> None:
+    async def runner() -> None:
+        first = CacheService(snapshot_dir=tmp_path)
+
+        async def loader():
+            return [["C1CE", "Elite"], ["C1CM", "Martyrs"]]
+
+        first.register("clans", 60, loader)
+        await first.refresh_now("clans", actor="test")
+
+        payload = json.loads((tmp_path / "clans.json").read_text(encoding="utf-8"))
+        assert payload["name"] == "clans"
+        assert payload["value"] == [["C1CE", "Elite"], ["C1CM", "Martyrs"]]
+
+        calls = 0
+        release = asyncio.Event()
+
+        async def slow_loader():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [["C1CE", "Elite"]]
+
+        second = CacheService(snapshot_dir=tmp_path)
+        second.register("clans", 60, slow_loader)
+        assert await second.rehydrate() == ["clans"]
+
+        bucket = second.get_bucket("clans")
+        assert bucket.rehydrated is True
+        assert await second.get("clans") == [["C1CE", "Elite"], ["C1CM", "Martyrs"]]
+
+        await asyncio.sleep(0)
+        assert calls == 1
+        release.set()
+        await bucket.refreshing
+        assert bucket.rehydrated is False
+        assert await second.get("clans") == [["C1CE", "Elite"]]
+
+    asyncio.run(runner())
+
+
+def test_rehydrate_applies_decoder_and_ignores_unknown_buckets(tmp_path) -> None:
+    async def runner() -> None:
+        (tmp_path / "questions.json").write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "name": "questions",
+                    "last_refresh": "2025-01-01T00:00:00+00:00",
+                    "value": [{"qid": "w1"}],
+                }
+            ),
+            encoding="utf-8",
+        )
+        (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+        async def loader():
+            return ()
+
+        service = CacheService(snapshot_dir=tmp_path)
+        service.register("questions", 60, loader, decode=tuple)
+        service.register("broken", 60, loader)
+        service.register("missing", 60, loader)
+
+        assert await service.rehydrate() == ["questions"]
+        assert service.get_bucket("questions").value == ({"qid": "w1"},)
+        assert service.get_bucket("broken").value is None
+
+    asyncio.run(runner())
+
+
+def test_snapshots_disabled_without_directory(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("CACHE_SNAPSHOT_DIR", raising=False)
+
+    async def runner() -> None:
+        service = CacheService()
+
+        async def loader():
+            return ["C1CE"]
+
+        service.register("clan_tags", 60, loader)
+        await service.refresh_now("clan_tags", actor="test")
+        assert await service.rehydrate() == []
+
+    asyncio.run(runner())
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_refresh_if_stale_skips_fresh_and_joins_in_flight(tmp_path) -> None:
+    async def runner() -> None:
+        calls = 0
+        gates: list[asyncio.Event] = []
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            gate = asyncio.Event()
+            gates.append(gate)
+            await gate.wait()
+            return [["C1CE", "Elite"]]
+
+        service = CacheService(snapshot_dir=tmp_path)
+        service.register("clans", 60, loader)
+        bucket = service.get_bucket("clans")
+
+        await service.get("clans")
+        joiner = asyncio.create_task(service.refresh_if_stale("clans", actor="startup"))
+        await asyncio.sleep(0)
+        gates[0].set()
+        await joiner
+        assert calls == 1
+        assert bucket.value == [["C1CE", "Elite"]]
+
+        await service.refresh_if_stale("clans", actor="startup")
+        assert calls == 1
+
+        # An inline refresh finishing first must not clear the background marker.
+        await service.invalidate("clans")
+        await service.get("clans")
+        background = bucket.refreshing
+        inline = asyncio.create_task(service.refresh_now("clans", actor="manual"))
+        await asyncio.sleep(0)
+        assert calls == 3
+        gates[2].set()
+        await inline
+        assert bucket.refreshing is background
+        gates[1].set()
+        await background
+        assert bucket.refreshing is None
+
+    asyncio.run(runner())
+
+
+def test_recruitment_snapshot_rebuilds_clan_and_template_state(tmp_path, monkeypatch) -> None:
+    from shared.sheets import recruitment
+
+    header = ["", "Clan", "Tag", "Open Spots", "Inactives", "Reserved", "Roster"]
+    rows = [["", "Elite", "C1CE", "3", "1", "0", "47/50"]]
+    templates = [{"key": "C1CE", "body": "Welcome"}]
+
+    def fail_fetch(*_args, **_kwargs):
+        raise AssertionError("rehydrated state should not hit Sheets")
+
+    for name in (
+        "_CLAN_ROWS",
+        "_CLAN_TAG_INDEX",
+        "_CLAN_HEADER_MAP",
+        "_CLAN_RECORDS",
+        "_TEMPLATE_ROWS",
+    ):
+        monkeypatch.setattr(recruitment, name, None)
+    monkeypatch.setattr(recruitment, "_CLAN_HEADER_ROW", header)
+
+    async def runner() -> None:
+        first = CacheService(snapshot_dir=tmp_path)
+
+        async def load_clans():
+            return rows
+
+        async def load_templates():
+            return templates
+
+        first.register(
+            "clans",
+            60,
+            load_clans,
+            decode=recruitment._decode_clans_snapshot,
+            encode=recruitment._encode_clans_snapshot,
+        )
+        first.register(
+            "templates", 60, load_templates, decode=recruitment._decode_templates_snapshot
+        )
+        await first.refresh_now("clans", actor="test")
+        await first.refresh_now("templates", actor="test")
+
+        payload = json.loads((tmp_path / "clans.json").read_text(encoding="utf-8"))
+        assert payload["value"] == {"header": header, "rows": rows}
+
+        second = CacheService(snapshot_dir=tmp_path)
+        second.register(
+            "clans",
+            60,
+            load_clans,
+            decode=recruitment._decode_clans_snapshot,
+            encode=recruitment._encode_clans_snapshot,
+        )
+        second.register(
+            "templates", 60, load_templates, decode=recruitment._decode_templates_snapshot
+        )
+        assert sorted(await second.rehydrate()) == ["clans", "templates"]
+        assert second.get_bucket("clans").value == rows
+
+    asyncio.run(runner())
+
+    monkeypatch.setattr(recruitment.core, "fetch_values", fail_fetch)
+    monkeypatch.setattr(recruitment.core, "fetch_records", fail_fetch)
+    monkeypatch.setattr(recruitment, "_sheet_id", lambda: "sheet")
+    monkeypatch.setattr(recruitment, "_clans_tab", lambda: "Clans")
+    monkeypatch.setattr(recruitment, "_templates_tab", lambda: "Templates")
+
+    assert recruitment.fetch_clans() == rows
+    assert recruitment.get_clan_by_tag("c1ce") == rows[0]
+    records = recruitment.get_clan_records()
+    assert [(r.open_spots, r.inactives, r.roster) for r in records] == [(3, 1, "47/50")]
+    assert recruitment.fetch_templates() == templates
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from shared.cache import telemetry
+from shared.sheets import cache_service
+from shared.sheets.cache_service import CacheService, CacheStats
+
+
+def test_latency_histogram_buckets() -> None:
+    stats = CacheStats()
+    stats.observe_latency(40)
+    stats.observe_latency(100)
+    stats.observe_latency(700)
+    stats.observe_latency(60000)
+
+    histogram = stats.latency_histogram()
+    assert histogram["le_100ms"] == 2
+    assert histogram["le_1000ms"] == 1
+    assert histogram["gt_30000ms"] == 1
+    assert stats.as_dict()["latency_avg_ms"] == (40 + 100 + 700 + 60000) // 4
+
+
+def test_get_and_peek_count_hits_stale_and_misses() -> None:
+    async def runner() -> None:
+        service = CacheService(snapshot_dir="")
+
+        async def loader():
+            return ["C1CE"]
+
+        bucket = service.register("clan_tags", 60, loader)
+        assert service.peek("clan_tags") is None
+
+        await service.refresh_now("clan_tags", actor="test")
+        assert await service.get("clan_tags") == ["C1CE"]
+        assert service.peek("clan_tags") == ["C1CE"]
+
+        await service.invalidate("clan_tags")
+        assert service.peek("clan_tags") == ["C1CE"]
+
+        assert bucket.stats.misses == 1
+        assert bucket.stats.hits == 2
+        assert bucket.stats.stale_hits == 1
+        assert bucket.stats.refreshes == 1
+        assert sum(bucket.stats.latency_counts) == 1
+
+    asyncio.run(runner())
+
+
+def test_refresh_failures_are_counted(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def runner() -> None:
+        async def _no_wait(_seconds: float) -> None:
+            return None
+
+        monkeypatch.setattr(cache_service.asyncio, "sleep", _no_wait)
+        service = CacheService(snapshot_dir="")
+
+        async def loader():
+            raise RuntimeError("boom")
+
+        bucket = service.register("templates", 60, loader)
+        await service.refresh_now("templates", actor="test")
+
+        assert bucket.stats.refreshes == 1
+        assert bucket.stats.refresh_failures == 1
+        # Both the first attempt and the retry are timed.
+        assert sum(bucket.stats.latency_counts) == 2
+
+    asyncio.run(runner())
+
+
+def test_telemetry_snapshot_exposes_counters(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def runner() -> None:
+        service = CacheService(snapshot_dir="")
+
+        async def loader():
+            return [1, 2, 3]
+
+        service.register("clans", 60, loader)
+        monkeypatch.setattr(cache_service, "cache", service)
+        await service.refresh_now("clans", actor="test")
+        await service.get("clans")
+        service.peek("clans")
+
+        assert telemetry.list_buckets() == ["clans"]
+        snapshot = telemetry.get_snapshot("clans")
+        assert snapshot.hits == 2
+        assert snapshot.misses == 0
+        assert snapshot.refreshes == 1
+        assert snapshot.refresh_failures == 0
+        assert snapshot.hit_ratio == 1.0
+        assert snapshot.latency_histogram is not None
+        assert sum(snapshot.latency_histogram.values()) == 1
+
+    asyncio.run(runner())
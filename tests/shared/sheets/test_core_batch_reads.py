@@ -0,0 +1,115 @@
+import asyncio
+
+from shared.sheets import core
+
+
+class _Workbook:
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls: list[list[str]] = []
+
+    def values_batch_get(self, ranges):
+        self.calls.append(list(ranges))
+        return {
+            "valueRanges": [
+                {"range": rng, "values": self.payload.get(rng, [])} for rng in ranges
+            ]
+        }
+
+
+def _install(monkeypatch, workbook) -> None:
+    monkeypatch.setitem(core._WorkbookCache, "sheet-id", workbook)
+    monkeypatch.setattr(core, "_BATCH_WINDOW_SEC", 0.0)
+
+
+def test_fetch_values_batch_quotes_tabs_and_pads_rows(monkeypatch) -> None:
+    workbook = _Workbook(
+        {
+            "'Clan List'": [["a", "b", "c"], ["d"]],
+            "Config!A1:B2": [["k", "v"]],
+        }
+    )
+    _install(monkeypatch, workbook)
+
+    results = core.fetch_values_batch("sheet-id", ["Clan List", "Config!A1:B2", "Empty"])
+
+    assert workbook.calls == [["'Clan List'", "Config!A1:B2", "'Empty'"]]
+    assert results == [[["a", "b", "c"], ["d", "", ""]], [["k", "v"]], []]
+
+
+def test_concurrent_batched_reads_share_one_request(monkeypatch) -> None:
+    workbook = _Workbook(
+        {
+            "'bot_info'": [["row1"], ["row2"]],
+            "'WelcomeTemplates'": [["tag", "count"], ["C1CE", "3"]],
+        }
+    )
+    _install(monkeypatch, workbook)
+
+    async def runner():
+        return await asyncio.gather(
+            core.afetch_values("sheet-id", "bot_info", batched=True),
+            core.afetch_records("sheet-id", "WelcomeTemplates", batched=True),
+            core.afetch_values("sheet-id", "bot_info", batched=True),
+        )
+
+    clans, templates, clans_again = asyncio.run(runner())
+
+    assert len(workbook.calls) == 1
+    assert sorted(workbook.calls[0]) == ["'WelcomeTemplates'", "'bot_info'"]
+    assert clans == [["row1"], ["row2"]]
+    assert clans_again == clans and clans_again is not clans
+    assert templates == [{"tag": "C1CE", "count": 3}]
+
+
+def test_failed_batch_falls_back_to_single_range_reads(monkeypatch) -> None:
+    class _StrictWorkbook(_Workbook):
+        def values_batch_get(self, ranges):
+            if "'Missing'" in ranges:
+                self.calls.append(list(ranges))
+                raise ValueError("Unable to parse range: 'Missing'")
+            return super().values_batch_get(ranges)
+
+    workbook = _StrictWorkbook({"'bot_info'": [["row1"]], "'WelcomeTemplates'": [["tag"]]})
+    _install(monkeypatch, workbook)
+    monkeypatch.setattr(core, "_DEFAULT_ATTEMPTS", 1)
+
+    async def runner():
+        return await asyncio.gather(
+            core.afetch_values("sheet-id", "bot_info", batched=True),
+            core.afetch_values("sheet-id", "Missing", batched=True),
+            core.afetch_values("sheet-id", "WelcomeTemplates", batched=True),
+            return_exceptions=True,
+        )
+
+    clans, missing, templates = asyncio.run(runner())
+
+    assert clans == [["row1"]]
+    assert templates == [["tag"]]
+    assert isinstance(missing, ValueError)
+    assert len(workbook.calls[0]) == 3
+    assert sorted(map(tuple, workbook.calls[1:])) == sorted(
+        [("'Missing'",), ("'WelcomeTemplates'",), ("'bot_info'",)]
+    )
+
+
+def test_batch_uses_shortest_joined_timeout(monkeypatch) -> None:
+    seen: list[float | None] = []
+
+    async def fake_batch(sheet_id, ranges, *, timeout=None):
+        seen.append(timeout)
+        return [[["v"]] for _ in ranges]
+
+    monkeypatch.setattr(core, "_BATCH_WINDOW_SEC", 0.0)
+    monkeypatch.setattr(core, "afetch_values_batch", fake_batch)
+
+    async def runner():
+        await asyncio.gather(
+            core._afetch_values_coalesced("sheet-id", "A", timeout=None),
+            core._afetch_values_coalesced("sheet-id", "B", timeout=10.0),
+            core._afetch_values_coalesced("sheet-id", "C", timeout=4.0),
+        )
+
+    asyncio.run(runner())
+
+    assert seen == [4.0]
@@ -0,0 +1,130 @@
+import asyncio
+import datetime as dt
+
+import pytest
+
+from shared.sheets import export_utils
+
+
+class _FakeCreds:
+    def __init__(self) -> None:
+        self.token = None
+        self.expiry = None
+        self.refreshes = 0
+
+    def refresh(self, _request) -> None:
+        self.refreshes += 1
+        self.token = f"token-{self.refreshes}"
+        self.expiry = dt.datetime.utcnow() + dt.timedelta(hours=1)
+
+
+class _FakeResponse:
+    status_code = 200
+    content = b"%PDF-1.4"
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.closed = False
+
+    def get(self, url, **_kwargs):
+        self.calls += 1
+        return _FakeResponse()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def creds(monkeypatch):
+    fake = _FakeCreds()
+    monkeypatch.setattr(export_utils, "_CREDS", fake)
+    return fake
+
+
+def test_access_token_is_reused_until_near_expiry(creds) -> None:
+    first = export_utils._get_service_account_headers()
+    second = export_utils._get_service_account_headers()
+    assert first == second == {"Authorization": "Bearer token-1"}
+    assert creds.refreshes == 1
+
+    creds.expiry = dt.datetime.utcnow() + dt.timedelta(minutes=2)
+    assert export_utils._get_service_account_headers() == {"Authorization": "Bearer token-2"}
+
+
+def test_export_uses_shared_session_and_records_phase_timings(monkeypatch, creds) -> None:
+    session = _FakeSession()
+    monkeypatch.setattr(export_utils, "_SESSION", session)
+    monkeypatch.setattr(export_utils, "_AUTH_REQUEST", None)
+    monkeypatch.setattr(export_utils, "_convert_pdf_to_png", lambda data: b"png")
+    before = export_utils.export_stats()
+
+    for _ in range(3):
+        assert export_utils._export_pdf_as_png_sync("sheet", 0, "A1:B2") == b"png"
+
+    after = export_utils.export_stats()
+    assert session.calls == 3
+    assert session.closed is False
+    assert creds.refreshes == 1
+    assert after["exports"] - before["exports"] == 3
+    assert after["token_refreshes"] - before["token_refreshes"] == 1
+    for key in ("auth_ms", "download_ms", "convert_ms"):
+        assert after[key] >= before[key]
+
+
+def test_range_fingerprint_tracks_formatted_values() -> None:
+    base = export_utils.range_fingerprint([["Clan", 1], ["Other", None]])
+    assert base == export_utils.range_fingerprint([["Clan", "1"], ["Other", ""]])
+    assert base != export_utils.range_fingerprint([["Clan", "2"], ["Other", ""]])
+
+
+def test_fingerprint_store_persists_source_and_png(tmp_path) -> None:
+    store = export_utils.ExportFingerprints(tmp_path)
+    assert store.source_unchanged("mirralith:[A]", "abc") is False
+
+    store.remember("mirralith:[A]", "abc", b"png-1")
+    assert store.source_unchanged("mirralith:[A]", "abc") is True
+    assert store.source_unchanged("mirralith:[A]", None) is False
+    assert store.png_unchanged("mirralith:[A]", b"png-1") is True
+    assert store.png_unchanged("mirralith:[A]", b"png-2") is False
+
+    reloaded = export_utils.ExportFingerprints(tmp_path)
+    assert reloaded.source_unchanged("mirralith:[A]", "abc") is True
+    assert reloaded.load_png("mirralith:[A]") == b"png-1"
+    assert reloaded.load_png("leagues:missing") is None
+
+
+def test_fingerprint_store_async_helpers_round_trip(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("CACHE_SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(export_utils, "_FINGERPRINTS", None)
+
+    async def runner() -> None:
+        store = await export_utils.aget_fingerprint_store()
+        assert store is export_utils.get_fingerprint_store()
+        await store.aremember("leagues:legendary:board", "abc", b"png-1")
+        assert await store.aload_png("leagues:legendary:board") == b"png-1"
+
+    asyncio.run(runner())
+    reloaded = export_utils.ExportFingerprints(tmp_path)
+    assert reloaded.load_png("leagues:legendary:board") == b"png-1"
+
+
+def test_range_fingerprints_fall_back_to_none_on_read_failure(monkeypatch) -> None:
+    async def failing(sheet_id, ranges):
+        raise RuntimeError("quota")
+
+    async def ok(sheet_id, ranges):
+        assert ranges == ["'Clan Status'!A1:B2", "'O''Brien'!C3:D4"]
+        return [[["a"]], [["b"]]]
+
+    monkeypatch.setattr(export_utils.async_core, "afetch_values_batch", failing)
+    pairs = [("Clan Status", "A1:B2"), ("O'Brien", "C3:D4")]
+    assert asyncio.run(export_utils.afetch_range_fingerprints("sheet", pairs)) == [None, None]
+
+    monkeypatch.setattr(export_utils.async_core, "afetch_values_batch", ok)
+    result = asyncio.run(export_utils.afetch_range_fingerprints("sheet", pairs))
+    assert result == [
+        export_utils.range_fingerprint([["a"]]),
+        export_utils.range_fingerprint([["b"]]),
+    ]
@@ -91,3 +91,99 @@ def test_thread_id_matching_uses_strings(monkeypatch, headers):
     assert len(sheet.appended) == 1
     record = sheet_module._record_from_row(sheet.appended[0], headers, sheet_module._header_index_map(headers))
     assert record["thread_id"] == payload["thread_id"]
+
+
+class _CountingSheet(_RecordingSheet):
+    def __init__(self, rows):
+        super().__init__(rows)
+        self.reads = 0
+
+    def get_all_values(self):
+        self.reads += 1
+        return [list(row) for row in self._rows]
+
+    def update(self, range_, values):
+        row_number = int(range_.split(":")[0][1:])
+        if row_number > len(self._rows):
+            raise ValueError(f"range {range_} exceeds grid limits")
+        super().update(range_, values)
+        self._rows[row_number - 1] = list(values[0])
+
+    def append_row(self, values):
+        super().append_row(values)
+        self._rows.append(list(values))
+        return {"updates": {"updatedRange": f"Sessions!A{len(self._rows)}:L{len(self._rows)}"}}
+
+
+def test_index_serves_repeat_saves_without_rereading(monkeypatch, headers):
+    sheet = _CountingSheet([headers, _row({"thread_id": "111", "thread_name": "W0001-a"}, headers)])
+    monkeypatch.setattr(sheet_module, "_sheet", lambda: sheet)
+    monkeypatch.setattr(sheet_module, "_now_iso", lambda: "2025-12-06T00:00:00Z")
+
+    sheet_module.upsert_session(thread_id=222, thread_name="W0002-b", user_id=7)
+    sheet_module.update_existing(222, {"step_index": 3, "answers": {"w_ign": "Bob"}})
+    sheet_module.save({"thread_id": "111", "step_index": 1})
+    assert sheet_module.mark_completed(222, completed_at="2025-12-07T00:00:00Z") is True
+    assert sheet_module.update_existing(999, {"step_index": 1}) is False
+
+    assert sheet.reads == 1
+    assert [range_ for range_, _ in sheet.updated] == ["A3:L3", "A2:L2", "A3:L3"]
+    loaded = sheet_module.load(None, 222)
+    assert loaded["completed"] is True
+    assert loaded["step_index"] == 3
+    assert loaded["answers"] == {}
+    assert sheet.reads == 1
+
+    # ``load_all`` always re-reads so out-of-band sheet edits are picked up.
+    assert [row["thread_id"] for row in sheet_module.load_all()] == ["111", "222"]
+    assert sheet.reads == 2
+
+
+def test_save_reindexes_when_cached_row_update_fails(monkeypatch, headers):
+    sheet = _CountingSheet(
+        [
+            headers,
+            _row({"thread_id": "111", "thread_name": "W0001-a"}, headers),
+            _row({"thread_id": "222", "thread_name": "W0002-b"}, headers),
+        ]
+    )
+    monkeypatch.setattr(sheet_module, "_sheet", lambda: sheet)
+    monkeypatch.setattr(sheet_module, "_now_iso", lambda: "2025-12-06T00:00:00Z")
+    assert sheet_module.prefetch() == 2
+
+    # A steady-state save trusts the index: one write, no extra reads.
+    sheet_module.save({"thread_id": "111", "step_index": 1})
+    assert sheet.reads == 1
+
+    # Someone deletes row 2 out of band, so the cached row 3 is off the grid.
+    del sheet._rows[1]
+    sheet_module.save({"thread_id": "222", "step_index": 4})
+
+    assert sheet.reads == 2
+    assert [range_ for range_, _ in sheet.updated] == ["A2:L2", "A2:L2"]
+    assert sheet_module.load(None, 222)["step_index"] == 4
+    assert len(sheet._rows) == 2
+
+
+def test_save_updates_index_reloaded_during_write(monkeypatch, headers):
+    class _ScanningSheet(_CountingSheet):
+        def update(self, range_, values):
+            # A concurrent scan swaps in a fresh index before the write lands.
+            sheet_module.load_all()
+            super().update(range_, values)
+
+        def append_row(self, values):
+            sheet_module.load_all()
+            return super().append_row(values)
+
+    sheet = _ScanningSheet([headers, _row({"thread_id": "111", "thread_name": "W0001-a"}, headers)])
+    monkeypatch.setattr(sheet_module, "_sheet", lambda: sheet)
+    monkeypatch.setattr(sheet_module, "_now_iso", lambda: "2025-12-06T00:00:00Z")
+
+    sheet_module.save({"thread_id": "111", "step_index": 5})
+    assert sheet_module.load(None, 111)["step_index"] == 5
+
+    sheet_module.save({"thread_id": "222", "thread_name": "W0002-b"})
+    sheet_module.save({"thread_id": "222", "step_index": 2})
+    assert len(sheet._rows) == 3
+    assert sheet_module.load(None, 222)["step_index"] == 2
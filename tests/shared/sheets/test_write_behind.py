@@ -0,0 +1,176 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from shared.sheets import write_behind
+
+
+class _Worksheet:
+    def __init__(self) -> None:
+        self.updates: list[tuple[str, Any, dict[str, Any]]] = []
+        self.batches: list[tuple[list[dict[str, Any]], dict[str, Any]]] = []
+
+    def update(self, a1_range, values, **kwargs):
+        self.updates.append((a1_range, values, kwargs))
+
+    def batch_update(self, data, **kwargs):
+        self.batches.append((list(data), kwargs))
+
+
+@pytest.fixture
+def worksheet(monkeypatch):
+    ws = _Worksheet()
+
+    async def fake_aget(sheet_id, tab_name, **_kwargs):
+        return ws
+
+    async def fake_acall(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(write_behind.async_core, "aget_worksheet", fake_aget)
+    monkeypatch.setattr(write_behind.async_core, "acall_with_backoff", fake_acall)
+    return ws
+
+
+def test_coalesce_cells_builds_rectangles() -> None:
+    cells = {
+        (2, 0): "a",
+        (2, 1): "b",
+        (3, 0): "c",
+        (3, 1): "d",
+        (3, 5): "x",
+    }
+
+    assert write_behind.coalesce_cells(cells) == [
+        ("A3:B4", [["a", "b"], ["c", "d"]]),
+        ("F4", [["x"]]),
+    ]
+
+
+def test_burst_of_writes_flushes_once_with_last_write_winning(worksheet) -> None:
+    queue = write_behind.WriteBehindQueue(window_sec=0.01)
+
+    async def runner() -> None:
+        await asyncio.gather(
+            queue.write("sheet", "Reservations", "G2", [["2025-01-01"]]),
+            queue.write("sheet", "Reservations", "G2", [["2025-02-01"]]),
+            queue.write("sheet", "Reservations", "H5", [["active"]]),
+        )
+
+    asyncio.run(runner())
+
+    assert worksheet.updates == []
+    assert worksheet.batches == [
+        (
+            [
+                {"range": "G2", "values": [["2025-02-01"]]},
+                {"range": "H5", "values": [["active"]]},
+            ],
+            {"value_input_option": "RAW"},
+        )
+    ]
+    assert queue.flushes == 1
+    assert queue.writes == 3
+
+
+def test_single_range_uses_plain_update(worksheet) -> None:
+    queue = write_behind.WriteBehindQueue(window_sec=0.0)
+
+    asyncio.run(queue.write("sheet", "bot_info", "AF7:AI7", [[2, "", 1, "1 -> A"]]))
+
+    assert worksheet.updates == [
+        ("AF7:AI7", [[2, "", 1, "1 -> A"]], {"value_input_option": "RAW"})
+    ]
+
+
+def test_flush_all_drains_pending_writes(worksheet) -> None:
+    queue = write_behind.WriteBehindQueue(window_sec=60)
+
+    async def runner() -> None:
+        pending = queue.submit("sheet", "Shards", "A3:B3", [["1", "x"]])
+        assert queue.pending_count() == 1
+        await queue.flush_all()
+        assert pending.done()
+
+    asyncio.run(runner())
+
+    assert worksheet.updates == [("A3:B3", [["1", "x"]], {"value_input_option": "RAW"})]
+
+
+def test_flush_failure_reaches_every_writer(monkeypatch) -> None:
+    async def broken_aget(sheet_id, tab_name, **_kwargs):
+        raise RuntimeError("quota")
+
+    monkeypatch.setattr(write_behind.async_core, "aget_worksheet", broken_aget)
+    queue = write_behind.WriteBehindQueue(window_sec=0.0)
+
+    async def runner():
+        return await asyncio.gather(
+            queue.write("sheet", "Tab", "A1", [["x"]]),
+            queue.write("sheet", "Tab", "B1", [["y"]]),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(runner())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_flush_all_waits_for_in_flight_write(monkeypatch) -> None:
+    release = asyncio.Event()
+    written: list[str] = []
+
+    class _SlowWorksheet:
+        def update(self, a1_range, values, **kwargs):
+            written.append(a1_range)
+
+    async def fake_aget(sheet_id, tab_name, **_kwargs):
+        return _SlowWorksheet()
+
+    async def slow_acall(func, *args, **kwargs):
+        await release.wait()
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(write_behind.async_core, "aget_worksheet", fake_aget)
+    monkeypatch.setattr(write_behind.async_core, "acall_with_backoff", slow_acall)
+    queue = write_behind.WriteBehindQueue(window_sec=0.0)
+
+    async def runner() -> None:
+        waiter = queue.submit("sheet", "Shards", "A3", [["1"]])
+        await asyncio.sleep(0)  # the window timer pops the batch and starts writing
+        await asyncio.sleep(0)
+        assert queue.pending_count() == 0
+        flushing = asyncio.create_task(queue.flush_all())
+        await asyncio.sleep(0)
+        assert not flushing.done()
+        release.set()
+        await flushing
+        assert waiter.done() and written == ["A3"]
+
+    asyncio.run(runner())
+
+
+def test_cancelled_flush_does_not_strand_writers(monkeypatch) -> None:
+    started = asyncio.Event()
+
+    async def fake_aget(sheet_id, tab_name, **_kwargs):
+        return _Worksheet()
+
+    async def hanging_acall(func, *args, **kwargs):
+        started.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(write_behind.async_core, "aget_worksheet", fake_aget)
+    monkeypatch.setattr(write_behind.async_core, "acall_with_backoff", hanging_acall)
+    queue = write_behind.WriteBehindQueue(window_sec=0.0)
+
+    async def runner() -> None:
+        writer = asyncio.create_task(queue.write("sheet", "Tab", "A1", [["x"]]))
+        await started.wait()
+        for timer in list(queue._timers):
+            timer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(writer, timeout=1)
+
+    asyncio.run(runner())
@@ -0,0 +1,57 @@
+import asyncio
+
+from modules.common.log_channel import LogChannelSink, pack_messages
+
+
+def test_pack_messages_fills_chunks_without_splitting_lines() -> None:
+    lines = ["a" * 900, "b" * 900, "c" * 300, "d" * 2500]
+    chunks = pack_messages(lines, limit=2000)
+
+    assert [len(chunk) for chunk in chunks] == [1801, 300, 2000]
+    assert chunks[0] == "a" * 900 + "\n" + "b" * 900
+    assert chunks[2].endswith("…")
+
+
+def test_sink_batches_within_window_and_reports_overflow() -> None:
+    async def runner() -> None:
+        sent: list[str] = []
+
+        async def send(content: str) -> None:
+            sent.append(content)
+
+        sink = LogChannelSink(send, window=0.02, max_pending=3)
+        results = [sink.submit(f"line {index}") for index in range(5)]
+        assert results == [True, True, True, False, False]
+
+        await asyncio.sleep(0.05)
+        assert sent == ["⚠️ 2 log message(s) dropped (log channel backlog)\nline 0\nline 1\nline 2"]
+
+        sink.submit("late")
+        await sink.flush()
+        assert sent[-1] == "late"
+        assert sink.stats() == {"lines": 5, "messages": 2, "overflow": 2, "failures": 0, "dropped": 0, "pending": 0}
+
+    asyncio.run(runner())
+
+
+def test_flush_timeout_and_discard_drop_pending_lines() -> None:
+    async def runner() -> None:
+        never = asyncio.Event()
+
+        async def send(content: str) -> None:
+            await never.wait()
+
+        sink = LogChannelSink(send, window=0.0)
+        sink.submit("queued before ready")
+        await asyncio.sleep(0)
+        sink.submit("next")
+        assert await sink.flush(timeout=0.01) is False
+        assert sink.stats()["pending"] == 0
+        assert sink.stats()["dropped"] == 1
+
+        sink.submit("after close")
+        assert sink.discard() == 1
+        await asyncio.sleep(0)
+        assert sink.stats()["dropped"] == 2
+
+    asyncio.run(runner())
@@ -0,0 +1,56 @@
+import logging
+import queue
+import threading
+
+from shared.logging import config as logging_config
+from shared.logging.structured import JsonFormatter, set_trace_id
+
+
+class _ThreadRecorder(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.seen: list[tuple[str, str, str]] = []
+        self.done = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.seen.append((threading.current_thread().name, record.getMessage(), record.trace))
+        self.done.set()
+
+
+def test_records_are_formatted_on_the_listener_thread() -> None:
+    logger = logging.getLogger("c1c.test.queue_logging")
+    logger.propagate = False
+    logger.handlers.clear()
+    recorder = _ThreadRecorder()
+    logging_config._ensure_listener()
+    logging_config._install_target("queue_test", recorder)
+    try:
+        logging_config._route_through_queue(logger, JsonFormatter(), sink="queue_test")
+        set_trace_id("trace-123")
+        logger.warning("hello %s", "world")
+        assert recorder.done.wait(2)
+    finally:
+        logger.handlers.clear()
+        logging_config._TARGETS.pop("queue_test", None)
+        if logging_config._LISTENER is not None:
+            logging_config._LISTENER.handlers = tuple(logging_config._TARGETS.values())
+
+    thread_name, message, trace = recorder.seen[0]
+    assert thread_name != threading.current_thread().name
+    assert message == "hello world"
+    assert trace == "trace-123"
+
+
+def test_full_queue_drops_low_priority_records() -> None:
+    handler = logging_config._AsyncQueueHandler(queue.Queue(maxsize=1), sink="root", block=False)
+    before = logging_config.logging_stats()["dropped"]
+
+    def record(level: int) -> logging.LogRecord:
+        return logging.LogRecord("c1c.test", level, __file__, 1, "msg", None, None)
+
+    handler.enqueue(record(logging.INFO))
+    handler.enqueue(record(logging.INFO))
+    handler.enqueue(record(logging.DEBUG))
+
+    assert logging_config.logging_stats()["dropped"] - before == 2
+    assert handler.queue.qsize() == 1
@@ -42,9 +42,10 @@ def test_load_clan_tags_async_reads_column_b(monkeypatch) -> None:
         ["no placement", "NONE"],
     ]
 
-    async def fake_afetch(sheet_id: str, tab: str):  # type: ignore[no-untyped-def]
+    async def fake_afetch(sheet_id: str, tab: str, **kwargs):  # type: ignore[no-untyped-def]
         assert sheet_id == "sheet-id"
         assert tab == "ClanList"
+        assert kwargs.get("batched") is True
         return sample_values
 
     async def runner() -> None:
@@ -20,9 +20,11 @@ def test_scheduler_job_exception_does_not_cancel(
         scheduler = runtime.Scheduler()
 
         attempt = {"count": 0}
+        ticked = asyncio.Event()
 
         async def maybe_fail() -> None:
             attempt["count"] += 1
+            ticked.set()
             if attempt["count"] == 1:
                 raise RuntimeError("boom")
 
@@ -36,10 +38,127 @@ def test_scheduler_job_exception_does_not_cancel(
 
         scheduler.every(seconds=1, name="test_job", tag="test").do(maybe_fail)
 
-        await asyncio.sleep(0.05)
+        await _until(lambda: attempt["count"] >= 2, ticked)
         await scheduler.shutdown()
 
         assert attempt["count"] >= 2
         assert any("recurring job error" in record.getMessage() for record in caplog.records)
 
     asyncio.run(runner())
+
+
+def _fast_ticks(monkeypatch: pytest.MonkeyPatch, every_ms: int) -> None:
+    def fast_next_run(self, reference=None):
+        now = reference or runtime.datetime.now(runtime.timezone.utc)
+        return now + runtime.timedelta(milliseconds=every_ms)
+
+    monkeypatch.setattr(runtime._RecurringJob, "_compute_next_run", fast_next_run)
+
+
+def _never_due(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the timer idle so the test fires ticks by hand."""
+
+    def far_next_run(self, reference=None):
+        now = reference or runtime.datetime.now(runtime.timezone.utc)
+        return now + runtime.timedelta(days=1)
+
+    monkeypatch.setattr(runtime._RecurringJob, "_compute_next_run", far_next_run)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _until(predicate, ticked: asyncio.Event) -> None:
+    while not predicate():
+        ticked.clear()
+        await asyncio.wait_for(ticked.wait(), timeout=5)
+
+
+@pytest.mark.parametrize("overlap", ["skip", "queue", "cancel"])
+def test_scheduler_overlap_policies(monkeypatch: pytest.MonkeyPatch, overlap: str) -> None:
+    async def runner() -> None:
+        _never_due(monkeypatch)
+        scheduler = runtime.Scheduler()
+        release = asyncio.Event()
+        active = {"now": 0, "peak": 0, "finished": 0}
+
+        async def slow() -> None:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            try:
+                await release.wait()
+                active["finished"] += 1
+            finally:
+                active["now"] -= 1
+
+        job = scheduler.every(seconds=1, name="slow_job", overlap=overlap)
+        job.do(slow)
+        tick = runtime.datetime.now(runtime.timezone.utc)
+        for _ in range(3):
+            job._fire(tick)
+            await _settle()
+
+        assert active["now"] == 1
+        release.set()
+        while job._running is not None and not job._running.done():
+            await job._running
+        await scheduler.shutdown()
+
+        stats = scheduler.job_stats()["slow_job"]
+        assert active["peak"] == 1
+        if overlap == "skip":
+            assert stats["skipped"] == 2
+            assert active["finished"] == 1
+        elif overlap == "queue":
+            # One tick waits for the current run; the next one is dropped.
+            assert stats["skipped"] == 1
+            assert active["finished"] == 2
+        else:
+            assert stats["cancelled"] == 2
+            assert active["finished"] == 1
+        assert stats["runs"] == active["finished"] + stats["cancelled"]
+
+    asyncio.run(runner())
+
+
+def test_scheduler_uses_one_timer_and_records_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def runner() -> None:
+        _fast_ticks(monkeypatch, 5)
+        scheduler = runtime.Scheduler()
+        calls: list[str] = []
+        ticked = asyncio.Event()
+
+        async def make(name: str):
+            calls.append(name)
+            ticked.set()
+
+        handles = [
+            scheduler.every(seconds=1, name=f"job_{index}").do(lambda index=index: make(str(index)))
+            for index in range(5)
+        ]
+        job_tasks = [task for task in asyncio.all_tasks() if task.get_name().startswith("scheduler_timer")]
+        assert len(job_tasks) == 1
+
+        await _until(lambda: calls.count("0") >= 1 and calls.count("1") >= 2, ticked)
+        handles[0].cancel()
+        await _settle()
+        before = calls.count("0")
+        target = calls.count("1") + 2
+        await _until(lambda: calls.count("1") >= target, ticked)
+        assert calls.count("0") == before
+        await scheduler.shutdown()
+
+        stats = scheduler.job_stats()
+        assert stats["job_1"]["runs"] >= 2
+        assert stats["job_1"]["last_outcome"] == "ok"
+        assert stats["job_1"]["max_lag_ms"] >= 0
+        assert all(handle.done() for handle in handles)
+
+    asyncio.run(runner())
+
+
+def test_scheduled_job_requires_next_run_policy() -> None:
+    with pytest.raises(TypeError):
+        runtime._ScheduledJob(runtime.Scheduler())
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from shared.sheets import async_adapter
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+class _FakeWorksheet:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def get_all_values(self):
+        self.calls.append("read")
+        return [["a"]]
+
+    def update(self, a1_range, values):
+        self.calls.append("write")
+        return {"updatedRange": a1_range}
+
+
+@pytest.fixture(autouse=True)
+def _reset_limits():
+    yield
+    async_adapter.configure_rate_limits()
+
+
+def test_token_bucket_waits_once_budget_is_spent() -> None:
+    clock = _FakeClock()
+    bucket = async_adapter.TokenBucket(60, burst=2, clock=clock, sleep=clock.sleep)
+
+    async def runner() -> None:
+        for _ in range(3):
+            await bucket.acquire()
+
+    asyncio.run(runner())
+
+    assert clock.sleeps == [pytest.approx(1.0)]
+    assert bucket.throttled == 1
+
+
+def test_background_lane_cannot_spend_interactive_reserve() -> None:
+    clock = _FakeClock()
+    bucket = async_adapter.TokenBucket(
+        60, burst=4, reserve=0.5, clock=clock, sleep=clock.sleep
+    )
+
+    assert bucket.try_acquire(lane=async_adapter.LANE_BACKGROUND) == 0.0
+    assert bucket.try_acquire(lane=async_adapter.LANE_BACKGROUND) == 0.0
+    assert bucket.try_acquire(lane=async_adapter.LANE_BACKGROUND) > 0.0
+    assert bucket.try_acquire(lane=async_adapter.LANE_INTERACTIVE) == 0.0
+    assert bucket.try_acquire(lane=async_adapter.LANE_INTERACTIVE) == 0.0
+
+
+def test_writes_use_their_own_budget() -> None:
+    clock = _FakeClock()
+    async_adapter.configure_rate_limits(
+        reads_per_minute=6000,
+        writes_per_minute=60,
+        interactive_reserve=0,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    worksheet = _FakeWorksheet()
+
+    async def runner() -> None:
+        for _ in range(20):
+            await async_adapter.aworksheet_values_all(worksheet)
+        for _ in range(16):
+            await async_adapter.aworksheet_values_update(worksheet, "A1", [["x"]])
+
+    asyncio.run(runner())
+
+    assert worksheet.calls.count("read") == 20
+    assert worksheet.calls.count("write") == 16
+    # 60/min leaves a burst of 15 writes; the 16th waits for one refill.
+    assert clock.sleeps == [pytest.approx(1.0)]
+    stats = async_adapter.limiter_stats()
+    assert stats["reads_throttled"] == 0
+    assert stats["writes_throttled"] == 1
+
+
+def test_interactive_calls_overtake_queued_background_work() -> None:
+    async_adapter.configure_rate_limits(reads_per_minute=0, writes_per_minute=0)
+    slots = async_adapter._LaneSlots(1)
+    order: list[str] = []
+
+    async def worker(name: str, lane: str) -> None:
+        await slots.acquire(lane)
+        order.append(name)
+        await asyncio.sleep(0)
+        slots.release()
+
+    async def runner() -> None:
+        await slots.acquire(async_adapter.LANE_INTERACTIVE)
+        tasks = [
+            asyncio.create_task(worker("bulk", async_adapter.LANE_BULK)),
+            asyncio.create_task(worker("background", async_adapter.LANE_BACKGROUND)),
+            asyncio.create_task(worker("interactive", async_adapter.LANE_INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        slots.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(runner())
+
+    assert order == ["interactive", "background", "bulk"]
+
+
+def test_lane_context_is_scoped() -> None:
+    assert async_adapter.current_lane() == async_adapter.LANE_INTERACTIVE
+    with async_adapter.lane(async_adapter.LANE_BACKGROUND):
+        assert async_adapter.current_lane() == async_adapter.LANE_BACKGROUND
+    assert async_adapter.current_lane() == async_adapter.LANE_INTERACTIVE
+    with pytest.raises(ValueError):
+        with async_adapter.lane("nope"):
+            pass